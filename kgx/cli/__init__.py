@@ -245,6 +245,14 @@ def validate_wrapper(
     "--output-compression", "-d", required=False, help="The output compression type"
 )
 @click.option("--stream", "-s", is_flag=True, help="Parse input as a stream")
+@click.option(
+    "--workers",
+    "-w",
+    required=False,
+    type=int,
+    default=1,
+    help="Number of pages to fetch concurrently",
+)
 @click.option(
     "--node-filters",
     "-n",
@@ -269,6 +277,7 @@ def neo4j_download_wrapper(
     output_format: str,
     output_compression: str,
     stream: bool,
+    workers: int,
     node_filters: Tuple,
     edge_filters: Tuple,
 ):
@@ -292,6 +301,8 @@ def neo4j_download_wrapper(
         The output compression type
     stream: bool
         Whether to parse input as a stream
+    workers: int
+        Number of pages to fetch concurrently
     node_filters: Tuple[str, str]
         Node filters
     edge_filters: Tuple[str, str]
@@ -309,6 +320,7 @@ def neo4j_download_wrapper(
             stream,
             node_filters,
             edge_filters,
+            workers,
         )
         exit(0)
     except Exception as nde:
@@ -332,11 +344,19 @@ def neo4j_download_wrapper(
     "-l",
     required=True,
     type=str,
-    help="Neo4j URI to upload to. For example, https://localhost:7474",
+    help="Neo4j URI to upload to. For example, https://localhost:7474 or bolt://localhost:7687",
 )
 @click.option("--username", "-u", required=True, type=str, help="Neo4j username")
 @click.option("--password", "-p", required=True, type=str, help="Neo4j password")
 @click.option("--stream", "-s", is_flag=True, help="Parse input as a stream")
+@click.option(
+    "--workers",
+    "-w",
+    required=False,
+    type=int,
+    default=1,
+    help="Number of batches to write concurrently, over Bolt",
+)
 @click.option(
     "--node-filters",
     "-n",
@@ -361,6 +381,7 @@ def neo4j_upload_wrapper(
     username: str,
     password: str,
     stream: bool,
+    workers: int,
     node_filters: Tuple[str, str],
     edge_filters: Tuple[str, str],
 ):
@@ -384,6 +405,8 @@ def neo4j_upload_wrapper(
         Password for authentication
     stream: bool
         Whether to parse input as a stream
+    workers: int
+        Number of batches to write concurrently, over Bolt
     node_filters: Tuple[str, str]
         Node filters
     edge_filters: Tuple[str, str]
@@ -401,6 +424,7 @@ def neo4j_upload_wrapper(
             stream,
             node_filters,
             edge_filters,
+            workers,
         )
         exit(0)
     except Exception as nue:
@@ -426,7 +450,7 @@ def neo4j_upload_wrapper(
     "--output-format",
     "-f",
     required=False,
-    help=f"The output format. Can be one of {get_input_file_types()}",
+    help=f"The output format. Can be one of {get_input_file_types() + ('neo4j-import',)}",
 )
 @click.option(
     "--output-compression", "-d", required=False, help="The output compression type"
@@ -480,6 +504,18 @@ def neo4j_upload_wrapper(
     default=1,
     help="Number of processes to use",
 )
+@click.option(
+    "--chunksize",
+    required=False,
+    type=int,
+    help="Number of rows per chunk when reading TSV/CSV",
+)
+@click.option(
+    "--engine",
+    required=False,
+    type=click.Choice(["c", "pyarrow"]),
+    help="The TSV/CSV parser engine",
+)
 def transform_wrapper(
     inputs: List[str],
     input_format: str,
@@ -495,6 +531,8 @@ def transform_wrapper(
     knowledge_sources: Optional[List[Tuple[str, str]]],
     processes: int,
     infores_catalog: Optional[str] = None,
+    chunksize: Optional[int] = None,
+    engine: Optional[str] = None,
 ):
     """
     Transform a Knowledge Graph from one serialization form to another.
@@ -530,6 +568,10 @@ def transform_wrapper(
         Optional dump of a TSV file of InfoRes CURIE to Knowledge Source mappings
     processes: int
         Number of processes to use
+    chunksize: Optional[int]
+        Number of rows per chunk when reading TSV/CSV
+    engine: Optional[str]
+        The TSV/CSV parser engine (``c``, by default, or ``pyarrow``)
 
     """
     try:
@@ -548,6 +590,8 @@ def transform_wrapper(
             knowledge_sources=knowledge_sources,
             processes=processes,
             infores_catalog=infores_catalog,
+            chunksize=chunksize,
+            engine=engine,
         )
         exit(0)
     except Exception as te:
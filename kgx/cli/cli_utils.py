@@ -23,6 +23,19 @@ summary_report_types = {
     "meta-knowledge-graph": meta_knowledge_graph.MetaKnowledgeGraph,
 }
 
+# Optional arguments of a neo4j output, which are passed on to NeoSink
+NEO4J_OUTPUT_ARGS = [
+    "workers",
+    "batch_size",
+    "max_retries",
+    "database",
+    "cache_memory",
+    "cache_size",
+]
+
+# Optional arguments of a neo4j-import output, which are passed on to NeoImportSink
+NEO4J_IMPORT_OUTPUT_ARGS = ["database", "neo4j_admin", "run_import"]
+
 log = get_logger()
 
 
@@ -264,6 +277,7 @@ def neo4j_download(
     stream: bool,
     node_filters: Optional[Tuple] = None,
     edge_filters: Optional[Tuple] = None,
+    workers: int = 1,
 ) -> Transformer:
     """
     Download nodes and edges from Neo4j database.
@@ -288,6 +302,8 @@ def neo4j_download(
         Node filters
     edge_filters: Optional[Tuple]
         Edge filters
+    workers: int
+        Number of pages to fetch concurrently
 
     Returns
     -------
@@ -304,6 +320,7 @@ def neo4j_download(
             "format": "neo4j",
             "node_filters": node_filters,
             "edge_filters": edge_filters,
+            "workers": workers,
         }
     )
 
@@ -325,6 +342,7 @@ def neo4j_upload(
     stream: bool,
     node_filters: Optional[Tuple] = None,
     edge_filters: Optional[Tuple] = None,
+    workers: int = 1,
 ) -> Transformer:
     """
     Upload a set of nodes/edges to a Neo4j database.
@@ -338,7 +356,7 @@ def neo4j_upload(
     input_compression: Optional[str]
         The input compression type
     uri: str
-        The full HTTP address for Neo4j database
+        The full HTTP or Bolt address for Neo4j database
     username: str
         Username for authentication
     password: str
@@ -349,6 +367,8 @@ def neo4j_upload(
         Node filters
     edge_filters: Optional[Tuple]
         Edge filters
+    workers: int
+        Number of batches to write concurrently, over Bolt
 
     Returns
     -------
@@ -367,7 +387,13 @@ def neo4j_upload(
         }
     )
     transformer.save(
-        {"uri": uri, "username": username, "password": password, "format": "neo4j"}
+        {
+            "uri": uri,
+            "username": username,
+            "password": password,
+            "format": "neo4j",
+            "workers": workers,
+        }
     )
     return transformer
 
@@ -439,6 +465,8 @@ def transform(
     # destination: Optional[List] = None,
     processes: int = 1,
     infores_catalog: Optional[str] = None,
+    chunksize: Optional[int] = None,
+    engine: Optional[str] = None,
 ) -> None:
     """
     Transform a Knowledge Graph from one serialization form to another.
@@ -470,10 +498,15 @@ def transform(
     knowledge_sources: Optional[List[Tuple[str, str]]]
         A list of named knowledge sources with (string, boolean or tuple rewrite) specification
     processes: int
-        Number of processes to use
+        Number of processes to use. Sources from a transform config YAML are
+        processed in parallel, otherwise the input files are parsed in parallel
     infores_catalog: Optional[str]
         Optional dump of a TSV file of InfoRes CURIE to
         Knowledge Source mappings (not yet available in transform_config calling mode)
+    chunksize: Optional[int]
+        Number of rows per chunk when reading TSV/CSV
+    engine: Optional[str]
+        The TSV/CSV parser engine (``c``, by default, or ``pyarrow``)
 
     """
     if transform_config and inputs:
@@ -553,6 +586,8 @@ def transform(
                     "node_filters": node_filters,
                     "edge_filters": edge_filters,
                 },
+                "chunksize": chunksize,
+                "engine": engine,
             },
             "output": {
                 "format": output_format,
@@ -588,6 +623,7 @@ def transform(
             output_directory=None,
             stream=stream,
             infores_catalog=infores_catalog,
+            processes=processes,
         )
 
 
@@ -727,7 +763,13 @@ def merge(
                 output_args["uri"] = destination_info["uri"]
                 output_args["username"] = destination_info["username"]
                 output_args["password"] = destination_info["password"]
-            elif destination_info["format"] in get_input_file_types():
+                for arg in NEO4J_OUTPUT_ARGS:
+                    if arg in destination_info:
+                        output_args[arg] = destination_info[arg]
+            elif (
+                destination_info["format"] in get_input_file_types()
+                or destination_info["format"] == "neo4j-import"
+            ):
                 filename = destination_info["filename"]
                 if isinstance(filename, list):
                     filename = filename[0]
@@ -742,9 +784,13 @@ def merge(
                     output_args['property_types'] = top_level_args['property_types']
                     if 'property_types' in top_level_args and 'property_types' in destination_info.keys():
                         output_args['property_types'].update(destination_info['property_types'])
-                if destination_info['format'] in {'csv', 'tsv'}:
+                if destination_info['format'] in {'csv', 'tsv', 'neo4j-import'}:
                     output_args['node_properties'] = node_properties
                     output_args['edge_properties'] = edge_properties
+                if destination_info['format'] == 'neo4j-import':
+                    for arg in NEO4J_IMPORT_OUTPUT_ARGS:
+                        if arg in destination_info:
+                            output_args[arg] = destination_info[arg]
             else:
                 raise TypeError(
                     f"type {destination_info['format']} not yet supported for KGX merge operation."
@@ -833,6 +879,7 @@ def transform_source(
     preserve_graph: bool = True,
     stream: bool = False,
     infores_catalog: Optional[str] = None,
+    processes: int = 1,
 ) -> Sink:
     """
     Transform a source from a transform config YAML.
@@ -866,6 +913,8 @@ def transform_source(
         Whether to parse input as a stream
     infores_catalog: Optional[str]
         Optional dump of a TSV file of InfoRes CURIE to Knowledge Source mappings
+    processes: int
+        Number of processes to use for parsing the input files of the source
 
     Returns
     -------
@@ -890,7 +939,9 @@ def transform_source(
         reverse_predicate_mappings,
         property_types,
     )
-    transformer = Transformer(stream=stream, infores_catalog=infores_catalog)
+    transformer = Transformer(
+        stream=stream, infores_catalog=infores_catalog, processes=processes
+    )
     transformer.transform(input_args, output_args)
 
     if not preserve_graph:
@@ -983,6 +1034,9 @@ def prepare_input_args(
             "predicate_mappings": source_predicate_mappings,
             "node_property_predicates": source_node_property_predicates,
         }
+        for k in ["workers", "cache_memory", "cache_dir"]:
+            if source["input"].get(k):
+                input_args[k] = source["input"][k]
     elif input_format in get_input_file_types():
         input_args = {
             "filename": inputs,
@@ -992,6 +1046,17 @@ def prepare_input_args(
             "edge_filters": edge_filters,
             "prefix_map": source_prefix_map,
         }
+        for k in [
+            "chunksize",
+            "engine",
+            "low_memory",
+            "cache_memory",
+            "cache_dir",
+            "workers",
+            "import_cache_dir",
+        ]:
+            if source["input"].get(k):
+                input_args[k] = source["input"][k]
     elif input_format == "neo4j":
         input_args = {
             "uri": source["uri"],
@@ -1090,9 +1155,16 @@ def prepare_output_args(
         output_args["uri"] = source["output"]["uri"]
         output_args["username"] = source["output"]["username"]
         output_args["password"] = source["output"]["password"]
-    elif output_format in get_input_file_types():
+        for key in NEO4J_OUTPUT_ARGS:
+            if key in source["output"]:
+                output_args[key] = source["output"][key]
+    elif output_format in get_input_file_types() or output_format == "neo4j-import":
         output_args["filename"] = output
         output_args["compression"] = output_compression
+        if output_format == "neo4j-import":
+            for key in NEO4J_IMPORT_OUTPUT_ARGS:
+                if key in source["output"]:
+                    output_args[key] = source["output"][key]
         if output_format == "nt":
             output_args["reify_all_edges"] = (
                 source["output"]["reify_all_edges"]
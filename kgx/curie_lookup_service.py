@@ -2,6 +2,7 @@ import networkx as nx
 import rdflib
 from kgx.config import get_logger, get_config
 from kgx.utils.kgx_utils import generate_edge_key, contract
+from kgx.utils.rdf_utils import get_ontology_cache_dir, load_ontologies
 
 CURIE_MAP = {"BFO:0000054": "realized_in", "RO:0000091": "has_disposition"}
 
@@ -30,21 +31,13 @@ class CurieLookupService(object):
         """
         Load all required ontologies.
         """
-        for ontology in self.ontologies.values():
-            rdfgraph = rdflib.Graph()
-            input_format = rdflib.util.guess_format(ontology)
-            rdfgraph.parse(ontology, format=input_format)
-            # triples = rdfgraph.triples((None, rdflib.RDFS.subClassOf, None))
-            # for s,p,o in triples:
-            #     subject_curie = contract(s)
-            #     object_curie = contract(o)
-            #     self.ontology_graph.add_node(subject_curie)
-            #     self.ontology_graph.add_node(object_curie)
-            #     key = generate_edge_key(subject_curie, 'subclass_of', object_curie)
-            #     self.ontology_graph.add_edge(subject_curie, object_curie, key, **{'predicate': 'subclass_of', 'relation': 'rdfs:subClassOf'})
-
-            triples = rdfgraph.triples((None, rdflib.RDFS.label, None))
+        ontologies = list(self.ontologies.values())
+        for _, triples in load_ontologies(
+            ontologies, workers=len(ontologies), cache_dir=get_ontology_cache_dir()
+        ):
             for s, p, o in triples:
+                if p != rdflib.RDFS.label:
+                    continue
                 key = contract(s)
                 value = o.value
                 value = value.replace(" ", "_")
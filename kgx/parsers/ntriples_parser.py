@@ -1,8 +1,20 @@
 import codecs
-from typing import Generator
+import os
+import re
+from typing import Generator, Dict, IO, List, Optional, Tuple
 
-from rdflib.plugins.parsers.ntriples import NTriplesParser, ParseError
-from rdflib.plugins.parsers.ntriples import r_wspace, r_wspaces, r_tail
+from rdflib import BNode, Literal, URIRef
+from rdflib.plugins.parsers.ntriples import NTriplesParser, ParseError, unquote
+from rdflib.plugins.parsers.ntriples import r_wspace, r_wspaces, r_tail, r_nodeid
+
+# Number of bytes of N-Triples that are read and decoded at a time
+BLOCK_SIZE = 1 << 22
+
+# Number of object terms that are cached before the cache is cleared
+TERM_CACHE_SIZE = 1 << 16
+
+# Characters for which rdflib warns that an IRI is invalid
+r_invalid_iri = re.compile(r'[<>" {}|\\^`]')
 
 
 class CustomNTriplesParser(NTriplesParser):
@@ -38,11 +50,6 @@ class CustomNTriplesParser(NTriplesParser):
             self.line = self.readline()
             if self.line is None:
                 break
-            if self.line == "":
-                raise ParseError(f"Empty line encountered in {filename}. "
-                                 f"Ensure that no leading or trailing empty lines persist "
-                                 f"in the N-Triples file.")
-                break
             try:
                 yield from self.parseline()
             except ParseError:
@@ -58,18 +65,347 @@ class CustomNTriplesParser(NTriplesParser):
             A generator
 
         """
-        print(self.line)
         self.eat(r_wspace)
-        if self.line or not self.line.startswith("#"):
-            subject = self.subject()
-            self.eat(r_wspaces)
+        if not self.line or self.line.startswith("#"):
+            # the line is empty or a comment
+            return
+        subject = self.subject()
+        self.eat(r_wspaces)
+
+        predicate = self.predicate()
+        self.eat(r_wspaces)
+
+        object = self.object()
+        self.eat(r_tail)
+
+        if self.line:
+            raise ParseError("Trailing garbage")
+        yield from self.sink.triple(subject, predicate, object)
+
+
+class FastNTriplesParser(CustomNTriplesParser):
+    """
+    This class is an extension to ``CustomNTriplesParser`` that parses
+    N-Triples in large blocks of bytes, and yields triples.
+
+    Each block is decoded as a whole and split into lines. Lines in the
+    common forms are split into terms with string operations, and other
+    lines are parsed by ``CustomNTriplesParser``, which also reports
+    invalid lines. Terms for subjects, predicates and objects are reused
+    when they repeat, as they do for subject-sorted N-Triples.
+
+    Parameters
+    ----------
+    sink: Any
+        The sink, with a ``triple`` method that returns a generator
+    block_size: int
+        Number of bytes to read at a time
+    bnode_prefix: Optional[str]
+        A prefix for the identifiers of blank nodes, which are then derived
+        from their labels, such that separate parts of a document can be
+        parsed separately. By default, blank nodes get new identifiers.
+
+    """
+
+    def __init__(
+        self,
+        sink=None,
+        block_size: int = BLOCK_SIZE,
+        bnode_prefix: Optional[str] = None,
+    ):
+        super().__init__(sink)
+        self.block_size = block_size
+        self.bnode_prefix = bnode_prefix
+        self.iris: Dict[str, URIRef] = {}
+        self.objects: Dict[str, object] = {}
+        # shared with the rdflib parser, which maps labels to BNodes
+        self._bnode_ids: Dict[str, BNode] = {}
+
+    def parse(self, filename: IO[bytes]) -> Generator:
+        """
+        Parses an N-Triples file and yields triples.
+
+        Parameters
+        ----------
+        filename: IO[bytes]
+            The binary file object to parse
+
+        Returns
+        -------
+        Generator
+            A generator for triples
+
+        """
+        if not hasattr(filename, "read"):
+            raise ParseError("Item to parse must be a file-like object.")
+        triple = self.sink.triple
+        rest = b""
+        while True:
+            block = filename.read(self.block_size)
+            data = rest + block if rest else block
+            if block:
+                # split after the last complete line, which is never within a character
+                end = max(data.rfind(b"\n"), data.rfind(b"\r")) + 1
+                if not end:
+                    rest = data
+                    continue
+                rest = data[end:]
+                data = data[:end]
+            if data:
+                text = data.decode("utf-8")
+                if "\r" in text:
+                    text = text.replace("\r\n", "\n").replace("\r", "\n")
+                subject = None
+                s = None
+                for line in text.split("\n"):
+                    line = line.strip(" \t")
+                    if not line or line[0] == "#":
+                        continue
+                    terms = None
+                    if line[-1] == ".":
+                        parts = line[:-1].split(None, 2)
+                        if len(parts) == 3:
+                            if parts[0] == subject:
+                                terms = self._terms(s, parts[1], parts[2].rstrip())
+                            else:
+                                s = self._subject(parts[0])
+                                if s is not None:
+                                    subject = parts[0]
+                                    terms = self._terms(s, parts[1], parts[2].rstrip())
+                    if terms is None:
+                        self.line = line
+                        try:
+                            yield from self.parseline()
+                        except ParseError:
+                            raise ParseError("Invalid line: %r" % line)
+                    else:
+                        yield from triple(*terms)
+            if not block:
+                break
+
+    def _terms(self, s, p: str, o: str) -> Optional[Tuple]:
+        """
+        Get the terms of a triple, given the subject term and the
+        predicate and object tokens.
+
+        Parameters
+        ----------
+        s: Union[URIRef, BNode]
+            The subject term
+        p: str
+            The predicate token
+        o: str
+            The object token
+
+        Returns
+        -------
+        Optional[Tuple]
+            The terms, or ``None`` if a token is not in a common form
+
+        """
+        predicate = self.iris.get(p)
+        if predicate is None:
+            predicate = self._iri(p)
+            if predicate is None:
+                return None
+            self.iris[p] = predicate
+        obj = self.objects.get(o)
+        if obj is None:
+            obj = self._object(o)
+            if obj is None:
+                return None
+            if len(self.objects) >= TERM_CACHE_SIZE:
+                self.objects.clear()
+            self.objects[o] = obj
+        return s, predicate, obj
+
+    def _subject(self, token: str):
+        """
+        Get the term for a subject token.
+
+        Parameters
+        ----------
+        token: str
+            The token
 
-            predicate = self.predicate()
-            self.eat(r_wspaces)
+        Returns
+        -------
+        Optional[Union[URIRef, BNode]]
+            The term, or ``None`` if the token is not in a common form
+
+        """
+        if token[0] == "<":
+            return self._iri(token)
+        return self._bnode(token)
+
+    def _object(self, token: str):
+        """
+        Get the term for an object token.
+
+        Parameters
+        ----------
+        token: str
+            The token
+
+        Returns
+        -------
+        Optional[Union[URIRef, BNode, Literal]]
+            The term, or ``None`` if the token is not in a common form
 
-            object = self.object()
-            self.eat(r_tail)
+        """
+        first = token[0]
+        if first == "<":
+            return self._iri(token)
+        if first == "_":
+            return self._bnode(token)
+        if first != '"':
+            return None
+        end = token.rfind('"')
+        lexical = token[1:end]
+        if not end:
+            return None
+        if '"' in lexical and (
+            "\\\\" in lexical or lexical.count('"') != lexical.count('\\"')
+        ):
+            # unescaped quotes, or quotes that may follow escaped backslashes
+            return None
+        if "\\" in lexical:
+            lexical = unquote(lexical)
+        suffix = token[end + 1 :]
+        if not suffix:
+            return Literal(lexical)
+        if suffix[0] == "@":
+            return Literal(lexical, lang=suffix[1:])
+        if suffix[:2] == "^^":
+            datatype = self.iris.get(suffix[2:])
+            if datatype is None:
+                datatype = self._iri(suffix[2:])
+                if datatype is None:
+                    return None
+                self.iris[suffix[2:]] = datatype
+            return Literal(lexical, datatype=datatype)
+        return None
+
+    def _iri(self, token: str) -> Optional[URIRef]:
+        """
+        Get the term for an IRI token.
+
+        Parameters
+        ----------
+        token: str
+            The token
 
-            if self.line:
-                raise ParseError("Trailing garbage")
-            return self.sink.triple(subject, predicate, object)
+        Returns
+        -------
+        Optional[URIRef]
+            The term, or ``None`` if the token is not in a common form
+
+        """
+        if token[0] != "<" or token[-1] != ">" or ":" not in token:
+            return None
+        iri = token[1:-1]
+        if "\\" in iri:
+            iri = unquote(iri)
+        if r_invalid_iri.search(iri):
+            if "<" in iri or ">" in iri or '"' in iri:
+                return None
+            # rdflib warns of the invalid IRI
+            return URIRef(iri)
+        # the same as URIRef(iri), without checking each character in Python
+        return str.__new__(URIRef, iri)
+
+    def _bnode(self, token: str) -> Optional[BNode]:
+        """
+        Get the term for a blank node token, which is specific
+        to the document.
+
+        Parameters
+        ----------
+        token: str
+            The token
+
+        Returns
+        -------
+        Optional[BNode]
+            The term, or ``None`` if the token is not in a common form
+
+        """
+        if token[:2] != "_:" or len(token) < 3:
+            return None
+        bnode = self._bnode_ids.get(token[2:])
+        if bnode is None:
+            if self.bnode_prefix is None:
+                bnode = BNode()
+            else:
+                bnode = BNode(f"{self.bnode_prefix}{token[2:]}")
+            self._bnode_ids[token[2:]] = bnode
+        return bnode
+
+    def nodeid(self) -> Optional[BNode]:
+        """
+        Parse a blank node, in lines parsed by ``CustomNTriplesParser``.
+
+        Returns
+        -------
+        Optional[BNode]
+            The blank node, or ``False`` if the line does not start with one
+
+        """
+        if self.peek("_"):
+            return self._bnode(f"_:{self.eat(r_nodeid).group(1)}")
+        return False
+
+
+def split_ntriples(filename: str, shards: int) -> List[Tuple[int, int]]:
+    """
+    Split an N-Triples file into byte ranges of about the same size,
+    where each range starts at a line with a different subject than the
+    line before it.
+
+    For N-Triples sorted by subject, all the triples of a subject
+    are within one range.
+
+    Parameters
+    ----------
+    filename: str
+        The filename
+    shards: int
+        The number of ranges to split the file into
+
+    Returns
+    -------
+    List[Tuple[int, int]]
+        A list of start and end offsets, where some ranges
+        are merged if a subject spans them
+
+    """
+    size = os.path.getsize(filename)
+    offsets = [0]
+    with open(filename, "rb") as FH:
+        for i in range(1, shards):
+            position = size * i // shards
+            if position <= offsets[-1]:
+                continue
+            FH.seek(position - 1)
+            # skip to the start of the next line
+            FH.readline()
+            offset = size
+            previous = None
+            while True:
+                start = FH.tell()
+                line = FH.readline()
+                if not line:
+                    break
+                tokens = line.split(None, 1)
+                if not tokens or tokens[0].startswith(b"#"):
+                    continue
+                if previous is None:
+                    previous = tokens[0]
+                elif tokens[0] != previous:
+                    offset = start
+                    break
+            if offset > offsets[-1]:
+                offsets.append(offset)
+    if offsets[-1] < size:
+        offsets.append(size)
+    return list(zip(offsets, offsets[1:]))
@@ -9,6 +9,8 @@ from kgx.utils.kgx_utils import contract, expand
 
 log = get_logger()
 
+CURIE_PATTERN = re.compile(r"^[^ <()>:]*:[^/ :]+$")
+
 
 class PrefixManager(object):
     """
@@ -168,7 +170,7 @@ class PrefixManager(object):
 
         """
         if isinstance(s, str):
-            m = re.match(r"^[^ <()>:]*:[^/ :]+$", s)
+            m = CURIE_PATTERN.match(s)
             return bool(m)
         else:
             return False
@@ -3,6 +3,7 @@ from .tsv_sink import TsvSink
 from .json_sink import JsonSink
 from .jsonl_sink import JsonlSink
 from .neo_sink import NeoSink
+from .neo_import_sink import NeoImportSink
 from .rdf_sink import RdfSink
 from .graph_sink import GraphSink
 from .null_sink import NullSink
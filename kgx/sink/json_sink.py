@@ -1,10 +1,10 @@
-import gzip
-from typing import Any, Optional, Dict
-
-import jsonstreams
+import json
+from typing import Any, Optional, Dict, List
 
 from kgx.config import get_logger
 from kgx.sink import Sink
+from kgx.utils.archive_utils import open_output
+from kgx.utils.json_utils import dumps, JSONL_BLOCK_SIZE
 
 
 log = get_logger()
@@ -15,6 +15,9 @@ class JsonSink(Sink):
     JsonSink is responsible for writing data as records
     to a JSON.
 
+    Records are written compactly, one record per line, unless
+    ``pretty`` is set, in which case records are indented.
+
     Parameters
     ----------
     filename: str
@@ -22,9 +25,12 @@ class JsonSink(Sink):
     format: str
         The file format (``json``)
     compression: Optional[str]
-        The compression type (``gz``)
+        The compression type (``gz``, ``bz2``, ``xz``, ``zst``)
     kwargs: Any
-        Any additional arguments
+        Any additional arguments. ``pretty`` and ``indent`` set whether, and by
+        how many spaces, records are indented. ``compression_level`` sets the
+        compression level. ``buffer_size`` sets the number of bytes of serialized
+        records to buffer before writing to file.
 
     """
 
@@ -39,13 +45,18 @@ class JsonSink(Sink):
         self.filename = filename
         if compression:
             self.compression = compression
+            filename = f"{filename}.{compression}"
         else:
             self.compression = None
-        self.FH = jsonstreams.Stream(
-            jsonstreams.Type.object, filename=filename, pretty=True, indent=4
-        )
-        self.NH = None
-        self.EH = None
+        self.pretty = bool(kwargs.get("pretty", False))
+        self.indent = int(kwargs.get("indent", 4))
+        self.buffer_size = int(kwargs.get("buffer_size", JSONL_BLOCK_SIZE))
+        self.FH = open_output(filename, self.compression, kwargs.get("compression_level"))
+        self.buffer: List[bytes] = []
+        self.buffered = 0
+        self.arrays = 0
+        self.current: Optional[str] = None
+        self._write(b"{")
 
     def write_node(self, record: Dict) -> None:
         """
@@ -57,12 +68,7 @@ class JsonSink(Sink):
             A node record
 
         """
-        if self.EH:
-            self.EH.close()
-            self.EH = None
-        if not self.NH:
-            self.NH = self.FH.subarray("nodes")
-        self.NH.write(record)
+        self._write_records("nodes", [record])
 
     def write_edge(self, record: Dict) -> None:
         """
@@ -74,25 +80,109 @@ class JsonSink(Sink):
             An edge record
 
         """
-        if self.NH:
-            self.NH.close()
-            self.NH = None
-        if not self.EH:
-            self.EH = self.FH.subarray("edges")
-        self.EH.write(record)
+        self._write_records("edges", [record])
+
+    def write_nodes(self, records: List) -> None:
+        """
+        Write a batch of node records to JSON.
+
+        Parameters
+        ----------
+        records: List
+            A list of node records
+
+        """
+        self._write_records("nodes", records)
+
+    def write_edges(self, records: List) -> None:
+        """
+        Write a batch of edge records to JSON.
+
+        Parameters
+        ----------
+        records: List
+            A list of edge records
+
+        """
+        self._write_records("edges", records)
+
+    def _write_records(self, key: str, records: List) -> None:
+        """
+        Write records to the array of the given key, and start
+        the array if records were last written to another array.
+
+        Parameters
+        ----------
+        key: str
+            The key of the array (``nodes`` or ``edges``)
+        records: List
+            A list of records
+
+        """
+        if not records:
+            return
+        if self.pretty:
+            pad = " " * (self.indent * 2)
+            lines = [
+                pad + json.dumps(x, indent=self.indent).replace("\n", f"\n{pad}")
+                for x in records
+            ]
+            encoded = [x.encode("utf-8") for x in lines]
+        else:
+            encoded = [dumps(x) for x in records]
+        if key != self.current:
+            self._close_array()
+            if self.pretty:
+                start = f'{"," if self.arrays else ""}\n{" " * self.indent}"{key}": [\n'
+            else:
+                start = f'{"," if self.arrays else ""}"{key}":[\n'
+            self._write(start.encode("utf-8"))
+            self.arrays += 1
+            self.current = key
+        else:
+            self._write(b",\n")
+        self._write(b",\n".join(encoded))
+
+    def _close_array(self) -> None:
+        """
+        Close the current array, if any.
+        """
+        if self.current:
+            if self.pretty:
+                self._write(f'\n{" " * self.indent}]'.encode("utf-8"))
+            else:
+                self._write(b"\n]")
+            self.current = None
+
+    def _write(self, data: bytes) -> None:
+        """
+        Write data through the buffer.
+
+        Parameters
+        ----------
+        data: bytes
+            The data
+
+        """
+        self.buffer.append(data)
+        self.buffered += len(data)
+        if self.buffered >= self.buffer_size:
+            self._flush()
+
+    def _flush(self) -> None:
+        """
+        Write the buffered data to file.
+        """
+        if self.buffer:
+            self.FH.write(b"".join(self.buffer))
+        self.buffer = []
+        self.buffered = 0
 
     def finalize(self) -> None:
         """
-        Finalize by creating a compressed file, if needed.
-        """
-        if self.NH:
-            self.NH.close()
-        if self.EH:
-            self.EH.close()
-        if self.FH:
-            self.FH.close()
-        if self.compression:
-            WH = gzip.open(f"{self.filename}.gz", "wb")
-            with open(self.filename, "r") as FH:
-                for line in FH.buffer:
-                    WH.write(line)
+        Close any open array and the file.
+        """
+        self._close_array()
+        self._write(b"\n}" if self.pretty else b"}\n")
+        self._flush()
+        self.FH.close()
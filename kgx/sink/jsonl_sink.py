@@ -1,10 +1,9 @@
 import gzip
 import os
-from typing import Optional, Dict, Any
-
-import jsonlines
+from typing import Optional, Dict, Any, List
 
 from kgx.sink.sink import Sink
+from kgx.utils.json_utils import JsonlWriter, JSONL_BLOCK_SIZE
 
 
 class JsonlSink(Sink):
@@ -21,7 +20,8 @@ class JsonlSink(Sink):
     compression: Optional[str]
         The compression type (``gz``)
     kwargs: Any
-        Any additional arguments
+        Any additional arguments. ``buffer_size`` sets the number of
+        bytes of serialized records to buffer before writing to file.
 
     """
 
@@ -47,12 +47,13 @@ class JsonlSink(Sink):
             nodes_filename += f".{compression}"
             edges_filename += f".{compression}"
             NFH = gzip.open(nodes_filename, "wb")
-            self.NFH = jsonlines.Writer(NFH)
             EFH = gzip.open(edges_filename, "wb")
-            self.EFH = jsonlines.Writer(EFH)
         else:
-            self.NFH = jsonlines.open(nodes_filename, "w")
-            self.EFH = jsonlines.open(edges_filename, "w")
+            NFH = open(nodes_filename, "wb")
+            EFH = open(edges_filename, "wb")
+        buffer_size = int(kwargs.get("buffer_size", JSONL_BLOCK_SIZE))
+        self.NFH = JsonlWriter(NFH, buffer_size)
+        self.EFH = JsonlWriter(EFH, buffer_size)
 
     def write_node(self, record: Dict) -> None:
         """
@@ -78,6 +79,30 @@ class JsonlSink(Sink):
         """
         self.EFH.write(record)
 
+    def write_nodes(self, records: List) -> None:
+        """
+        Write a batch of node records to JSON.
+
+        Parameters
+        ----------
+        records: List
+            A list of node records
+
+        """
+        self.NFH.write_all(records)
+
+    def write_edges(self, records: List) -> None:
+        """
+        Write a batch of edge records to JSON.
+
+        Parameters
+        ----------
+        records: List
+            A list of edge records
+
+        """
+        self.EFH.write_all(records)
+
     def finalize(self) -> None:
         """
         Perform any operations after writing the file.
@@ -0,0 +1,499 @@
+import csv
+import io
+import os
+import shlex
+import subprocess
+from typing import Any, Dict, IO, List, Optional
+
+from kgx.config import get_logger
+from kgx.sink.neo_sink import NeoSink
+from kgx.sink.sink import Sink
+from kgx.sink.tsv_sink import (
+    DEFAULT_NODE_COLUMNS,
+    DEFAULT_EDGE_COLUMNS,
+    DEFAULT_BUFFER_SIZE,
+    TsvSink,
+)
+from kgx.utils.archive_utils import open_output
+from kgx.utils.kgx_utils import DEFAULT_NODE_CATEGORY, column_types
+
+log = get_logger()
+
+# Types of the values of properties, in the headers of neo4j-admin import
+STRING = "string"
+LONG = "long"
+DOUBLE = "double"
+BOOLEAN = "boolean"
+
+
+class NeoImportSink(Sink):
+    """
+    NeoImportSink is responsible for writing data as records to CSVs
+    for ``neo4j-admin database import``, which loads a graph into an
+    empty Neo4j database much faster than Cypher.
+
+    Nodes and relationships are written as in ``NeoSink``. Each node has
+    its categories, and ``DEFAULT_NODE_CATEGORY``, as labels, and each
+    relationship has its predicate as type. All the properties of nodes
+    and edges are kept, as typed columns, where lists are arrays that
+    are delimited by ``NeoSink.CATEGORY_DELIMITER``.
+
+    Columns are taken from ``node_properties`` and ``edge_properties``, and
+    are typed when first seen. When a record has a new property, or a value
+    of another type, a new file is started, with the columns of the previous
+    file and of the record, such that records are streamed to files without
+    losing properties.
+
+    Once the files are written, the ``neo4j-admin`` command to import them is
+    logged and written to a shell script, and run if ``run_import`` is set.
+
+    Parameters
+    ----------
+    filename: str
+        The filename prefix of the CSVs
+    format: str
+        The file format (``neo4j-import``)
+    compression: Optional[str]
+        The compression type (``gz``)
+    kwargs: Any
+        Any additional arguments. ``node_properties`` and ``edge_properties``
+        set the initial columns. ``database`` sets the database to import to
+        (``neo4j``), ``neo4j_admin`` the path to ``neo4j-admin``, and
+        ``run_import`` whether to run the import. ``buffer_size`` sets the
+        number of rows that are buffered before being written to file.
+
+    """
+
+    def __init__(
+        self,
+        filename: str,
+        format: str = "neo4j-import",
+        compression: Optional[str] = None,
+        **kwargs: Any,
+    ):
+        super().__init__()
+        if compression not in {None, "gz"}:
+            raise ValueError(
+                f"neo4j-admin import does not support '{compression}' compression"
+            )
+        self.compression = compression
+        self.compression_level = kwargs.get("compression_level")
+        self.dirname = os.path.abspath(os.path.dirname(filename))
+        self.basename = os.path.basename(filename)
+        os.makedirs(self.dirname, exist_ok=True)
+        self.node_properties.update(
+            kwargs.get("node_properties") or DEFAULT_NODE_COLUMNS
+        )
+        self.edge_properties.update(
+            kwargs.get("edge_properties") or DEFAULT_EDGE_COLUMNS
+        )
+        self.database = kwargs.get("database") or "neo4j"
+        self.neo4j_admin = kwargs.get("neo4j_admin") or "neo4j-admin"
+        self.run_import = bool(kwargs.get("run_import", False))
+        self.buffer_size = int(kwargs.get("buffer_size", DEFAULT_BUFFER_SIZE))
+        self.delimiter = NeoSink.CATEGORY_DELIMITER
+        self.node_files: List[str] = []
+        self.edge_files: List[str] = []
+        self.node_columns: Dict[str, str] = {}
+        self.edge_columns: Dict[str, str] = {}
+        self.NFH: Optional[IO[str]] = None
+        self.EFH: Optional[IO[str]] = None
+        self.node_buffer: List[List[str]] = []
+        self.edge_buffer: List[List[str]] = []
+        self.command: List[str] = []
+
+    def write_node(self, record: Dict) -> None:
+        """
+        Write a node record to a CSV.
+
+        Parameters
+        ----------
+        record: Dict
+            A node record
+
+        """
+        types = self._types(record, {"id"})
+        if not self._fits(types, self.node_columns):
+            self._start_node_file(types)
+        categories = record.get("category") or []
+        if isinstance(categories, str):
+            categories = [categories]
+        labels = [DEFAULT_NODE_CATEGORY]
+        for category in categories:
+            if category not in labels:
+                labels.append(category)
+        row = [str(record["id"]), self.delimiter.join(labels)]
+        row.extend(self._values(record, self.node_columns))
+        self.node_buffer.append(row)
+        if len(self.node_buffer) >= self.buffer_size:
+            self._flush_nodes()
+
+    def write_edge(self, record: Dict) -> None:
+        """
+        Write an edge record to a CSV.
+
+        Parameters
+        ----------
+        record: Dict
+            An edge record
+
+        """
+        types = self._types(record, set())
+        if not self._fits(types, self.edge_columns):
+            self._start_edge_file(types)
+        row = [str(record["subject"]), str(record["object"]), str(record["predicate"])]
+        row.extend(self._values(record, self.edge_columns))
+        self.edge_buffer.append(row)
+        if len(self.edge_buffer) >= self.buffer_size:
+            self._flush_edges()
+
+    def _start_node_file(self, types: Dict[str, str]) -> None:
+        """
+        Start a CSV for nodes with the columns of the previous CSV,
+        widened to fit the types of the properties of a node.
+
+        Parameters
+        ----------
+        types: Dict[str, str]
+            The types of the properties of the node
+
+        """
+        self._flush_nodes()
+        if self.NFH:
+            self.NFH.close()
+        columns = self._widen_columns(
+            self.node_columns, types, self.node_properties - {"id"}
+        )
+        order = TsvSink._order_node_columns(set(columns))
+        self.node_columns = {c: columns[c] for c in order}
+        self.NFH = self._open("nodes", self.node_files)
+        header = ["id:ID", ":LABEL"] + self._header(self.node_columns)
+        self.node_buffer.append(header)
+
+    def _start_edge_file(self, types: Dict[str, str]) -> None:
+        """
+        Start a CSV for edges with the columns of the previous CSV,
+        widened to fit the types of the properties of an edge.
+
+        Parameters
+        ----------
+        types: Dict[str, str]
+            The types of the properties of the edge
+
+        """
+        self._flush_edges()
+        if self.EFH:
+            self.EFH.close()
+        columns = self._widen_columns(self.edge_columns, types, self.edge_properties)
+        order = TsvSink._order_edge_columns(set(columns))
+        self.edge_columns = {c: columns[c] for c in order}
+        self.EFH = self._open("edges", self.edge_files)
+        header = [":START_ID", ":END_ID", ":TYPE"] + self._header(self.edge_columns)
+        self.edge_buffer.append(header)
+
+    def _open(self, kind: str, files: List[str]) -> IO[str]:
+        """
+        Open the next CSV for nodes or edges.
+
+        Parameters
+        ----------
+        kind: str
+            Either ``nodes`` or ``edges``
+        files: List[str]
+            The CSVs for nodes or edges so far, to which the CSV is added
+
+        Returns
+        -------
+        IO[str]
+            The file object
+
+        """
+        suffix = f"_{len(files) + 1}" if files else ""
+        name = f"{self.basename}_{kind}{suffix}.csv"
+        if self.compression:
+            name = f"{name}.{self.compression}"
+        path = os.path.join(self.dirname, name)
+        files.append(path)
+        FH = open_output(path, self.compression, self.compression_level)
+        return io.TextIOWrapper(FH, encoding="utf-8", newline="")
+
+    @staticmethod
+    def _header(columns: Dict[str, str]) -> List[str]:
+        """
+        Get the header of the property columns of a CSV.
+
+        Parameters
+        ----------
+        columns: Dict[str, str]
+            The columns and their types
+
+        Returns
+        -------
+        List[str]
+            The header of each column
+
+        """
+        return [c if t == STRING else f"{c}:{t}" for c, t in columns.items()]
+
+    def _values(self, record: Dict, columns: Dict[str, str]) -> List[str]:
+        """
+        Get the values of the property columns of a CSV for a record.
+
+        Parameters
+        ----------
+        record: Dict
+            A node or edge record
+        columns: Dict[str, str]
+            The columns and their types
+
+        Returns
+        -------
+        List[str]
+            The value of each column
+
+        """
+        row = []
+        for c, t in columns.items():
+            value = record.get(c)
+            if value is None or value == "" or value == []:
+                row.append("")
+            elif t.endswith("[]"):
+                if not isinstance(value, (list, set, tuple)):
+                    value = [value]
+                row.append(self.delimiter.join(self._format(x) for x in value))
+            else:
+                row.append(self._format(value))
+        return row
+
+    @staticmethod
+    def _format(value: Any) -> str:
+        """
+        Format a value for a CSV.
+
+        Parameters
+        ----------
+        value: Any
+            A value
+
+        Returns
+        -------
+        str
+            The formatted value
+
+        """
+        if isinstance(value, bool):
+            return "true" if value else "false"
+        if isinstance(value, str):
+            return value.replace("\n", " ").replace("\r", " ")
+        return str(value)
+
+    @staticmethod
+    def _types(record: Dict, exclude: set) -> Dict[str, str]:
+        """
+        Get the types of the properties of a record.
+
+        Parameters
+        ----------
+        record: Dict
+            A node or edge record
+        exclude: set
+            Properties that are not written as typed columns
+
+        Returns
+        -------
+        Dict[str, str]
+            The properties and their types
+
+        """
+        types = {}
+        for key, value in record.items():
+            if key in exclude or value is None or value == "" or value == []:
+                continue
+            if isinstance(value, (list, set, tuple)):
+                t = None
+                for x in value:
+                    t = _widen(t, _scalar_type(x))
+                types[key] = f"{t or STRING}[]"
+            elif column_types.get(key) == list:
+                types[key] = f"{_scalar_type(value)}[]"
+            else:
+                types[key] = _scalar_type(value)
+        return types
+
+    @staticmethod
+    def _fits(types: Dict[str, str], columns: Dict[str, str]) -> bool:
+        """
+        Check whether the properties of a record fit in the columns of a CSV.
+
+        Parameters
+        ----------
+        types: Dict[str, str]
+            The properties of the record and their types
+        columns: Dict[str, str]
+            The columns of the CSV and their types
+
+        Returns
+        -------
+        bool
+            Whether the properties fit
+
+        """
+        if not columns:
+            return False
+        for key, t in types.items():
+            c = columns.get(key)
+            if c is None or (c != t and _widen(c, t) != c):
+                return False
+        return True
+
+    @staticmethod
+    def _widen_columns(
+        columns: Dict[str, str], types: Dict[str, str], properties: set
+    ) -> Dict[str, str]:
+        """
+        Widen columns to fit the properties of a record, and the given
+        properties.
+
+        Parameters
+        ----------
+        columns: Dict[str, str]
+            The columns and their types
+        types: Dict[str, str]
+            The properties of the record and their types
+        properties: set
+            The properties to have columns for
+
+        Returns
+        -------
+        Dict[str, str]
+            The widened columns and their types
+
+        """
+        columns = dict(columns)
+        for key in properties:
+            if key not in columns:
+                columns[key] = (
+                    f"{STRING}[]" if column_types.get(key) == list else STRING
+                )
+        for key, t in types.items():
+            columns[key] = _widen(columns.get(key), t)
+        return columns
+
+    def _flush_nodes(self) -> None:
+        """
+        Write buffered node rows to file.
+        """
+        if self.node_buffer:
+            csv.writer(self.NFH).writerows(self.node_buffer)
+        self.node_buffer = []
+
+    def _flush_edges(self) -> None:
+        """
+        Write buffered edge rows to file.
+        """
+        if self.edge_buffer:
+            csv.writer(self.EFH).writerows(self.edge_buffer)
+        self.edge_buffer = []
+
+    def finalize(self) -> None:
+        """
+        Close the CSVs, and write, and possibly run, the command to import them.
+        """
+        self._flush_nodes()
+        self._flush_edges()
+        if self.NFH:
+            self.NFH.close()
+        if self.EFH:
+            self.EFH.close()
+        self.command = self.import_command()
+        script = os.path.join(self.dirname, f"{self.basename}_import.sh")
+        with open(script, "w") as f:
+            f.write("#!/bin/sh\n")
+            f.write(" \\\n    ".join(shlex.quote(x) for x in self.command) + "\n")
+        os.chmod(script, 0o755)
+        log.info(f"Import with: {' '.join(shlex.quote(x) for x in self.command)}")
+        if self.run_import:
+            subprocess.run(self.command, check=True)
+
+    def import_command(self) -> List[str]:
+        """
+        Get the ``neo4j-admin`` command to import the CSVs.
+
+        Duplicate nodes, and relationships whose nodes are missing, are
+        skipped, as they are by ``NeoSink``.
+
+        Returns
+        -------
+        List[str]
+            The command, as a list of arguments
+
+        """
+        command = [
+            self.neo4j_admin,
+            "database",
+            "import",
+            "full",
+            f"--array-delimiter={self.delimiter}",
+            "--id-type=string",
+            "--skip-duplicate-nodes=true",
+            "--skip-bad-relationships=true",
+        ]
+        command.extend(f"--nodes={x}" for x in self.node_files)
+        command.extend(f"--relationships={x}" for x in self.edge_files)
+        command.append(self.database)
+        return command
+
+
+def _scalar_type(value: Any) -> str:
+    """
+    Get the type of a value that is not a list.
+
+    Parameters
+    ----------
+    value: Any
+        A value
+
+    Returns
+    -------
+    str
+        The type of the value
+
+    """
+    if isinstance(value, bool):
+        return BOOLEAN
+    if isinstance(value, int):
+        return LONG
+    if isinstance(value, float):
+        return DOUBLE
+    return STRING
+
+
+def _widen(a: Optional[str], b: str) -> str:
+    """
+    Get the narrowest type that fits values of both types.
+
+    Parameters
+    ----------
+    a: Optional[str]
+        A type, if any
+    b: str
+        A type
+
+    Returns
+    -------
+    str
+        The type that fits both types
+
+    """
+    if a is None or a == b:
+        return b
+    array = a.endswith("[]") or b.endswith("[]")
+    a = a[:-2] if a.endswith("[]") else a
+    b = b[:-2] if b.endswith("[]") else b
+    if a == b:
+        t = a
+    elif {a, b} == {LONG, DOUBLE}:
+        t = DOUBLE
+    else:
+        t = STRING
+    return f"{t}[]" if array else t
@@ -1,61 +1,179 @@
-from typing import List, Union, Any
+import itertools
+import pickle
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import List, Union, Any, Dict, Optional, Set
 
 from neo4jrestclient.client import GraphDatabase
 from neo4jrestclient.query import CypherException
 
 from kgx.config import get_logger
 from kgx.sink.sink import Sink
+from kgx.utils.cache_utils import DEFAULT_ENTRY_SIZE, MEMORY_OVERHEAD
 from kgx.utils.kgx_utils import DEFAULT_NODE_CATEGORY
+from kgx.utils.neo_utils import get_bolt_driver, is_bolt_uri, is_transient_error
 
 log = get_logger()
 
+# Number of bytes of memory for the cached records, before they are written
+CACHE_MEMORY = 1 << 28
+
+# Number of cached records between estimates of the memory of a record
+SAMPLE_INTERVAL = 100
+
+# Number of records that are written in a single query
+BATCH_SIZE = 10000
+
+# Number of times a transaction is retried after a transient error
+MAX_RETRIES = 5
+
+# Number of seconds before a transaction is first retried, which is doubled
+# for each retry
+RETRY_DELAY = 0.5
+
 
 class NeoSink(Sink):
     """
     NeoSink is responsible for writing data as records
     to a Neo4j instance.
 
+    Neo4j is written to over HTTP, or over the Bolt protocol if the URI
+    has a Bolt scheme, like ``bolt://`` or ``neo4j://``, which requires
+    the ``neo4j`` package.
+
+    Over Bolt, batches of records are written in explicit transactions,
+    which are retried after transient errors, like deadlocks. Batches are
+    written by ``workers`` concurrent threads, each with its own session
+    from the connection pool of the driver. All the node records that are
+    written before edge records are in Neo4j before the edge records are
+    written, such that edges find their subject and object nodes.
+
     Parameters
     ----------
     uri: str
         The URI for the Neo4j instance.
-        For example, http://localhost:7474
+        For example, http://localhost:7474 or bolt://localhost:7687
     username: str
         The username
     password: str
         The password
     kwargs: Any
-        Any additional arguments
+        Any additional arguments. ``cache_memory`` sets the number of bytes
+        of memory for the records that are cached before they are written,
+        ``cache_size`` optionally limits the number of cached records, and
+        ``batch_size`` sets the number of records to write in a single
+        query. Over Bolt, ``workers`` sets the number of batches to write
+        concurrently, ``max_retries`` the number of times to retry a
+        transaction, and ``database`` the database.
 
     """
 
-    CACHE_SIZE = 100000
-    node_cache = {}
-    edge_cache = {}
-    node_count = 0
-    edge_count = 0
     CATEGORY_DELIMITER = "|"
     CYPHER_CATEGORY_DELIMITER = ":"
-    _seen_categories = set()
 
     def __init__(self, uri: str, username: str, password: str, **kwargs: Any):
         super().__init__()
-        if "cache_size" in kwargs:
-            self.CACHE_SIZE = kwargs["cache_size"]
-        self.http_driver: GraphDatabase = GraphDatabase(
-            uri, username=username, password=password
-        )
+        self.cache_memory = int(kwargs.get("cache_memory") or CACHE_MEMORY)
+        self.cache_size: Optional[int] = kwargs.get("cache_size")
+        self.node_cache: Dict[str, List[Dict]] = {}
+        self.edge_cache: Dict[str, List[Dict]] = {}
+        self.node_count = 0
+        self.edge_count = 0
+        # estimated number of bytes of memory for the cached records
+        self.node_memory = 0
+        self.edge_memory = 0
+        self.record_size = DEFAULT_ENTRY_SIZE * MEMORY_OVERHEAD
+        self._seen_categories: Set[str] = set()
+        self.batch_size = int(kwargs.get("batch_size") or BATCH_SIZE)
+        self.workers = max(1, int(kwargs.get("workers") or 1))
+        self.max_retries = int(kwargs.get("max_retries", MAX_RETRIES))
+        self.session_args: Dict = {}
+        if kwargs.get("database"):
+            self.session_args["database"] = kwargs["database"]
+        self.http_driver: Optional[GraphDatabase] = None
+        self.bolt_driver = None
+        self.executor: Optional[ThreadPoolExecutor] = None
+        self.pending: List[Future] = []
+        self.bolt = is_bolt_uri(uri)
+        if self.bolt:
+            self.bolt_args = {
+                "uri": uri,
+                "username": username,
+                "password": password,
+                "max_connection_pool_size": self.workers + 1,
+            }
+            self.bolt_driver = get_bolt_driver(**self.bolt_args)
+        else:
+            self.http_driver = GraphDatabase(uri, username=username, password=password)
+
+    def _cache(self, cache: Dict[str, List[Dict]], key: str, record: Dict) -> int:
+        """
+        Add a record to a cache, and estimate its memory.
+
+        The memory of a record is estimated from the size of every
+        ``SAMPLE_INTERVAL``-th record, when pickled.
+
+        Parameters
+        ----------
+        cache: Dict[str, List[Dict]]
+            The node or edge cache
+        key: str
+            The key of the record in the cache
+        record: Dict
+            A node or edge record
+
+        Returns
+        -------
+        int
+            The estimated number of bytes of memory for the record
+
+        """
+        if key in cache:
+            cache[key].append(record)
+        else:
+            cache[key] = [record]
+        if (self.node_count + self.edge_count) % SAMPLE_INTERVAL == 0:
+            size = len(pickle.dumps(record, pickle.HIGHEST_PROTOCOL)) * MEMORY_OVERHEAD
+            self.record_size = (self.record_size + size) // 2
+        return self.record_size
+
+    def _is_cache_full(self) -> bool:
+        """
+        Check whether the cached records use up the memory for the cache,
+        or, if ``cache_size`` is set, whether there are as many records.
+
+        Returns
+        -------
+        bool
+            Whether the cache is full
+
+        """
+        if self.node_memory + self.edge_memory >= self.cache_memory:
+            return True
+        count = self.node_count + self.edge_count
+        return self.cache_size is not None and count >= self.cache_size
+
+    def _flush_cache(self) -> None:
+        """
+        Write the cached records, where the cached edge records are
+        written after the cached node records.
+        """
+        if self.edge_cache:
+            self._flush_edge_cache()
+        else:
+            self._flush_node_cache()
 
     def _flush_node_cache(self):
         self._write_node_cache()
         self.node_cache.clear()
         self.node_count = 0
+        self.node_memory = 0
 
     def write_node(self, record) -> None:
         """
         Cache a node record that is to be written to Neo4j.
-        This method writes a cache of node records when the
-        total number of records exceeds ``CACHE_SIZE``
+        This method writes the cached records when they use up
+        ``cache_memory``, or number ``cache_size``.
 
         Parameters
         ----------
@@ -63,24 +181,41 @@ class NeoSink(Sink):
             A node record
 
         """
+        if self._is_cache_full():
+            self._flush_cache()
         sanitized_category = self.sanitize_category(record["category"])
         category = self.CATEGORY_DELIMITER.join(sanitized_category)
-        if self.node_count >= self.CACHE_SIZE:
-            self._flush_node_cache()
-        if category not in self.node_cache:
-            self.node_cache[category] = [record]
-        else:
-            self.node_cache[category].append(record)
+        self.node_memory += self._cache(self.node_cache, category, record)
         self.node_count += 1
 
+    def write_nodes(self, records: List) -> None:
+        """
+        Cache a batch of node records that are to be written to Neo4j.
+        The cached records are written once they use up ``cache_memory``,
+        or number ``cache_size``.
+
+        Parameters
+        ----------
+        records: List
+            A list of node records
+
+        """
+        for record in records:
+            sanitized_category = self.sanitize_category(record["category"])
+            category = self.CATEGORY_DELIMITER.join(sanitized_category)
+            self.node_memory += self._cache(self.node_cache, category, record)
+            self.node_count += 1
+        if self._is_cache_full():
+            self._flush_cache()
+
     def _write_node_cache(self) -> None:
         """
         Write cached node records to Neo4j.
+
+        The constraints for the categories of the nodes are created
+        before the nodes are written, once for each category.
         """
-        batch_size = 10000
-        categories = self.node_cache.keys()
-        filtered_categories = [x for x in categories if x not in self._seen_categories]
-        self.create_constraints(filtered_categories)
+        self.create_constraints(self.node_cache.keys())
         for category in self.node_cache.keys():
             log.debug("Generating UNWIND for category: {}".format(category))
             cypher_category = category.replace(
@@ -89,26 +224,25 @@ class NeoSink(Sink):
             query = self.generate_unwind_node_query(cypher_category)
             log.debug(query)
             nodes = self.node_cache[category]
-            for x in range(0, len(nodes), batch_size):
-                y = min(x + batch_size, len(nodes))
+            for x in range(0, len(nodes), self.batch_size):
+                y = min(x + self.batch_size, len(nodes))
                 log.debug(f"Batch {x} - {y}")
                 batch = nodes[x:y]
-                try:
-                    self.http_driver.query(query, params={"nodes": batch})
-                except CypherException as ce:
-                    log.error(ce)
+                self._submit(query, {"nodes": batch})
 
     def _flush_edge_cache(self):
         self._flush_node_cache()
+        self._wait()
         self._write_edge_cache()
         self.edge_cache.clear()
         self.edge_count = 0
+        self.edge_memory = 0
 
     def write_edge(self, record) -> None:
         """
         Cache an edge record that is to be written to Neo4j.
-        This method writes a cache of edge records when the
-        total number of records exceeds ``CACHE_SIZE``
+        This method writes the cached records when they use up
+        ``cache_memory``, or number ``cache_size``.
 
         Parameters
         ----------
@@ -116,42 +250,149 @@ class NeoSink(Sink):
             An edge record
 
         """
-        if self.edge_count >= self.CACHE_SIZE:
+        if self._is_cache_full():
             self._flush_edge_cache()
         # self.validate_edge(data)
-        edge_predicate = record["predicate"]
-        if edge_predicate in self.edge_cache:
-            self.edge_cache[edge_predicate].append(record)
-        else:
-            self.edge_cache[edge_predicate] = [record]
+        self.edge_memory += self._cache(self.edge_cache, record["predicate"], record)
         self.edge_count += 1
 
+    def write_edges(self, records: List) -> None:
+        """
+        Cache a batch of edge records that are to be written to Neo4j.
+        The cached records are written once they use up ``cache_memory``,
+        or number ``cache_size``.
+
+        Parameters
+        ----------
+        records: List
+            A list of edge records
+
+        """
+        for record in records:
+            edge_predicate = record["predicate"]
+            self.edge_memory += self._cache(self.edge_cache, edge_predicate, record)
+            self.edge_count += 1
+        if self._is_cache_full():
+            self._flush_edge_cache()
+
     def _write_edge_cache(self) -> None:
         """
         Write cached edge records to Neo4j.
         """
-        batch_size = 10000
         for predicate in self.edge_cache.keys():
             query = self.generate_unwind_edge_query(predicate)
             log.debug(query)
             edges = self.edge_cache[predicate]
-            for x in range(0, len(edges), batch_size):
-                y = min(x + batch_size, len(edges))
+            for x in range(0, len(edges), self.batch_size):
+                y = min(x + self.batch_size, len(edges))
                 batch = edges[x:y]
                 log.debug(f"Batch {x} - {y}")
-                try:
-                    self.http_driver.query(
-                        query, params={"relationship": predicate, "edges": batch}
-                    )
-                except CypherException as ce:
-                    log.error(ce)
+                self._submit(query, {"relationship": predicate, "edges": batch})
+
+    def _submit(self, query: str, params: Dict) -> None:
+        """
+        Write a batch of records with a query. Over Bolt, with more than
+        one worker, the batch is written concurrently with other batches,
+        and at most twice as many batches as workers are kept in flight.
+
+        Parameters
+        ----------
+        query: str
+            The query
+        params: Dict
+            The parameters of the query
+
+        """
+        if not self.bolt:
+            try:
+                self.http_driver.query(query, params=params)
+            except CypherException as ce:
+                log.error(ce)
+            return
+        self._open_bolt_driver()
+        if self.workers == 1:
+            self._write_transaction(query, params)
+        else:
+            if self.executor is None:
+                self.executor = ThreadPoolExecutor(self.workers)
+            while len(self.pending) >= 2 * self.workers:
+                done, _ = wait(self.pending, return_when=FIRST_COMPLETED)
+                self.pending = [x for x in self.pending if x not in done]
+                for future in done:
+                    future.result()
+            self.pending.append(
+                self.executor.submit(self._write_transaction, query, params)
+            )
+
+    def _wait(self) -> None:
+        """
+        Wait until all the batches in flight are written, and raise
+        the error of any batch that could not be written.
+        """
+        pending = self.pending
+        self.pending = []
+        wait(pending)
+        for future in pending:
+            future.result()
+
+    def _open_bolt_driver(self) -> None:
+        """
+        Create the Bolt driver, if it is closed. The driver is only created
+        by the thread that submits batches, and is shared by the workers.
+        """
+        if self.bolt_driver is None:
+            self.bolt_driver = get_bolt_driver(**self.bolt_args)
+
+    def _write_transaction(self, query: str, params: Optional[Dict] = None) -> None:
+        """
+        Run a query in an explicit transaction over Bolt, and retry the
+        transaction after a transient error, with an exponential backoff.
+        Each attempt opens a session of its own, from the connection pool
+        of the driver, which must be open.
+
+        Parameters
+        ----------
+        query: str
+            The query
+        params: Optional[Dict]
+            The parameters of the query
+
+        """
+        delay = RETRY_DELAY
+        for attempt in itertools.count(1):
+            try:
+                with self.bolt_driver.session(**self.session_args) as session:
+                    with session.begin_transaction() as tx:
+                        tx.run(query, params or {}).consume()
+                        tx.commit()
+                return
+            except Exception as e:
+                if attempt > self.max_retries or not is_transient_error(e):
+                    raise
+                log.warning(
+                    f"Retrying transaction ({attempt}/{self.max_retries}) "
+                    f"after a transient error: {e}"
+                )
+                time.sleep(delay)
+                delay *= 2
 
     def finalize(self) -> None:
         """
         Write any remaining cached node and/or edge records.
         """
-        self._write_node_cache()
-        self._write_edge_cache()
+        try:
+            self._flush_edge_cache()
+            self._wait()
+        finally:
+            for future in self.pending:
+                future.cancel()
+            self.pending = []
+            if self.executor is not None:
+                self.executor.shutdown()
+                self.executor = None
+            if self.bolt_driver is not None:
+                self.bolt_driver.close()
+                self.bolt_driver = None
 
     @staticmethod
     def sanitize_category(category: List) -> List:
@@ -233,25 +474,40 @@ class NeoSink(Sink):
         """
         Create a unique constraint on node 'id' for all ``categories`` in Neo4j.
 
+        A constraint is created at most once for each category, and for
+        ``DEFAULT_NODE_CATEGORY``, by each instance of NeoSink. The creation
+        of a constraint is not retried, since it fails if an equivalent
+        constraint already exists.
+
         Parameters
         ----------
         categories: Union[set, list]
             Set of categories
 
         """
-        categories_set = set(categories)
-        categories_set.add(f"`{DEFAULT_NODE_CATEGORY}`")
-        for category in categories_set:
-            if self.CATEGORY_DELIMITER in category:
-                subcategories = category.split(self.CATEGORY_DELIMITER)
-                self.create_constraints(subcategories)
-            else:
-                query = NeoSink.create_constraint_query(category)
+        categories_set = {f"`{DEFAULT_NODE_CATEGORY}`"}
+        for category in categories:
+            categories_set.update(category.split(self.CATEGORY_DELIMITER))
+        categories_set -= self._seen_categories
+        if not categories_set:
+            return
+        # the schema is not changed while batches are written
+        self._wait()
+        for category in sorted(categories_set):
+            self._seen_categories.add(category)
+            query = NeoSink.create_constraint_query(category)
+            if self.bolt:
                 try:
-                    self.http_driver.query(query)
-                    self._seen_categories.add(category)
-                except CypherException as ce:
-                    log.error(ce)
+                    self._open_bolt_driver()
+                    self._write_transaction(query)
+                except Exception as e:
+                    # for example, if an equivalent constraint already exists
+                    log.error(e)
+                continue
+            try:
+                self.http_driver.query(query)
+            except CypherException as ce:
+                log.error(ce)
 
     @staticmethod
     def create_constraint_query(category: str) -> str:
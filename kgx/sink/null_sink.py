@@ -1,4 +1,4 @@
-from typing import Any
+from typing import Any, List
 from kgx.sink import Sink
 
 
@@ -45,6 +45,30 @@ class NullSink(Sink):
         """
         pass
 
+    def write_nodes(self, records: List) -> None:
+        """
+        Write a batch of node records to the underlying store.
+
+        Parameters
+        ----------
+        records: List
+            A list of node records
+
+        """
+        pass
+
+    def write_edges(self, records: List) -> None:
+        """
+        Write a batch of edge records to the underlying store.
+
+        Parameters
+        ----------
+        records: List
+            A list of edge records
+
+        """
+        pass
+
     def finalize(self) -> None:
         """
         Operations that ought to be done after
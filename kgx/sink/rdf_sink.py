@@ -1,16 +1,15 @@
-import gzip
 from collections import OrderedDict
-from typing import Optional, Union, Tuple, Any, Dict
+from typing import Optional, Union, Tuple, Any, Dict, List, Set
 
-import rdflib
 from linkml_runtime.linkml_model.meta import Element, ClassDefinition, SlotDefinition
 from rdflib import URIRef, Literal, Namespace, RDF
-from rdflib.plugins.serializers.nt import _nt_row
-from rdflib.term import _is_valid_uri
+from rdflib.plugins.serializers.nt import _quote_encode, _quoteLiteral
 
-from kgx.prefix_manager import PrefixManager
+from kgx.parsers.ntriples_parser import r_invalid_iri
+from kgx.prefix_manager import PrefixManager, CURIE_PATTERN
 from kgx.config import get_logger
 from kgx.sink.sink import Sink
+from kgx.utils.archive_utils import open_output
 from kgx.utils.kgx_utils import (
     get_toolkit,
     sentencecase_to_camelcase,
@@ -26,6 +25,14 @@ log = get_logger()
 property_mapping: OrderedDict = OrderedDict()
 reverse_property_mapping: OrderedDict = OrderedDict()
 
+# Number of bytes of triples to buffer before writing to file
+BUFFER_SIZE = 1 << 22
+
+# Estimated number of bytes of a triple, for the number of triples to buffer
+LINE_SIZE = 128
+
+XSD_STRING = "http://www.w3.org/2001/XMLSchema#string"
+
 
 class RdfSink(Sink):
     """
@@ -42,11 +49,13 @@ class RdfSink(Sink):
     format: str
         The file format (``nt``)
     compression: str
-        The compression type (``gz``)
+        The compression type (``gz``, ``bz2``, ``xz``, ``zst``)
     reify_all_edges: bool
         Whether or not to reify all the edges
     kwargs: Any
-        Any additional arguments
+        Any additional arguments. ``compression_level`` sets the compression
+        level. ``buffer_size`` sets the approximate number of bytes of triples
+        to buffer before writing to file.
 
     """
 
@@ -69,19 +78,47 @@ class RdfSink(Sink):
         self.toolkit = get_toolkit()
         self.reverse_predicate_mapping = {}
         self.property_types = get_biolink_property_types()
+        # the mappings of predicates from process_predicate
         self.cache = {}
+        # the predicate and type of the triples for each property of nodes and edges
+        self.node_property_table: Dict[str, Tuple[str, str]] = {}
+        self.edge_property_table: Dict[str, Tuple[str, str]] = {}
         self.reify_all_edges = reify_all_edges
         self.reification_types = {
             RDF.Statement,
             self.BIOLINK.Association,
             self.OBAN.association,
         }
-        if compression == "gz":
-            f = gzip.open(filename, "wb")
+        self.associations = self._get_associations()
+        # the IRIs that the prefixes of CURIEs expand to, or None if they do not expand
+        self.expansions: Dict[str, Optional[str]] = {}
+        # the IRIs of the datatypes of property types
+        self.datatypes: Dict[str, str] = {}
+        if compression in {"gz", "bz2", "xz", "zst"}:
+            self.FH = open_output(filename, compression, kwargs.get("compression_level"))
         else:
-            f = open(filename, "wb")
-        self.FH = f
+            self.FH = open(filename, "wb")
         self.encoding = "ascii"
+        self.buffer_size = int(kwargs.get("buffer_size", BUFFER_SIZE))
+        self.buffer_lines = max(1, self.buffer_size // LINE_SIZE)
+        self.buffer: List[str] = []
+
+    def set_reverse_prefix_map(self, m: Dict) -> None:
+        """
+        Update default reverse prefix map, and clear the mappings
+        of predicates that depend on it.
+
+        Parameters
+        ----------
+        m: Dict
+            A dictionary with IRI to prefix mappings
+
+        """
+        super().set_reverse_prefix_map(m)
+        self.cache.clear()
+        self.node_property_table.clear()
+        self.edge_property_table.clear()
+        self.associations = self._get_associations()
 
     def set_reverse_predicate_mapping(self, m: Dict) -> None:
         """
@@ -99,6 +136,9 @@ class RdfSink(Sink):
         """
         for k, v in m.items():
             self.reverse_predicate_mapping[v] = URIRef(k)
+        self.cache.clear()
+        self.node_property_table.clear()
+        self.edge_property_table.clear()
 
     def set_property_types(self, m: Dict) -> None:
         """
@@ -123,6 +163,8 @@ class RdfSink(Sink):
             else:
                 key = property_name
             self.property_types[key] = v
+        self.node_property_table.clear()
+        self.edge_property_table.clear()
 
     def write_node(self, record: Dict) -> None:
         """
@@ -134,50 +176,38 @@ class RdfSink(Sink):
             A node record
 
         """
+        s = None
+        lines = self.buffer
         for k, v in record.items():
             if k in {"id", "iri"}:
                 continue
-            (
-                element_uri,
-                canonical_uri,
-                predicate,
-                property_name,
-            ) = self.process_predicate(k)
-            if element_uri is None:
-                # not a biolink predicate
-                if k in self.reverse_predicate_mapping:
-                    prop_uri = self.reverse_predicate_mapping[k]
-                    # prop_uri = self.prefix_manager.contract(prop_uri)
-                else:
-                    prop_uri = k
-            else:
-                prop_uri = canonical_uri if canonical_uri else element_uri
-            prop_type = self._get_property_type(prop_uri)
-            log.debug(f"prop {k} has prop_uri {prop_uri} and prop_type {prop_type}")
-            prop_uri = self.uriref(prop_uri)
+            if s is None:
+                s = self._format_iri(self._expand(record["id"]))
+            p, prop_type = self._node_property(k)
             if isinstance(v, (list, set, tuple)):
                 for x in v:
-                    value_uri = self._prepare_object(k, prop_type, x)
-                    self._write_triple(self.uriref(record["id"]), prop_uri, value_uri)
+                    lines.append(f"{s} {p} {self._format_object(prop_type, x)} .\n")
             else:
-                value_uri = self._prepare_object(k, prop_type, v)
-                self._write_triple(self.uriref(record["id"]), prop_uri, value_uri)
+                lines.append(f"{s} {p} {self._format_object(prop_type, v)} .\n")
+        self._check_buffer()
 
-    def _write_triple(self, s: URIRef, p: URIRef, o: Union[URIRef, Literal]) -> None:
+    def _check_buffer(self) -> None:
         """
-        Serialize a triple.
-
-        Parameters
-        ----------
-        s: rdflib.URIRef
-            The subject
-        p: rdflib.URIRef
-            The predicate
-        o: Union[rdflib.URIRef, rdflib.Literal]
-            The object
+        Write the buffered triples to file, if there are
+        more of them than fit in the buffer.
+        """
+        if len(self.buffer) >= self.buffer_lines:
+            self._flush()
 
+    def _flush(self) -> None:
         """
-        self.FH.write(_nt_row((s, p, o)).encode(self.encoding, "_rdflib_nt_escape"))
+        Write the buffered triples to file.
+        """
+        if self.buffer:
+            self.FH.write(
+                "".join(self.buffer).encode(self.encoding, "_rdflib_nt_escape")
+            )
+        self.buffer = []
 
     def write_edge(self, record: Dict) -> None:
         """
@@ -189,97 +219,131 @@ class RdfSink(Sink):
             An edge record
 
         """
-        ecache = []
-        associations = set(
-            [self.prefix_manager.contract(x) for x in self.reification_types]
-        )
-        associations.update(
-            [str(x) for x in set(self.toolkit.get_all_associations(formatted=True))]
-        )
-        if self.reify_all_edges:
+        associations = self.associations
+        if self.reify_all_edges or (
+            ("type" in record and record["type"] in associations)
+            or (
+                "association_type" in record
+                and record["association_type"] in associations
+            )
+            or ("category" in record and any(record["category"]) in associations)
+        ):
             reified_node = self.reify(record["subject"], record["object"], record)
-            s = reified_node["subject"]
-            p = reified_node["predicate"]
-            o = reified_node["object"]
-            ecache.append((s, p, o))
-            n = reified_node["id"]
+            lines = self.buffer
+            n = self._format_iri(reified_node["id"])
             for prop, value in reified_node.items():
                 if prop in {"id", "association_id", "edge_key"}:
                     continue
-                (
-                    element_uri,
-                    canonical_uri,
-                    predicate,
-                    property_name,
-                ) = self.process_predicate(prop)
-                if element_uri:
-                    prop_uri = canonical_uri if canonical_uri else element_uri
-                else:
-                    if prop in self.reverse_predicate_mapping:
-                        prop_uri = self.reverse_predicate_mapping[prop]
-                        # prop_uri = self.prefix_manager.contract(prop_uri)
-                    else:
-                        prop_uri = predicate
-                prop_type = self._get_property_type(prop)
-                log.debug(
-                    f"prop {prop} has prop_uri {prop_uri} and prop_type {prop_type}"
-                )
-                prop_uri = self.uriref(prop_uri)
+                p, prop_type = self._edge_property(prop)
                 if isinstance(value, list):
                     for x in value:
-                        value_uri = self._prepare_object(prop, prop_type, x)
-                        self._write_triple(URIRef(n), prop_uri, value_uri)
+                        lines.append(f"{n} {p} {self._format_object(prop_type, x)} .\n")
                 else:
-                    value_uri = self._prepare_object(prop, prop_type, value)
-                    self._write_triple(URIRef(n), prop_uri, value_uri)
+                    lines.append(f"{n} {p} {self._format_object(prop_type, value)} .\n")
+            s = self._format_iri(reified_node["subject"])
+            p = self._format_iri(reified_node["predicate"])
+            o = self._format_iri(reified_node["object"])
         else:
-            if (
-                ("type" in record and record["type"] in associations)
-                or (
-                    "association_type" in record
-                    and record["association_type"] in associations
-                )
-                or ("category" in record and any(record["category"]) in associations)
-            ):
-                reified_node = self.reify(record["subject"], record["object"], record)
-                s = reified_node["subject"]
-                p = reified_node["predicate"]
-                o = reified_node["object"]
-                ecache.append((s, p, o))
-                n = reified_node["id"]
-                for prop, value in reified_node.items():
-                    if prop in {"id", "association_id", "edge_key"}:
-                        continue
-                    (
-                        element_uri,
-                        canonical_uri,
-                        predicate,
-                        property_name,
-                    ) = self.process_predicate(prop)
-                    if element_uri:
-                        prop_uri = canonical_uri if canonical_uri else element_uri
-                    else:
-                        if prop in self.reverse_predicate_mapping:
-                            prop_uri = self.reverse_predicate_mapping[prop]
-                            # prop_uri = self.prefix_manager.contract(prop_uri)
-                        else:
-                            prop_uri = predicate
-                    prop_type = self._get_property_type(prop)
-                    prop_uri = self.uriref(prop_uri)
-                    if isinstance(value, list):
-                        for x in value:
-                            value_uri = self._prepare_object(prop, prop_type, x)
-                            self._write_triple(URIRef(n), prop_uri, value_uri)
-                    else:
-                        value_uri = self._prepare_object(prop, prop_type, value)
-                        self._write_triple(URIRef(n), prop_uri, value_uri)
+            s = self._format_iri(self._expand(record["subject"]))
+            p = self._format_iri(self._expand(record["predicate"]))
+            o = self._format_iri(self._expand(record["object"]))
+        self.buffer.append(f"{s} {p} {o} .\n")
+        self._check_buffer()
+
+    def _get_associations(self) -> Set[str]:
+        """
+        Get the CURIEs of the types of edges that are reified.
+
+        Returns
+        -------
+        Set[str]
+            The CURIEs of reification types and Biolink associations
+
+        """
+        associations = set(
+            [self.prefix_manager.contract(x) for x in self.reification_types]
+        )
+        associations.update(
+            [str(x) for x in set(self.toolkit.get_all_associations(formatted=True))]
+        )
+        return associations
+
+    def _node_property(self, k: str) -> Tuple[str, str]:
+        """
+        Get the predicate and type of the triples for a property
+        of nodes, from the property table of nodes.
+
+        Parameters
+        ----------
+        k: str
+            The property name
+
+        Returns
+        -------
+        Tuple[str, str]
+            The predicate, formatted for N-Triples, and the property type
+
+        """
+        entry = self.node_property_table.get(k)
+        if entry is not None:
+            return entry
+        (element_uri, canonical_uri, predicate, property_name) = self.process_predicate(
+            k
+        )
+        if element_uri is None:
+            # not a biolink predicate
+            if k in self.reverse_predicate_mapping:
+                prop_uri = self.reverse_predicate_mapping[k]
+                # prop_uri = self.prefix_manager.contract(prop_uri)
             else:
-                s = self.uriref(record["subject"])
-                p = self.uriref(record["predicate"])
-                o = self.uriref(record["object"])
-                self._write_triple(s, p, o)
-        for t in ecache:
-            self._write_triple(t[0], t[1], t[2])
+                prop_uri = k
+        else:
+            prop_uri = canonical_uri if canonical_uri else element_uri
+        prop_type = self._get_property_type(prop_uri)
+        log.debug(f"prop {k} has prop_uri {prop_uri} and prop_type {prop_type}")
+        entry = self.node_property_table[k] = (
+            self._format_iri(self._expand(prop_uri)),
+            prop_type,
+        )
+        return entry
+
+    def _edge_property(self, prop: str) -> Tuple[str, str]:
+        """
+        Get the predicate and type of the triples for a property
+        of reified edges, from the property table of edges.
+
+        Parameters
+        ----------
+        prop: str
+            The property name
+
+        Returns
+        -------
+        Tuple[str, str]
+            The predicate, formatted for N-Triples, and the property type
+
+        """
+        entry = self.edge_property_table.get(prop)
+        if entry is not None:
+            return entry
+        (element_uri, canonical_uri, predicate, property_name) = self.process_predicate(
+            prop
+        )
+        if element_uri:
+            prop_uri = canonical_uri if canonical_uri else element_uri
+        else:
+            if prop in self.reverse_predicate_mapping:
+                prop_uri = self.reverse_predicate_mapping[prop]
+                # prop_uri = self.prefix_manager.contract(prop_uri)
+            else:
+                prop_uri = predicate
+        prop_type = self._get_property_type(prop)
+        log.debug(f"prop {prop} has prop_uri {prop_uri} and prop_type {prop_type}")
+        entry = self.edge_property_table[prop] = (
+            self._format_iri(self._expand(prop_uri)),
+            prop_type,
+        )
+        return entry
 
     def uriref(self, identifier: str) -> URIRef:
         """
@@ -295,44 +359,89 @@ class RdfSink(Sink):
         rdflib.URIRef
             URIRef form of the input ``identifier``
 
+        """
+        return URIRef(self._expand(identifier))
+
+    def _expand(self, identifier: str) -> str:
+        """
+        Get the IRI for a given string, where the IRIs that the prefixes
+        of CURIEs expand to are looked up once.
+
+        Parameters
+        ----------
+        identifier: str
+            Identifier as string.
+
+        Returns
+        -------
+        str
+            The IRI of the input ``identifier``
+
         """
         if identifier.startswith("urn:uuid:"):
-            uri = identifier
-        elif identifier in reverse_property_mapping:
+            return identifier
+        if identifier in reverse_property_mapping:
             # identifier is a property
-            uri = reverse_property_mapping[identifier]
-        else:
-            # identifier is an entity
-            fixed_identifier = identifier
-            if fixed_identifier.startswith(":"):
-                # TODO: this should be handled upstream by prefixcommons-py
-                fixed_identifier = fixed_identifier.replace(":", "", 1)
-            if " " in identifier:
-                fixed_identifier = fixed_identifier.replace(" ", "_")
-
-            if self.prefix_manager.is_curie(fixed_identifier):
-                uri = self.prefix_manager.expand(fixed_identifier)
-                if fixed_identifier == uri:
-                    uri = self.DEFAULT.term(fixed_identifier)
-            elif self.prefix_manager.is_iri(fixed_identifier):
-                uri = fixed_identifier
+            return reverse_property_mapping[identifier]
+        # identifier is an entity
+        fixed_identifier = identifier
+        if fixed_identifier.startswith(":"):
+            # TODO: this should be handled upstream by prefixcommons-py
+            fixed_identifier = fixed_identifier.replace(":", "", 1)
+        if " " in identifier:
+            fixed_identifier = fixed_identifier.replace(" ", "_")
+
+        if CURIE_PATTERN.match(fixed_identifier):
+            prefix, reference = fixed_identifier.split(":", 1)
+            if prefix in self.expansions:
+                expansion = self.expansions[prefix]
             else:
-                uri = self.DEFAULT.term(fixed_identifier)
-            # if identifier == uri:
-            #     if PrefixManager.is_curie(identifier):
-            #         identifier = identifier.replace(':', '_')
-        return URIRef(uri)
+                expansion = self.prefix_manager.expand(f"{prefix}:")
+                if expansion == f"{prefix}:":
+                    expansion = None
+                self.expansions[prefix] = expansion
+            if expansion is None:
+                return self.DEFAULT + fixed_identifier
+            return expansion + reference
+        elif PrefixManager.is_iri(fixed_identifier):
+            return fixed_identifier
+        else:
+            return self.DEFAULT + fixed_identifier
 
-    def _prepare_object(
-        self, prop: str, prop_type: str, value: Any
-    ) -> rdflib.term.Identifier:
+    @staticmethod
+    def _format_iri(iri: str) -> str:
         """
-        Prepare the object of a triple.
+        Format an IRI as an N-Triples term.
+
+        Parameters
+        ----------
+        iri: str
+            The IRI
+
+        Returns
+        -------
+        str
+            The N-Triples term
+
+        """
+        if r_invalid_iri.search(iri):
+            raise Exception(
+                f'"{iri}" does not look like a valid URI, I cannot serialize this as N3/Turtle. '
+                f"Perhaps you wanted to urlencode it?"
+            )
+        return f"<{iri}>"
+
+    def _format_object(self, prop_type: str, value: Any) -> str:
+        """
+        Format the object of a triple as an N-Triples term.
+
+        Values of ``uriorcurie`` and ``xsd:anyURI`` properties are IRIs,
+        with CURIEs expanded, or plain literals if they are not valid
+        IRIs. Other values are literals, typed by their ``xsd`` property
+        type, or ``xsd:string`` for any other property type.
 
         Parameters
         ----------
-        prop: str
-            property name
         prop_type: str
             property type
         value: Any
@@ -340,25 +449,28 @@ class RdfSink(Sink):
 
         Returns
         -------
-        rdflib.term.Identifier
-            An instance of rdflib.term.Identifier
+        str
+            The N-Triples term
 
         """
         if prop_type == "uriorcurie" or prop_type == "xsd:anyURI":
-            if isinstance(value, str) and PrefixManager.is_curie(value):
-                o = self.uriref(value)
-            elif isinstance(value, str) and PrefixManager.is_iri(value):
-                if _is_valid_uri(value):
-                    o = URIRef(value)
-                else:
-                    o = Literal(value)
+            if isinstance(value, str):
+                if CURIE_PATTERN.match(value):
+                    return self._format_iri(self._expand(value))
+                if PrefixManager.is_iri(value) and not r_invalid_iri.search(value):
+                    return f"<{value}>"
+                return _quote_encode(value)
+            return _quoteLiteral(Literal(value))
+        datatype = self.datatypes.get(prop_type)
+        if datatype is None:
+            if prop_type.startswith("xsd"):
+                datatype = self.prefix_manager.expand(prop_type)
             else:
-                o = Literal(value)
-        elif prop_type.startswith("xsd"):
-            o = Literal(value, datatype=self.prefix_manager.expand(prop_type))
-        else:
-            o = Literal(value, datatype=self.prefix_manager.expand("xsd:string"))
-        return o
+                datatype = self.prefix_manager.expand("xsd:string")
+            self.datatypes[prop_type] = datatype
+        if datatype == XSD_STRING and isinstance(value, str):
+            return f"{_quote_encode(value)}^^<{XSD_STRING}>"
+        return _quoteLiteral(Literal(value, datatype=datatype))
 
     def _get_property_type(self, p: str) -> str:
         """
@@ -429,65 +541,53 @@ class RdfSink(Sink):
             the CURIE form of p, the reference of p
 
         """
-        if p in self.cache:
+        entry = self.cache.get(p)
+        if entry is not None:
             # already processed this predicate before; pull from cache
-            element_uri = self.cache[p]["element_uri"]
-            canonical_uri = self.cache[p]["canonical_uri"]
-            predicate = self.cache[p]["predicate"]
-            property_name = self.cache[p]["property_name"]
+            return entry
+        # haven't seen this property before; map to element
+        if self.prefix_manager.is_iri(p):
+            predicate = self.prefix_manager.contract(str(p))
         else:
-            # haven't seen this property before; map to element
-            if self.prefix_manager.is_iri(p):
-                predicate = self.prefix_manager.contract(str(p))
-            else:
-                predicate = None
-            if self.prefix_manager.is_curie(p):
-                property_name = self.prefix_manager.get_reference(p)
-                predicate = p
+            predicate = None
+        if self.prefix_manager.is_curie(p):
+            property_name = self.prefix_manager.get_reference(p)
+            predicate = p
+        else:
+            if predicate and self.prefix_manager.is_curie(predicate):
+                property_name = self.prefix_manager.get_reference(predicate)
             else:
-                if predicate and self.prefix_manager.is_curie(predicate):
-                    property_name = self.prefix_manager.get_reference(predicate)
-                else:
-                    property_name = p
-                    predicate = f":{p}"
-            element = self.get_biolink_element(p)
-            canonical_uri = None
-            if element:
-                if isinstance(element, SlotDefinition):
-                    # predicate corresponds to a biolink slot
-                    if element.definition_uri:
-                        element_uri = self.prefix_manager.contract(
-                            element.definition_uri
-                        )
-                    else:
-                        element_uri = (
-                            f"biolink:{sentencecase_to_snakecase(element.name)}"
-                        )
-                    if element.slot_uri:
-                        canonical_uri = element.slot_uri
-                elif isinstance(element, ClassDefinition):
-                    # this will happen only when the IRI is actually
-                    # a reference to a class
-                    element_uri = self.prefix_manager.contract(element.class_uri)
+                property_name = p
+                predicate = f":{p}"
+        element = self.get_biolink_element(p)
+        canonical_uri = None
+        if element:
+            if isinstance(element, SlotDefinition):
+                # predicate corresponds to a biolink slot
+                if element.definition_uri:
+                    element_uri = self.prefix_manager.contract(element.definition_uri)
                 else:
-                    element_uri = f"biolink:{sentencecase_to_camelcase(element.name)}"
-                if "biolink:Attribute" in get_biolink_ancestors(element.name):
                     element_uri = f"biolink:{sentencecase_to_snakecase(element.name)}"
-                if not predicate:
-                    predicate = element_uri
+                if element.slot_uri:
+                    canonical_uri = element.slot_uri
+            elif isinstance(element, ClassDefinition):
+                # this will happen only when the IRI is actually
+                # a reference to a class
+                element_uri = self.prefix_manager.contract(element.class_uri)
             else:
-                # no mapping to biolink model;
-                # look at predicate mappings
-                element_uri = None
-                if p in self.reverse_predicate_mapping:
-                    property_name = self.reverse_predicate_mapping[p]
-                    predicate = f":{property_name}"
-            self.cache[p] = {
-                "element_uri": element_uri,
-                "canonical_uri": canonical_uri,
-                "predicate": predicate,
-                "property_name": property_name,
-            }
+                element_uri = f"biolink:{sentencecase_to_camelcase(element.name)}"
+            if "biolink:Attribute" in get_biolink_ancestors(element.name):
+                element_uri = f"biolink:{sentencecase_to_snakecase(element.name)}"
+            if not predicate:
+                predicate = element_uri
+        else:
+            # no mapping to biolink model;
+            # look at predicate mappings
+            element_uri = None
+            if p in self.reverse_predicate_mapping:
+                property_name = self.reverse_predicate_mapping[p]
+                predicate = f":{property_name}"
+        self.cache[p] = (element_uri, canonical_uri, predicate, property_name)
         return element_uri, canonical_uri, predicate, property_name
 
     def get_biolink_element(self, predicate: Any) -> Optional[Element]:
@@ -568,4 +668,5 @@ class RdfSink(Sink):
         """
         Perform any operations after writing the file.
         """
+        self._flush()
         self.FH.close()
@@ -1,4 +1,4 @@
-from typing import Dict
+from typing import Dict, List
 
 from kgx.prefix_manager import PrefixManager
 
@@ -50,6 +50,38 @@ class Sink(object):
         """
         pass
 
+    def write_nodes(self, records: List) -> None:
+        """
+        Write a batch of node records to the underlying store.
+
+        By default, each record is written via ``write_node``.
+        Sinks that support bulk writes should override this method.
+
+        Parameters
+        ----------
+        records: List
+            A list of node records
+
+        """
+        for record in records:
+            self.write_node(record)
+
+    def write_edges(self, records: List) -> None:
+        """
+        Write a batch of edge records to the underlying store.
+
+        By default, each record is written via ``write_edge``.
+        Sinks that support bulk writes should override this method.
+
+        Parameters
+        ----------
+        records: List
+            A list of edge records
+
+        """
+        for record in records:
+            self.write_edge(record)
+
     def finalize(self) -> None:
         """
         Operations that ought to be done after
@@ -1,15 +1,17 @@
 import os
-import tarfile
-from typing import Optional, Dict, Set, Any, List
+from typing import Optional, Dict, Set, Any, List, Callable, Tuple
 from ordered_set import OrderedSet
 
 from kgx.sink.sink import Sink
+from kgx.utils.archive_utils import TarStreamWriter
 from kgx.utils.kgx_utils import (
     extension_types,
     archive_write_mode,
     archive_format,
     remove_null,
     _sanitize_export,
+    column_types,
+    LIST_DELIMITER,
 )
 
 
@@ -24,6 +26,9 @@ DEFAULT_EDGE_COLUMNS = {
     "provided_by",
 }
 
+# Number of rows that are buffered before being written to file
+DEFAULT_BUFFER_SIZE = 10000
+
 
 class TsvSink(Sink):
     """
@@ -38,7 +43,11 @@ class TsvSink(Sink):
     compression: str
         The compression type (``tar``, ``tar.gz``)
     kwargs: Any
-        Any additional arguments
+        Any additional arguments. ``buffer_size`` sets the number
+        of rows that are buffered before being written to file.
+        ``compression_level`` and ``compression_threads`` set the
+        compression level and the number of compression threads
+        for ``tar.gz`` and ``tar.bz2``.
     """
 
     def __init__(
@@ -74,16 +83,42 @@ class TsvSink(Sink):
             self.edge_properties.update(DEFAULT_EDGE_COLUMNS)
         self.ordered_node_columns = TsvSink._order_node_columns(self.node_properties)
         self.ordered_edge_columns = TsvSink._order_edge_columns(self.edge_properties)
+        self.node_projection = TsvSink._build_projection(
+            self.ordered_node_columns, raw={"id"}
+        )
+        self.edge_projection = TsvSink._build_projection(self.ordered_edge_columns)
+        self.buffer_size = int(kwargs.get("buffer_size", DEFAULT_BUFFER_SIZE))
+        self.node_buffer: List[str] = []
+        self.edge_buffer: List[str] = []
 
         self.nodes_file_name = os.path.join(
             self.dirname if self.dirname else "", self.nodes_file_basename
         )
-        self.NFH = open(self.nodes_file_name, "w")
-        self.NFH.write(self.delimiter.join(self.ordered_node_columns) + "\n")
         self.edges_file_name = os.path.join(
             self.dirname if self.dirname else "", self.edges_file_basename
         )
-        self.EFH = open(self.edges_file_name, "w")
+        if self.mode:
+            archive_basename = f"{self.basename}.{archive_format[self.mode]}"
+            archive_name = os.path.join(
+                self.dirname if self.dirname else "", archive_basename
+            )
+            # nodes are streamed directly to the archive while edges are
+            # spooled and appended, such that nodes are the first member
+            self.archive: Optional[TarStreamWriter] = TarStreamWriter(
+                archive_name,
+                mode=self.mode,
+                stream_member=self.nodes_file_basename,
+                compression_level=int(kwargs.get("compression_level", 9)),
+                threads=int(kwargs.get("compression_threads", 1)),
+                spool_dir=self.dirname if self.dirname else None,
+            )
+            self.NFH = self.archive.open(self.nodes_file_basename)
+            self.EFH = self.archive.open(self.edges_file_basename)
+        else:
+            self.archive = None
+            self.NFH = open(self.nodes_file_name, "w")
+            self.EFH = open(self.edges_file_name, "w")
+        self.NFH.write(self.delimiter.join(self.ordered_node_columns) + "\n")
         self.EFH.write(self.delimiter.join(self.ordered_edge_columns) + "\n")
 
     def write_node(self, record: Dict) -> None:
@@ -96,15 +131,23 @@ class TsvSink(Sink):
             A node record
 
         """
-        row = self._build_export_row(record)
-        row["id"] = record["id"]
-        values = []
-        for c in self.ordered_node_columns:
-            if c in row:
-                values.append(str(row[c]))
-            else:
-                values.append("")
-        self.NFH.write(self.delimiter.join(values) + "\n")
+        self.node_buffer.append(self._build_node_line(record))
+        if len(self.node_buffer) >= self.buffer_size:
+            self._flush_nodes()
+
+    def write_nodes(self, records: List) -> None:
+        """
+        Write a batch of node records to the underlying store.
+
+        Parameters
+        ----------
+        records: List
+            A list of node records
+
+        """
+        self.node_buffer.extend([self._build_node_line(x) for x in records])
+        if len(self.node_buffer) >= self.buffer_size:
+            self._flush_nodes()
 
     def write_edge(self, record: Dict) -> None:
         """
@@ -116,57 +159,172 @@ class TsvSink(Sink):
             An edge record
 
         """
-        row = self._build_export_row(record)
-        values = []
-        for c in self.ordered_edge_columns:
-            if c in row:
-                values.append(str(row[c]))
-            else:
-                values.append("")
-        self.EFH.write(self.delimiter.join(values) + "\n")
+        self.edge_buffer.append(self._build_edge_line(record))
+        if len(self.edge_buffer) >= self.buffer_size:
+            self._flush_edges()
+
+    def write_edges(self, records: List) -> None:
+        """
+        Write a batch of edge records to the underlying store.
+
+        Parameters
+        ----------
+        records: List
+            A list of edge records
+
+        """
+        self.edge_buffer.extend([self._build_edge_line(x) for x in records])
+        if len(self.edge_buffer) >= self.buffer_size:
+            self._flush_edges()
+
+    def _flush_nodes(self) -> None:
+        """
+        Write buffered node rows to file.
+        """
+        self.NFH.write("".join(self.node_buffer))
+        self.node_buffer = []
+
+    def _flush_edges(self) -> None:
+        """
+        Write buffered edge rows to file.
+        """
+        self.EFH.write("".join(self.edge_buffer))
+        self.edge_buffer = []
+
+    def _build_node_line(self, record: Dict) -> str:
+        """
+        Build a delimited line for a node record.
+
+        Parameters
+        ----------
+        record: Dict
+            A node record
+
+        Returns
+        -------
+        str
+            The delimited line, including the line terminator
+
+        """
+        values = [
+            f(record[c]) if c in record else "" for c, f in self.node_projection
+        ]
+        return self.delimiter.join(values) + "\n"
+
+    def _build_edge_line(self, record: Dict) -> str:
+        """
+        Build a delimited line for an edge record.
+
+        Parameters
+        ----------
+        record: Dict
+            An edge record
+
+        Returns
+        -------
+        str
+            The delimited line, including the line terminator
+
+        """
+        values = [
+            f(record[c]) if c in record else "" for c, f in self.edge_projection
+        ]
+        return self.delimiter.join(values) + "\n"
 
     def finalize(self) -> None:
         """
-        Close file handles and create an archive if compression mode is defined.
+        Close file handles, or the archive if compression mode is defined.
         """
-        self.NFH.close()
-        self.EFH.close()
-        if self.mode:
-            archive_basename = f"{self.basename}.{archive_format[self.mode]}"
-            archive_name = os.path.join(
-                self.dirname if self.dirname else "", archive_basename
-            )
-            with tarfile.open(name=archive_name, mode=self.mode) as tar:
-                tar.add(self.nodes_file_name, arcname=self.nodes_file_basename)
-                tar.add(self.edges_file_name, arcname=self.edges_file_basename)
-                if os.path.isfile(self.nodes_file_name):
-                    os.remove(self.nodes_file_name)
-                if os.path.isfile(self.edges_file_name):
-                    os.remove(self.edges_file_name)
+        self._flush_nodes()
+        self._flush_edges()
+        if self.archive:
+            self.archive.close()
+        else:
+            self.NFH.close()
+            self.EFH.close()
+
+    @staticmethod
+    def _build_projection(
+        columns: OrderedSet, raw: Optional[Set] = None
+    ) -> List[Tuple[str, Callable]]:
+        """
+        Resolve, once, how the value of each of the given columns is exported.
+
+        Parameters
+        ----------
+        columns: OrderedSet
+            Columns in the order that they are written
+        raw: Optional[Set]
+            Columns whose values are written as is
+
+        Returns
+        -------
+        List[Tuple[str, Callable]]
+            A list of columns and their export functions
+
+        """
+        raw = raw if raw else set()
+        return [
+            (c, str if c in raw else TsvSink._column_formatter(c)) for c in columns
+        ]
 
     @staticmethod
-    def _build_export_row(data: Dict) -> Dict:
+    def _column_formatter(key: str) -> Callable[[Any], str]:
         """
-        Casts all values to primitive types like str or bool according to the
-        specified type in ``_column_types``. Lists become pipe delimited strings.
+        Get a function that exports values for a given key as str.
+
+        The result is the same as ``_build_export_row``, but str values,
+        and lists of str for list-typed keys, are handled without going
+        through ``remove_null`` and ``_sanitize_export``.
 
         Parameters
         ----------
-        data: Dict
-            A dictionary containing key-value pairs
+        key: str
+            Key corresponding to a node/edge property
 
         Returns
         -------
-        Dict
-            A dictionary containing processed key-value pairs
+        Callable[[Any], str]
+            A function that takes a value and returns it as str
 
         """
-        tidy_data = {}
-        for key, value in data.items():
-            new_value = remove_null(value)
-            if new_value:
-                tidy_data[key] = _sanitize_export(key, new_value)
-        return tidy_data
+
+        def export(value: Any) -> str:
+            value = remove_null(value)
+            return str(_sanitize_export(key, value)) if value else ""
+
+        key_type = column_types.get(key)
+        if key_type == bool:
+            return export
+        known_list = key_type == list
+        unknown = key_type is None
+
+        def export_fast(value: Any) -> str:
+            t = type(value)
+            if t is str:
+                if value == "" or value == " ":
+                    return ""
+                return value.replace("\n", " ").replace('\\"', "").replace("\t", " ")
+            if value is None:
+                return ""
+            if t is list and (known_list or unknown):
+                if not all(type(x) is str for x in value):
+                    return export(value)
+                value = [x for x in value if x != "" and x != " "]
+                if not value:
+                    return ""
+                if unknown:
+                    # as done by _sanitize_export
+                    column_types.setdefault(key, list)
+                return (
+                    LIST_DELIMITER.join(value)
+                    .replace("\n", " ")
+                    .replace('\\"', "")
+                    .replace("\t", " ")
+                )
+            return export(value)
+
+        return export_fast
 
     @staticmethod
     def _order_node_columns(cols: Set) -> OrderedSet:
@@ -258,6 +416,9 @@ class TsvSink(Sink):
         """
         self._node_properties.update(node_properties)
         self.ordered_node_columns = TsvSink._order_node_columns(self._node_properties)
+        self.node_projection = TsvSink._build_projection(
+            self.ordered_node_columns, raw={"id"}
+        )
 
     def set_edge_properties(self, edge_properties: List) -> None:
         """
@@ -271,3 +432,4 @@ class TsvSink(Sink):
         """
         self._edge_properties.update(edge_properties)
         self.ordered_edge_columns = TsvSink._order_edge_columns(self._edge_properties)
+        self.edge_projection = TsvSink._build_projection(self.ordered_edge_columns)
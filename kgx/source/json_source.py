@@ -1,10 +1,12 @@
-import gzip
-from typing import Optional, Generator, Any
+import pickle
+import tempfile
+from typing import Optional, Generator, Any, Iterator, List, Tuple
 
 import ijson
-from itertools import chain
 
 from kgx.source.tsv_source import TsvSource
+from kgx.utils.archive_utils import open_input
+from kgx.utils.json_utils import read_json_items
 
 
 class JsonSource(TsvSource):
@@ -34,7 +36,7 @@ class JsonSource(TsvSource):
         format: str
             The format (``json``)
         compression: Optional[str]
-            The compression type (``gz``)
+            The compression type (``gz``, ``bz2``, ``xz``, ``zst``)
         kwargs: Any
             Any additional arguments
 
@@ -48,9 +50,87 @@ class JsonSource(TsvSource):
         self.set_provenance_map(kwargs)
 
         self.compression = compression
-        n = self.read_nodes(filename)
-        e = self.read_edges(filename)
-        yield from chain(n, e)
+        yield from self.read_records(filename)
+
+    def read_records(
+        self,
+        filename: str,
+        nodes_prefix: str = "nodes.item",
+        edges_prefix: str = "edges.item",
+    ) -> Generator:
+        """
+        Read node and edge records from a JSON, in a single pass.
+
+        Nodes are yielded before edges. Edges that appear in the JSON
+        before any node are spilled to a temporary file, and are yielded
+        once all the nodes have been read.
+
+        Parameters
+        ----------
+        filename: str
+            The filename to read from
+        nodes_prefix: str
+            The ijson prefix for node objects
+        edges_prefix: str
+            The ijson prefix for edge objects
+
+        Returns
+        -------
+        Generator
+            A generator for node and edge records
+
+        """
+        with open_input(filename, self.compression) as FH:
+            batches = (
+                (prefix == nodes_prefix, items)
+                for prefix, items in read_json_items(FH, [nodes_prefix, edges_prefix])
+            )
+            yield from self.read_batches(batches)
+
+    def read_batches(self, batches: Iterator[Tuple[bool, List]]) -> Generator:
+        """
+        Read batches of node and edge objects, and yield records.
+
+        Nodes are yielded before edges. Batches of edges that come before
+        any batch of nodes are spilled to a temporary file, and are yielded
+        once all the nodes have been read.
+
+        Parameters
+        ----------
+        batches: Iterator[Tuple[bool, List]]
+            An iterator for tuples of whether the batch is a batch of nodes,
+            and a batch of node or edge objects
+
+        Returns
+        -------
+        Generator
+            A generator for node and edge records
+
+        """
+        spill = None
+        seen_nodes = False
+        for is_node, items in batches:
+            if is_node:
+                seen_nodes = True
+                for n in items:
+                    yield self.read_node(n)
+            elif seen_nodes:
+                for e in items:
+                    yield self.read_edge(e)
+            else:
+                if spill is None:
+                    spill = tempfile.TemporaryFile()
+                pickle.dump(items, spill, pickle.HIGHEST_PROTOCOL)
+        if spill is not None:
+            with spill:
+                spill.seek(0)
+                while True:
+                    try:
+                        items = pickle.load(spill)
+                    except EOFError:
+                        break
+                    for e in items:
+                        yield self.read_edge(e)
 
     def read_nodes(self, filename: str) -> Generator:
         """
@@ -67,12 +147,9 @@ class JsonSource(TsvSource):
             A generator for node records
 
         """
-        if self.compression == "gz":
-            FH = gzip.open(filename, "rb")
-        else:
-            FH = open(filename, "rb")
-        for n in ijson.items(FH, "nodes.item"):
-            yield self.read_node(n)
+        with open_input(filename, self.compression) as FH:
+            for n in ijson.items(FH, "nodes.item"):
+                yield self.read_node(n)
 
     def read_edges(self, filename: str) -> Generator:
         """
@@ -89,9 +166,6 @@ class JsonSource(TsvSource):
             A generator for edge records
 
         """
-        if self.compression == "gz":
-            FH = gzip.open(filename, "rb")
-        else:
-            FH = open(filename, "rb")
-        for e in ijson.items(FH, "edges.item"):
-            yield self.read_edge(e)
+        with open_input(filename, self.compression) as FH:
+            for e in ijson.items(FH, "edges.item"):
+                yield self.read_edge(e)
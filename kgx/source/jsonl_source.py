@@ -1,14 +1,13 @@
-import gzip
 import re
-import jsonlines
 from typing import Optional, Any, Generator, Dict
 
 from kgx.config import get_logger
+from kgx.source.json_source import JsonSource
+from kgx.utils.archive_utils import open_input
+from kgx.utils.json_utils import read_jsonl
 
 log = get_logger()
 
-from kgx.source.json_source import JsonSource
-
 
 class JsonlSource(JsonSource):
     """
@@ -36,7 +35,7 @@ class JsonlSource(JsonSource):
         format: str
             The format (``json``)
         compression: Optional[str]
-            The compression type (``gz``)
+            The compression type (``gz``, ``bz2``, ``xz``, ``zst``)
         kwargs: Any
             Any additional arguments
 
@@ -60,12 +59,6 @@ class JsonlSource(JsonSource):
             )
             return
 
-        if compression == "gz":
-            with gzip.open(filename, "rb") as FH:
-                reader = jsonlines.Reader(FH)
-                for obj in reader:
-                    yield m(obj)
-        else:
-            with jsonlines.open(filename) as FH:
-                for obj in FH:
-                    yield m(obj)
+        with open_input(filename, compression) as FH:
+            for obj in read_jsonl(FH):
+                yield m(obj)
@@ -1,5 +1,8 @@
 import itertools
-from typing import Any, Dict, List, Optional, Iterator, Tuple, Generator
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Iterator, Tuple, Generator
 
 from neo4jrestclient.client import Node, Relationship, GraphDatabase
 from neo4jrestclient.query import CypherException
@@ -22,11 +25,19 @@ class NeoSource(Source):
     """
     NeoSource is responsible for reading data as records
     from a Neo4j instance.
+
+    Nodes and edges are read in pages of ranges of their internal IDs,
+    such that each page is looked up by ID, rather than by skipping all
+    the records of the previous pages. The pages are fetched by ``workers``
+    concurrent threads, each with its own connection, and are streamed
+    in order, nodes before edges.
     """
 
     def __init__(self):
         super().__init__()
         self.http_driver = None
+        self.driver_args: Dict = {}
+        self._local = threading.local()
         self.node_count = 0
         self.edge_count = 0
         self.seen_nodes = set()
@@ -42,6 +53,7 @@ class NeoSource(Source):
         end: int = None,
         is_directed: bool = True,
         page_size: int = 50000,
+        workers: int = 1,
         **kwargs: Any,
     ) -> Generator:
         """
@@ -67,7 +79,9 @@ class NeoSource(Source):
         is_directed: bool
             Whether or not the edges should be treated as directed
         page_size: int
-            The size of each page/batch fetched from Neo4j (``50000``)
+            The number of internal IDs of each page fetched from Neo4j (``50000``)
+        workers: int
+            The number of pages to fetch concurrently
         kwargs: Any
             Any additional arguments
 
@@ -77,9 +91,9 @@ class NeoSource(Source):
             A generator for records
 
         """
-        self.http_driver: GraphDatabase = GraphDatabase(
-            uri, username=username, password=password
-        )
+        self.driver_args = {"url": uri, "username": username, "password": password}
+        self.http_driver: GraphDatabase = GraphDatabase(**self.driver_args)
+        self._local.driver = self.http_driver
 
         self.set_provenance_map(kwargs)
 
@@ -87,14 +101,72 @@ class NeoSource(Source):
         self.node_filters = node_filters
         self.edge_filters = edge_filters
         for page in self.get_pages(
-            self.get_nodes, start, end, page_size=page_size, **kwargs
+            self.get_nodes,
+            start,
+            end,
+            page_size=page_size,
+            workers=workers,
+            max_id=self.get_max_id(),
+            **kwargs,
         ):
             yield from self.load_nodes(page)
         for page in self.get_pages(
-            self.get_edges, start, end, page_size=page_size, **kwargs
+            self.get_edges,
+            start,
+            end,
+            page_size=page_size,
+            workers=workers,
+            max_id=self.get_max_id(edges=True),
+            **kwargs,
         ):
             yield from self.load_edges(page)
 
+    def _get_driver(self) -> GraphDatabase:
+        """
+        Get the driver of the current thread, such that pages that are
+        fetched concurrently are fetched over separate connections.
+
+        Returns
+        -------
+        GraphDatabase
+            The driver
+
+        """
+        driver = getattr(self._local, "driver", None)
+        if driver is None:
+            driver = GraphDatabase(**self.driver_args)
+            self._local.driver = driver
+        return driver
+
+    def get_max_id(self, edges: bool = False) -> Optional[int]:
+        """
+        Get the largest internal ID of the nodes, or edges, in the Neo4j
+        database.
+
+        Parameters
+        ----------
+        edges: bool
+            Whether to get the largest ID of the edges, rather than the nodes
+
+        Returns
+        -------
+        Optional[int]
+            The largest internal ID, or ``None`` if there are no nodes or edges
+
+        """
+        if edges:
+            query = "MATCH ()-[p]->() RETURN max(id(p))"
+        else:
+            query = "MATCH (n) RETURN max(id(n))"
+        log.debug(query)
+        max_id = None
+        try:
+            for result in self._get_driver().query(query):
+                max_id = result[0]
+        except CypherException as ce:
+            log.error(ce)
+        return max_id
+
     def count(self, is_directed: bool = True) -> int:
         """
         Get the total count of records to be fetched from the Neo4j database.
@@ -147,16 +219,20 @@ class NeoSource(Source):
             log.error(ce)
         return counts
 
-    def get_nodes(self, skip: int = 0, limit: int = 0, **kwargs: Any) -> List:
+    def get_nodes(
+        self, lower: int = 0, upper: Optional[int] = None, **kwargs: Any
+    ) -> List:
         """
-        Get a page of nodes from the Neo4j database.
+        Get a page of nodes from the Neo4j database, with internal IDs
+        from ``lower`` up to ``upper``.
 
         Parameters
         ----------
-        skip: int
-            Records to skip
-        limit: int
-            Total number of records to query for
+        lower: int
+            The lowest internal ID of the page
+        upper: Optional[int]
+            The internal ID after the page, or ``None`` for all the
+            nodes from ``lower``
         kwargs: Any
             Any additional arguments
 
@@ -166,7 +242,7 @@ class NeoSource(Source):
             A list of nodes
 
         """
-        query = f"MATCH (n)"
+        query = f"MATCH (n) WHERE {self.format_id_range('n', upper)}"
 
         if self.node_filters:
             qs = []
@@ -178,18 +254,20 @@ class NeoSource(Source):
                 qs.append(
                     f"({self.format_node_filter(self.node_filters, 'provided_by', 'n', '.', 'OR')})"
                 )
-            query += " WHERE "
+            query += " AND "
             query += " AND ".join(qs)
 
-        query += f" RETURN n SKIP {skip}"
-
-        if limit:
-            query += f" LIMIT {limit}"
+        query += " RETURN n"
 
         log.debug(query)
         nodes = []
         try:
-            results = self.http_driver.query(query, returns=Node, data_contents=True)
+            results = self._get_driver().query(
+                query,
+                params={"lower": lower, "upper": upper},
+                returns=Node,
+                data_contents=True,
+            )
             if results:
                 nodes = [node[0] for node in results.rows]
         except CypherException as ce:
@@ -197,17 +275,23 @@ class NeoSource(Source):
         return nodes
 
     def get_edges(
-        self, skip: int = 0, limit: int = 0, is_directed: bool = True, **kwargs: Any
+        self,
+        lower: int = 0,
+        upper: Optional[int] = None,
+        is_directed: bool = True,
+        **kwargs: Any,
     ) -> List:
         """
-        Get a page of edges from the Neo4j database.
+        Get a page of edges from the Neo4j database, with internal IDs
+        from ``lower`` up to ``upper``.
 
         Parameters
         ----------
-        skip: int
-            Records to skip
-        limit: int
-            Total number of records to query for
+        lower: int
+            The lowest internal ID of the page
+        upper: Optional[int]
+            The internal ID after the page, or ``None`` for all the
+            edges from ``lower``
         is_directed: bool
             Are edges directed or undirected (``True``, by default, since edges in most cases are directed)
         kwargs: Any
@@ -220,7 +304,7 @@ class NeoSource(Source):
 
         """
         direction = "->" if is_directed else "-"
-        query = f"MATCH (s)-[p]{direction}(o)"
+        query = f"MATCH (s)-[p]{direction}(o) WHERE {self.format_id_range('p', upper)}"
 
         if self.edge_filters:
             qs = []
@@ -241,18 +325,18 @@ class NeoSource(Source):
                     qs.append(
                         f"({self.format_edge_filter(self.edge_filters, ksf, 'p', '.', 'OR')})"
                     )
-            query += " WHERE "
+            query += " AND "
             query += " AND ".join(qs)
-        query += f" RETURN s, p, o SKIP {skip}"
-
-        if limit:
-            query += f" LIMIT {limit}"
+        query += " RETURN s, p, o"
 
         log.debug(query)
         edges = []
         try:
-            results = self.http_driver.query(
-                query, returns=(Node, Relationship, Node), data_contents=True
+            results = self._get_driver().query(
+                query,
+                params={"lower": lower, "upper": upper},
+                returns=(Node, Relationship, Node),
+                data_contents=True,
             )
             if results:
                 edges = [x for x in results.rows]
@@ -261,6 +345,32 @@ class NeoSource(Source):
 
         return edges
 
+    @staticmethod
+    def format_id_range(variable: str, upper: Optional[int] = None) -> str:
+        """
+        Get the condition on the internal ID of a node or edge for a page,
+        from the ``$lower`` parameter up to the ``$upper`` parameter.
+
+        The IDs of a bounded page are matched with a list, for which Neo4j
+        looks up the records by ID, rather than scanning all the records.
+
+        Parameters
+        ----------
+        variable: str
+            Variable binding for cypher query
+        upper: Optional[int]
+            The internal ID after the page, or ``None`` if the page is not bounded
+
+        Returns
+        -------
+        str
+            The condition, formatted for CQL
+
+        """
+        if upper is None:
+            return f"id({variable}) >= $lower"
+        return f"id({variable}) IN range($lower, $upper - 1)"
+
     def load_nodes(self, nodes: List) -> None:
         """
         Load nodes into an instance of BaseGraph
@@ -363,56 +473,85 @@ class NeoSource(Source):
 
     def get_pages(
         self,
-        query_function,
+        query_function: Callable,
         start: int = 0,
         end: Optional[int] = None,
         page_size: int = 50000,
+        workers: int = 1,
+        max_id: Optional[int] = None,
         **kwargs: Any,
     ) -> Iterator:
         """
-        Get pages of size ``page_size`` from Neo4j.
-        Returns an iterator of pages where number of pages is (``end`` - ``start``)/``page_size``
+        Get pages of records from Neo4j, for consecutive ranges of
+        ``page_size`` internal IDs, of which records ``start`` up to ``end``
+        are returned.
+
+        Pages are fetched by ``workers`` concurrent threads, with at most
+        twice as many pages in flight, and are returned in order.
 
         Parameters
         ----------
-        query_function: func
+        query_function: Callable
             The function to use to fetch records. Usually this is ``self.get_nodes`` or ``self.get_edges``
         start: int
-            Start for pagination
+            Number of records to skip
         end: Optional[int]
-            End for pagination
+            Number of records after which to stop
         page_size: int
-            Size of each page (``10000``, by default)
+            Number of internal IDs of each page (``50000``, by default)
+        workers: int
+            Number of pages to fetch concurrently
+        max_id: Optional[int]
+            The largest internal ID of the records, or ``None`` to stop at the first
+            empty page, which is only suitable if there are no gaps between IDs
         kwargs: Dict
             Any additional arguments that might be relevant for ``query_function``
 
         Returns
         -------
         Iterator
-            An iterator for a list of records from Neo4j. The size of the list is ``page_size``
+            An iterator for a list of records from Neo4j. The size of the list is
+            at most ``page_size``, or twice as large for undirected edges
 
         """
-        # TODO: use async
-        # itertools.count(0) starts counting from zero, and would run indefinitely without a return statement.
-        # it's distinguished from applying a while loop via providing an index which is formative with the for statement
-        for i in itertools.count(0):
-            # First halt condition: page pointer exceeds the number of values allowed to be returned in total
-            skip = start + (page_size * i)
-            limit = page_size if end is None or skip + page_size <= end else end - skip
-            if limit <= 0:
-                return
-            # execute query_function to get records
-            records = query_function(skip=skip, limit=limit, **kwargs)
-            # Second halt condition: no more data available
-            if records:
-                """
-                * Yield halts execution until next call
-                * Thus, the function continues execution upon next call
-                * Therefore, a new page is calculated before record is instantiated again
-                """
-                yield records
-            else:
-                return
+        if max_id is None:
+            lowers = itertools.count(0, page_size)
+        else:
+            lowers = iter(range(0, max_id + 1, page_size))
+        executor = ThreadPoolExecutor(workers) if workers > 1 else None
+        pending: deque = deque()
+        count = 0
+        try:
+            while end is None or count < end:
+                if executor is not None:
+                    for lower in itertools.islice(lowers, 2 * workers - len(pending)):
+                        pending.append(
+                            executor.submit(
+                                query_function, lower, lower + page_size, **kwargs
+                            )
+                        )
+                    if not pending:
+                        return
+                    records = pending.popleft().result()
+                else:
+                    lower = next(lowers, None)
+                    if lower is None:
+                        return
+                    records = query_function(lower, lower + page_size, **kwargs)
+                if not records:
+                    if max_id is None:
+                        return
+                    continue
+                first = max(0, start - count)
+                last = len(records) if end is None else min(len(records), end - count)
+                count += len(records)
+                if first < last:
+                    yield records[first:last]
+        finally:
+            if executor is not None:
+                for future in pending:
+                    future.cancel()
+                executor.shutdown()
 
     @staticmethod
     def format_node_filter(
@@ -1,17 +1,34 @@
-import gzip
-from itertools import chain
 from typing import Optional, Dict, Generator, Any
 import ijson
 import stringcase
-from bmt import Toolkit
 
 from kgx.prefix_manager import PrefixManager
 from kgx.config import get_logger
 from kgx.source.json_source import JsonSource
-from kgx.utils.kgx_utils import get_biolink_element, format_biolink_slots
+from kgx.utils.archive_utils import open_input
+from kgx.utils.kgx_utils import (
+    get_biolink_element,
+    format_biolink_slots,
+    get_toolkit,
+)
 
 log = get_logger()
 
+# TODO: the mapping should be via biolink-model lookups
+PREFIX_CATEGORIES = {
+    "HP": "biolink:PhenotypicFeature",
+    "CHEBI": "biolink:ChemicalSubstance",
+    "MONDO": "biolink:Disease",
+    "UBERON": "biolink:AnatomicalEntity",
+    "SO": "biolink:SequenceFeature",
+    "CL": "biolink:Cell",
+    "PR": "biolink:Protein",
+    "NCBITaxon": "biolink:OrganismalEntity",
+}
+
+# Categories of OBO namespaces, which are shared by all instances of ObographSource
+category_index: Dict[str, str] = {}
+
 
 class ObographSource(JsonSource):
     """
@@ -24,7 +41,7 @@ class ObographSource(JsonSource):
 
     def __init__(self):
         super().__init__()
-        self.toolkit = Toolkit()
+        self.toolkit = get_toolkit()
         self.ecache: Dict = {}
 
     def parse(
@@ -44,7 +61,7 @@ class ObographSource(JsonSource):
         format: str
             The format (``json``)
         compression: Optional[str]
-            The compression type (``gz``)
+            The compression type (``gz``, ``bz2``, ``xz``, ``zst``)
         kwargs: Any
             Any additional arguments
 
@@ -56,9 +73,10 @@ class ObographSource(JsonSource):
         """
         self.set_provenance_map(kwargs)
 
-        n = self.read_nodes(filename, compression)
-        e = self.read_edges(filename, compression)
-        yield from chain(n, e)
+        self.compression = compression
+        yield from self.read_records(
+            filename, "graphs.item.nodes.item", "graphs.item.edges.item"
+        )
 
     def read_nodes(self, filename: str, compression: Optional[str] = None) -> Generator:
         """
@@ -77,12 +95,9 @@ class ObographSource(JsonSource):
             A generator for node records
 
         """
-        if compression and compression == "gz":
-            FH = gzip.open(filename, "rb")
-        else:
-            FH = open(filename, "rb")
-        for n in ijson.items(FH, "graphs.item.nodes.item"):
-            yield self.read_node(n)
+        with open_input(filename, compression) as FH:
+            for n in ijson.items(FH, "graphs.item.nodes.item"):
+                yield self.read_node(n)
 
     def read_node(self, node: Dict) -> Dict:
         """
@@ -152,12 +167,9 @@ class ObographSource(JsonSource):
             A generator for edge records
 
         """
-        if compression == "gz":
-            FH = gzip.open(filename, "rb")
-        else:
-            FH = open(filename, "rb")
-        for e in ijson.items(FH, "graphs.item.edges.item"):
-            yield self.read_edge(e)
+        with open_input(filename, compression) as FH:
+            for e in ijson.items(FH, "graphs.item.edges.item"):
+                yield self.read_edge(e)
 
     def read_edge(self, edge: Dict) -> Dict:
         """
@@ -240,42 +252,48 @@ class ObographSource(JsonSource):
         if "meta" in node and "basicPropertyValues" in node["meta"]:
             for p in node["meta"]["basicPropertyValues"]:
                 if p["pred"] == self.HAS_OBO_NAMESPACE:
-                    category = p["val"]
-                    element = self.toolkit.get_element(category)
-                    if element:
-                        category = f"biolink:{stringcase.pascalcase(stringcase.snakecase(element.name))}"
-                    else:
-                        element = self.toolkit.get_element_by_mapping(category)
-                        if element:
-                            category = f"biolink:{stringcase.pascalcase(stringcase.snakecase(element.name))}"
-                        else:
-                            category = "biolink:OntologyClass"
+                    category = self.get_namespace_category(p["val"])
 
         if not category or category == "biolink:OntologyClass":
             prefix = PrefixManager.get_prefix(curie)
-            # TODO: the mapping should be via biolink-model lookups
-            if prefix == "HP":
-                category = "biolink:PhenotypicFeature"
-            elif prefix == "CHEBI":
-                category = "biolink:ChemicalSubstance"
-            elif prefix == "MONDO":
-                category = "biolink:Disease"
-            elif prefix == "UBERON":
-                category = "biolink:AnatomicalEntity"
-            elif prefix == "SO":
-                category = "biolink:SequenceFeature"
-            elif prefix == "CL":
-                category = "biolink:Cell"
-            elif prefix == "PR":
-                category = "biolink:Protein"
-            elif prefix == "NCBITaxon":
-                category = "biolink:OrganismalEntity"
+            if prefix in PREFIX_CATEGORIES:
+                category = PREFIX_CATEGORIES[prefix]
             else:
                 log.debug(
                     f"{curie} Could not find a category mapping for '{category}'; Defaulting to 'biolink:OntologyClass'"
                 )
         return category
 
+    def get_namespace_category(self, namespace: str) -> str:
+        """
+        Get category for a given OBO namespace, which is looked up in the
+        Biolink Model once and then kept in an index that is shared by
+        all nodes, and by all instances of ObographSource.
+
+        Parameters
+        ----------
+        namespace: str
+            The OBO namespace of a node
+
+        Returns
+        -------
+        str
+            Category for the given namespace, which is ``biolink:OntologyClass``
+            if the namespace is not a Biolink element or mapping
+
+        """
+        category = category_index.get(namespace)
+        if category is None:
+            element = self.toolkit.get_element(namespace)
+            if not element:
+                element = self.toolkit.get_element_by_mapping(namespace)
+            if element:
+                category = f"biolink:{stringcase.pascalcase(stringcase.snakecase(element.name))}"
+            else:
+                category = "biolink:OntologyClass"
+            category_index[namespace] = category
+        return category
+
     def parse_meta(self, node: str, meta: Dict) -> Dict:
         """
         Parse 'meta' field of a node.
@@ -1,10 +1,19 @@
-from typing import Set, Optional, Generator, Any, Dict
+import itertools
+import os
+import pickle
+import tempfile
+from pathlib import Path
+from typing import Set, Optional, Generator, Any, Dict, IO, Iterator, List, Tuple
 
 import rdflib
-from rdflib import Namespace, URIRef, OWL, RDFS, RDF
+from rdflib import BNode, Namespace, URIRef, OWL, RDFS, RDF
+from rdflib.store import Store
 
 from kgx.config import get_logger
 from kgx.source import RdfSource
+from kgx.utils.archive_utils import open_input, detect_compression
+from kgx.utils.cache_utils import DiskCache
+from kgx.utils.rdf_utils import get_ontology_cache_dir, load_ontologies
 from kgx.utils.kgx_utils import (
     current_time_in_millis,
     generate_uuid,
@@ -16,6 +25,221 @@ from kgx.utils.kgx_utils import (
 
 log = get_logger()
 
+# Number of triples that are spooled to disk at a time
+SPOOL_BATCH_SIZE = 10000
+
+# Predicates of OWL restrictions, which are looked up by their blank node
+RESTRICTION_PREDICATES = {OWL.onProperty, OWL.someValuesFrom, OWL.allValuesFrom}
+
+# Predicates whose triples are spooled to a file of their own, to be read on their own
+SPOOLED_PREDICATES = {RDFS.subClassOf, OWL.equivalentClass}
+
+
+class SpoolStore(Store):
+    """
+    SpoolStore is an rdflib store, for OwlSource, that keeps few
+    triples in memory, such that an ontology can be loaded without
+    materializing it in an in-memory graph.
+
+    Triples are written to temporary files in batches, and a pattern
+    is matched by reading the files. The triples that OwlSource looks up
+    by subject, of OWL restrictions and object properties, and the
+    ``rdf:type owl:ObjectProperty`` and ``owl:imports`` triples, are
+    indexed in memory.
+
+    Only triples that OwlSource uses are kept: triples with a blank node
+    object are dropped, unless the predicate is ``rdfs:subClassOf`` or the
+    triple is of a restriction. Duplicate triples are not removed.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.count = 0
+        self.spools: Dict[Optional[URIRef], IO[bytes]] = {}
+        self.batches: Dict[Optional[URIRef], List[Tuple]] = {}
+        self.restrictions: Dict[Tuple[BNode, URIRef], List] = {}
+        self.object_properties: Dict[Any, None] = {}
+        self.imports: List[Tuple] = []
+        self.property_triples: Optional[Dict[Any, List[Tuple]]] = None
+
+    def add(self, triple: Tuple, context: Any, quoted: bool = False) -> None:
+        """
+        Add a triple to the store.
+
+        Parameters
+        ----------
+        triple: Tuple
+            A triple
+        context: Any
+            The graph that the triple is added to
+        quoted: bool
+            Whether the triple is quoted, which is not supported
+
+        """
+        s, p, o = triple
+        self.count += 1
+        if isinstance(s, BNode) and p in RESTRICTION_PREDICATES:
+            self.restrictions.setdefault((s, p), []).append(o)
+            return
+        if p == RDF.type and o == OWL.ObjectProperty:
+            self.object_properties[s] = None
+        elif p == OWL.imports:
+            self.imports.append(triple)
+        if isinstance(o, BNode) and p != RDFS.subClassOf:
+            return
+        key = p if p in SPOOLED_PREDICATES else None
+        batch = self.batches.setdefault(key, [])
+        batch.append(triple)
+        if len(batch) >= SPOOL_BATCH_SIZE:
+            self._flush(key)
+        self.property_triples = None
+
+    def _flush(self, key: Optional[URIRef]) -> None:
+        """
+        Write the batch of triples for a spool to its file.
+
+        Parameters
+        ----------
+        key: Optional[URIRef]
+            The predicate of the spool, or ``None`` for other predicates
+
+        """
+        batch = self.batches.get(key)
+        if not batch:
+            return
+        if key not in self.spools:
+            self.spools[key] = tempfile.TemporaryFile(prefix="kgx-owl-")
+        spool = self.spools[key]
+        spool.seek(0, 2)
+        pickle.dump(batch, spool, pickle.HIGHEST_PROTOCOL)
+        self.batches[key] = []
+
+    def _read(self, key: Optional[URIRef]) -> Iterator[Tuple]:
+        """
+        Read the triples of a spool, where the position of each read
+        is kept, such that spools can be read while being read.
+
+        Parameters
+        ----------
+        key: Optional[URIRef]
+            The predicate of the spool, or ``None`` for other predicates
+
+        Returns
+        -------
+        Iterator[Tuple]
+            An iterator for triples
+
+        """
+        self._flush(key)
+        spool = self.spools.get(key)
+        if spool is None:
+            return
+        end = spool.seek(0, 2)
+        position = 0
+        while position < end:
+            spool.seek(position)
+            batch = pickle.load(spool)
+            position = spool.tell()
+            yield from batch
+
+    def _keys(self) -> List[Optional[URIRef]]:
+        """
+        Get the keys of the spools.
+
+        Returns
+        -------
+        List[Optional[URIRef]]
+            The predicates of the spools, and ``None`` for other predicates
+
+        """
+        return list(dict.fromkeys(itertools.chain(self.spools, self.batches)))
+
+    def _triples_of_properties(self) -> Dict[Any, List[Tuple]]:
+        """
+        Get the triples of each object property, which are read
+        from the spools at once, for all object properties.
+
+        Returns
+        -------
+        Dict[Any, List[Tuple]]
+            The triples of each object property
+
+        """
+        if self.property_triples is None:
+            self.property_triples = {}
+            for key in self._keys():
+                for triple in self._read(key):
+                    if triple[0] in self.object_properties:
+                        self.property_triples.setdefault(triple[0], []).append(triple)
+        return self.property_triples
+
+    def triples(self, triple_pattern: Tuple, context: Any = None) -> Iterator:
+        """
+        Get the triples that match a pattern.
+
+        Parameters
+        ----------
+        triple_pattern: Tuple
+            A pattern of subject, predicate and object, any of which may be ``None``
+        context: Any
+            The graph to query
+
+        Returns
+        -------
+        Iterator
+            An iterator for triples, each with an iterator for its contexts
+
+        """
+        s, p, o = triple_pattern
+        if isinstance(s, BNode) and p in RESTRICTION_PREDICATES:
+            matches = ((s, p, x) for x in self.restrictions.get((s, p), []))
+        elif s is None and p == RDF.type and o == OWL.ObjectProperty:
+            matches = ((x, p, o) for x in list(self.object_properties))
+        elif s is None and p == OWL.imports:
+            matches = iter(self.imports)
+        elif s is not None and s in self.object_properties:
+            matches = iter(self._triples_of_properties().get(s, []))
+        elif p in SPOOLED_PREDICATES:
+            matches = self._read(p)
+        else:
+            matches = itertools.chain(
+                (t for k in self._keys() for t in self._read(k)),
+                (
+                    (b, rp, x)
+                    for (b, rp), objects in list(self.restrictions.items())
+                    for x in objects
+                ),
+            )
+        for triple in matches:
+            if (
+                (s is None or triple[0] == s)
+                and (p is None or triple[1] == p)
+                and (o is None or triple[2] == o)
+            ):
+                yield triple, iter(())
+
+    def __len__(self, context: Any = None) -> int:
+        return self.count
+
+    def close(self, commit_pending_transaction: bool = False) -> None:
+        """
+        Close and remove the spools.
+
+        Parameters
+        ----------
+        commit_pending_transaction: bool
+            Not used
+
+        """
+        for spool in self.spools.values():
+            spool.close()
+        self.spools.clear()
+        self.batches.clear()
+        self.restrictions.clear()
+        self.object_properties.clear()
+        self.imports.clear()
+        self.property_triples = None
+
 
 class OwlSource(RdfSource):
     """
@@ -52,7 +276,85 @@ class OwlSource(RdfSource):
         format: str
             The format (``owl``)
         compression: Optional[str]
-            The compression type (``gz``)
+            The compression type (``gz``, ``bz2``, ``xz``, ``zst``)
+        kwargs: Any
+            Any additional arguments. ``low_memory`` sets whether the
+            ontology is spooled to disk, with ``SpoolStore``, instead of
+            being loaded into an in-memory graph. ``cache_memory`` sets a
+            budget, in bytes, for the memory of cached nodes and edges,
+            beyond which they are spilled to disk, in ``cache_dir``.
+            ``emit_imports`` sets whether the records of imported
+            ontologies are yielded with those of the ontology (``False``,
+            by default). ``workers`` sets the number of workers that
+            parse imported ontologies, which are cached in
+            ``import_cache_dir``, by default the ``ontology-cache``
+            directory of the config.
+
+        Returns
+        -------
+        Generator
+            A generator for node and edge records read from the file
+
+        """
+        store = SpoolStore() if kwargs.pop("low_memory", False) else None
+        emit_imports = bool(kwargs.pop("emit_imports", False))
+        workers = int(kwargs.pop("workers", 1))
+        import_cache_dir = kwargs.pop("import_cache_dir", get_ontology_cache_dir())
+        cache_memory = kwargs.pop("cache_memory", None)
+        cache_dir = kwargs.pop("cache_dir", None)
+        if cache_memory:
+            self.node_cache = DiskCache(int(cache_memory) * 3 // 4, cache_dir)
+            self.edge_cache = DiskCache(int(cache_memory) // 4, cache_dir)
+        try:
+            yield from self._parse(
+                filename,
+                format,
+                compression,
+                store,
+                emit_imports,
+                workers,
+                import_cache_dir,
+                **kwargs,
+            )
+        finally:
+            if store is not None:
+                store.close()
+            if cache_memory:
+                self.node_cache.close()
+                self.edge_cache.close()
+                self.node_cache = {}
+                self.edge_cache = {}
+
+    def _parse(
+        self,
+        filename: str,
+        format: str,
+        compression: Optional[str],
+        store: Optional[Store],
+        emit_imports: bool,
+        workers: int,
+        import_cache_dir: Optional[str],
+        **kwargs: Any,
+    ) -> Generator:
+        """
+        Parse an OWL into a graph with the given store, and yield records.
+
+        Parameters
+        ----------
+        filename: str
+            The filename to parse
+        format: str
+            The format (``owl``)
+        compression: Optional[str]
+            The compression type (``gz``, ``bz2``, ``xz``, ``zst``)
+        store: Optional[Store]
+            The store of the graph, or ``None`` for the default in-memory store
+        emit_imports: bool
+            Whether the records of imported ontologies are yielded
+        workers: int
+            Number of workers that parse imported ontologies
+        import_cache_dir: Optional[str]
+            The directory where parsed imported ontologies are cached
         kwargs: Any
             Any additional arguments
 
@@ -62,9 +364,7 @@ class OwlSource(RdfSource):
             A generator for node and edge records read from the file
 
         """
-        rdfgraph = rdflib.Graph()
-        if compression:
-            log.warning(f"compression mode '{compression}' not supported by OwlSource")
+        rdfgraph = rdflib.Graph() if store is None else rdflib.Graph(store=store)
         if format is None:
             format = rdflib.util.guess_format(filename)
 
@@ -72,7 +372,14 @@ class OwlSource(RdfSource):
             format = "xml"
 
         log.info("Parsing {} with '{}' format".format(filename, format))
-        rdfgraph.parse(filename, format=format)
+        # a URL, like that of an ontology on the web, is passed to rdflib as is
+        if compression or (os.path.isfile(filename) and detect_compression(filename)):
+            with open_input(filename, compression) as FH:
+                rdfgraph.parse(
+                    file=FH, format=format, publicID=Path(filename).resolve().as_uri()
+                )
+        else:
+            rdfgraph.parse(filename, format=format)
         log.info("{} parsed with {} triples".format(filename, len(rdfgraph)))
 
         self.set_provenance_map(kwargs)
@@ -80,19 +387,21 @@ class OwlSource(RdfSource):
         self.start = current_time_in_millis()
         log.info(f"Done parsing {filename}")
 
-        triples = rdfgraph.triples((None, OWL.imports, None))
-        for s, p, o in triples:
-            # Load all imports first
-            if p == OWL.imports:
-                if o not in self.imported:
-                    input_format = rdflib.util.guess_format(o)
-                    imported_rdfgraph = rdflib.Graph()
-                    log.info(f"Parsing OWL import: {o}")
-                    self.imported.add(o)
-                    imported_rdfgraph.parse(o, format=input_format)
-                    self.load_graph(imported_rdfgraph)
-                else:
-                    log.warning(f"Trying to import {o} but its already done")
+        imports = []
+        for s, p, o in list(rdfgraph.triples((None, OWL.imports, None))):
+            if o not in self.imported:
+                self.imported.add(o)
+                imports.append(str(o))
+            else:
+                log.warning(f"Trying to import {o} but its already done")
+        if emit_imports:
+            # imported ontologies are loaded into the same graph, and their
+            # triples are loaded with those of the ontology
+            for iri, batch in load_ontologies(imports, workers, import_cache_dir):
+                log.debug(f"Loading {len(batch)} triples of OWL import: {iri}")
+                rdfgraph.addN((s, p, o, rdfgraph) for s, p, o in batch)
+        elif imports:
+            log.info(f"Skipping {len(imports)} OWL imports, as emit_imports is not set")
         yield from self.load_graph(rdfgraph)
 
     def load_graph(self, rdfgraph: rdflib.Graph, **kwargs: Any) -> None:
@@ -1,5 +1,9 @@
-import gzip
-from typing import Set, Dict, Union, Optional, Any, Tuple, List, Generator
+import multiprocessing as mp
+import os
+import pickle
+import tempfile
+import uuid
+from typing import Set, Dict, Union, Optional, Any, Tuple, List, Generator, IO, Iterable
 
 import rdflib
 from linkml_runtime.linkml_model.meta import SlotDefinition, ClassDefinition, Element
@@ -7,8 +11,10 @@ from rdflib import URIRef, RDF, Namespace
 
 from kgx.prefix_manager import PrefixManager
 from kgx.config import get_logger
-from kgx.parsers.ntriples_parser import CustomNTriplesParser
+from kgx.parsers.ntriples_parser import FastNTriplesParser, split_ntriples
 from kgx.source.source import Source
+from kgx.utils.archive_utils import open_input, detect_compression
+from kgx.utils.cache_utils import DiskCache
 from kgx.utils.graph_utils import curie_lookup
 from kgx.utils.kgx_utils import (
     get_toolkit,
@@ -32,6 +38,19 @@ log = get_logger()
 
 NAMED_THING = "biolink:NamedThing"
 
+# Number of shards per worker when parsing N-Triples in parallel
+SHARDS_PER_WORKER = 4
+
+# Minimum number of bytes in a shard
+MIN_SHARD_SIZE = 1 << 20
+
+# The source that forked parse workers parse shards for
+_shard_source: Optional["RdfSource"] = None
+
+# The caches of the source that forked a parse worker, which the worker keeps,
+# but does not use, such that their databases are not removed when collected
+_inherited_caches: Optional[Tuple] = None
+
 
 class RdfSource(Source):
     """
@@ -53,7 +72,10 @@ class RdfSource(Source):
         self.PMID = Namespace(self.prefix_manager.prefix_map["PMID"])
         self.BIOLINK = Namespace(self.prefix_manager.prefix_map["biolink"])
         self.predicate_mapping = {}
+        # the mappings of predicates from process_predicate
         self.cache: Dict = {}
+        # how triples are parsed for each predicate, from the mappings of predicates
+        self.predicate_table: Dict = {}
         self.toolkit = get_toolkit()
         self.node_property_predicates = set(
             [
@@ -100,6 +122,21 @@ class RdfSource(Source):
         self.edge_cache = {}
         self._incomplete_nodes = {}
 
+    def set_prefix_map(self, m: Dict) -> None:
+        """
+        Update default prefix map, and clear the mappings
+        of predicates that depend on it.
+
+        Parameters
+        ----------
+        m: Dict
+            A dictionary with prefix to IRI mappings
+
+        """
+        super().set_prefix_map(m)
+        self.cache.clear()
+        self.predicate_table.clear()
+
     def set_predicate_mapping(self, m: Dict) -> None:
         """
         Set predicate mappings.
@@ -116,6 +153,8 @@ class RdfSource(Source):
         """
         for k, v in m.items():
             self.predicate_mapping[URIRef(k)] = v
+        self.cache.clear()
+        self.predicate_table.clear()
 
     def set_node_property_predicates(self, predicates) -> None:
         """
@@ -129,6 +168,7 @@ class RdfSource(Source):
         """
         for p in predicates:
             self.node_property_predicates.add(URIRef(p))
+        self.predicate_table.clear()
 
     def parse(
         self,
@@ -153,9 +193,15 @@ class RdfSource(Source):
         format: str
             The format (``nt``)
         compression: Optional[str]
-            The compression type (``gz``)
+            The compression type (``gz``, ``bz2``, ``xz``, ``zst``)
         kwargs: Any
-            Any additional arguments
+            Any additional arguments. ``workers`` sets the number of
+            processes that parse an uncompressed, subject-sorted
+            N-Triples file in parallel. ``cache_memory`` sets a budget,
+            in bytes, for the memory of cached nodes and edges, beyond
+            which they are spilled to disk, in ``cache_dir``. The budget
+            is shared by the workers, which spill the records that they
+            parse to ``cache_dir`` as well.
 
         Returns
         -------
@@ -163,22 +209,43 @@ class RdfSource(Source):
             A generator for records
 
         """
-        p = CustomNTriplesParser(self)
-
+        workers = int(kwargs.pop("workers", 1))
+        cache_memory = kwargs.pop("cache_memory", None)
+        cache_dir = kwargs.pop("cache_dir", None)
         self.set_provenance_map(kwargs)
-
-        if compression == "gz":
-            yield from p.parse(gzip.open(filename, "rb"))
+        if cache_memory:
+            # nodes usually outnumber the edges that are cached until a flush
+            self.node_cache = DiskCache(int(cache_memory) * 3 // 4, cache_dir)
+            self.edge_cache = DiskCache(int(cache_memory) // 4, cache_dir)
+
+        if workers > 1 and format == "nt" and self._can_shard(filename):
+            shards = split_ntriples(
+                filename,
+                max(
+                    1,
+                    min(
+                        workers * SHARDS_PER_WORKER,
+                        os.path.getsize(filename) // MIN_SHARD_SIZE,
+                    ),
+                ),
+            )
         else:
-            yield from p.parse(open(filename, "rb"))
+            shards = []
+        if len(shards) > 1:
+            yield from self.parse_shards(
+                filename, shards, workers, cache_memory, cache_dir
+            )
+        else:
+            p = FastNTriplesParser(self)
+            with open_input(filename, compression) as FH:
+                yield from p.parse(FH)
         log.info(f"Done parsing {filename}")
 
         for n in self.reified_nodes:
             data = self.node_cache.pop(n)
             self.dereify(n, data)
 
-        for k in self.node_cache.keys():
-            node_data = self.node_cache[k]
+        for k, node_data in self.node_cache.items():
             if "category" in node_data:
                 if NAMED_THING not in set(node_data["category"]):
                     node_data["category"].append(NAMED_THING)
@@ -195,8 +262,7 @@ class RdfSource(Source):
 
         self.node_cache.clear()
 
-        for k in self.edge_cache.keys():
-            edge_data = self.edge_cache[k]
+        for k, edge_data in self.edge_cache.items():
             edge_data = validate_edge(edge_data)
             edge_data = sanitize_import(edge_data)
 
@@ -207,6 +273,120 @@ class RdfSource(Source):
                 yield k[0], k[1], k[2], edge_data
 
         self.edge_cache.clear()
+        if cache_memory:
+            self.node_cache.close()
+            self.edge_cache.close()
+            self.node_cache = {}
+            self.edge_cache = {}
+
+    @staticmethod
+    def _can_shard(filename: str) -> bool:
+        """
+        Check whether a file can be parsed in parallel shards, which requires
+        that it is not compressed and that worker processes can be forked.
+
+        Parameters
+        ----------
+        filename: str
+            The filename
+
+        Returns
+        -------
+        bool
+            Whether the file can be parsed in shards
+
+        """
+        if "fork" not in mp.get_all_start_methods():
+            log.warning("Parsing in parallel requires forked processes")
+            return False
+        if detect_compression(filename):
+            log.warning(f"Parsing compressed {filename} in a single process")
+            return False
+        return True
+
+    def parse_shards(
+        self,
+        filename: str,
+        shards: List[Tuple[int, int]],
+        workers: int,
+        cache_memory: Optional[int] = None,
+        cache_dir: Optional[str] = None,
+    ) -> Generator:
+        """
+        Parse the byte ranges of an N-Triples file in worker processes,
+        and merge the nodes and edges that each worker has cached.
+
+        Each range must start at a line with a different subject than the
+        line before it, as ranges from ``split_ntriples`` do, such that the
+        triples of each subject, including those of reified nodes, are parsed
+        by the same worker. Edges that workers yield are yielded in order of
+        their ranges, while cached nodes and edges are merged into the caches
+        of this source, as if the whole file had been parsed by it.
+
+        Workers write the edges that they yield, and the nodes and edges
+        that they have cached, to files, which are read back one record at
+        a time, such that the records of a range are not held in memory.
+        With ``cache_memory``, each worker caches nodes and edges within
+        its share of the budget, spilling them to ``cache_dir``.
+
+        Parameters
+        ----------
+        filename: str
+            The filename to parse
+        shards: List[Tuple[int, int]]
+            A list of start and end offsets
+        workers: int
+            Number of worker processes
+        cache_memory: Optional[int]
+            The budget, in bytes, for the memory of the nodes and edges
+            that are cached by all the workers
+        cache_dir: Optional[str]
+            The directory for the files of the workers
+
+        Returns
+        -------
+        Generator
+            A generator for records
+
+        """
+        global _shard_source
+        # blank nodes with the same label are the same in every range
+        bnode_prefix = f"N{uuid.uuid4().hex}"
+        processes = min(workers, len(shards))
+        memory = int(cache_memory) // processes if cache_memory else None
+        spill_dir = tempfile.TemporaryDirectory(prefix="kgx-shards-", dir=cache_dir)
+        _shard_source = self
+        pool = mp.get_context("fork").Pool(processes=processes)
+        try:
+            results = pool.imap(
+                _parse_shard,
+                [
+                    (filename, s, e, bnode_prefix, memory, spill_dir.name)
+                    for s, e in shards
+                ],
+            )
+            for result in results:
+                yield from _read_spill(result["records"])
+                for n, data in _read_spill(result["node_cache"]):
+                    if n in self.node_cache:
+                        self.update_node(n, data)
+                    else:
+                        self.node_cache[n] = data
+                for k, data in _read_spill(result["edge_cache"]):
+                    if k in self.edge_cache:
+                        self.update_edge(k[0], k[1], k[2], data)
+                    else:
+                        self.edge_cache[k] = data
+                self.cache.update(result["cache"])
+                self.predicate_table.update(result["predicate_table"])
+                self.reified_nodes.update(result["reified_nodes"])
+                self.node_properties.update(result["node_properties"])
+                self.edge_properties.update(result["edge_properties"])
+                self.count += result["count"]
+        finally:
+            _shard_source = None
+            pool.terminate()
+            spill_dir.cleanup()
 
     def triple(self, s: URIRef, p: URIRef, o: URIRef) -> None:
         """
@@ -223,15 +403,7 @@ class RdfSource(Source):
 
         """
         self.count += 1
-        (element_uri, canonical_uri, predicate, property_name) = self.process_predicate(
-            p
-        )
-        if element_uri:
-            prop_uri = element_uri
-        elif predicate:
-            prop_uri = predicate
-        else:
-            prop_uri = property_name
+        prop_uri, reifies, node_property = self._triple_predicate(p)
 
         s_curie = self.prefix_manager.contract(s)
         if s_curie.startswith("biolink") or s_curie.startswith("OBAN"):
@@ -239,36 +411,13 @@ class RdfSource(Source):
         elif s_curie in self.reified_nodes:
             # subject is a reified node
             self.add_node_attribute(s, key=prop_uri, value=o)
-        elif p in self.reification_predicates:
+        elif reifies or o in self.reification_types:
             # subject is a reified node
             self.reified_nodes.add(s_curie)
             self.add_node_attribute(s, key=prop_uri, value=o)
-        elif property_name in {
-            "subject",
-            "predicate",
-            "object",
-            "predicate",
-            "relation",
-        }:
-            # subject is a reified node
-            self.reified_nodes.add(s_curie)
-            self.add_node_attribute(s, key=prop_uri, value=o)
-        elif o in self.reification_types:
-            # subject is a reified node
-            self.reified_nodes.add(s_curie)
-            self.add_node_attribute(s, key=prop_uri, value=o)
-        elif element_uri and element_uri in self.node_property_predicates:
+        elif node_property or isinstance(o, rdflib.term.Literal):
             # treating predicate as a node property
             self.add_node_attribute(s, key=prop_uri, value=o)
-        elif (
-            p in self.node_property_predicates
-            or predicate in self.node_property_predicates
-            or property_name in self.node_property_predicates
-        ):
-            # treating predicate as a node property
-            self.add_node_attribute(s, key=prop_uri, value=o)
-        elif isinstance(o, rdflib.term.Literal):
-            self.add_node_attribute(s, key=prop_uri, value=o)
         else:
             # treating predicate as an edge
             self.add_edge(s, o, p)
@@ -288,18 +437,12 @@ class RdfSource(Source):
                 self.reified_nodes.add(n)
             self._incomplete_nodes.clear()
 
-            for k in self.edge_cache.keys():
-                if (
-                    "id" not in self.edge_cache[k]
-                    and "association_id" not in self.edge_cache[k]
-                ):
+            for k, data in self.edge_cache.items():
+                if "id" not in data and "association_id" not in data:
                     edge_key = generate_edge_key(
-                        self.edge_cache[k]["subject"],
-                        self.edge_cache[k]["predicate"],
-                        self.edge_cache[k]["object"],
+                        data["subject"], data["predicate"], data["object"],
                     )
-                    self.edge_cache[k]["id"] = edge_key
-                data = self.edge_cache[k]
+                    data["id"] = edge_key
                 data = validate_edge(data)
                 data = sanitize_import(data)
 
@@ -311,6 +454,51 @@ class RdfSource(Source):
             self.edge_cache.clear()
         yield None
 
+    def _triple_predicate(self, p: URIRef) -> Tuple[str, bool, bool]:
+        """
+        Get how triples with a predicate are parsed, from the
+        predicate table.
+
+        Parameters
+        ----------
+        p: URIRef
+            The predicate
+
+        Returns
+        -------
+        Tuple[str, bool, bool]
+            The property of nodes for the predicate, whether the predicate
+            makes the subject a reified node, and whether the predicate
+            is treated as a node property
+
+        """
+        entry = self.predicate_table.get(p)
+        if entry is not None:
+            return entry
+        (element_uri, canonical_uri, predicate, property_name) = self.process_predicate(
+            p
+        )
+        if element_uri:
+            prop_uri = element_uri
+        elif predicate:
+            prop_uri = predicate
+        else:
+            prop_uri = property_name
+        reifies = p in self.reification_predicates or property_name in {
+            "subject",
+            "predicate",
+            "object",
+            "relation",
+        }
+        node_property = bool(
+            (element_uri and element_uri in self.node_property_predicates)
+            or p in self.node_property_predicates
+            or predicate in self.node_property_predicates
+            or property_name in self.node_property_predicates
+        )
+        entry = self.predicate_table[p] = (prop_uri, reifies, node_property)
+        return entry
+
     def dereify(self, n: str, node: Dict) -> None:
         """
         Dereify a node to create a corresponding edge.
@@ -557,65 +745,53 @@ class RdfSource(Source):
             the CURIE form of p, the reference of p
 
         """
-        if p in self.cache:
+        entry = self.cache.get(p)
+        if entry is not None:
             # already processed this predicate before; pull from cache
-            element_uri = self.cache[p]["element_uri"]
-            canonical_uri = self.cache[p]["canonical_uri"]
-            predicate = self.cache[p]["predicate"]
-            property_name = self.cache[p]["property_name"]
+            return entry
+        # haven't seen this property before; map to element
+        if self.prefix_manager.is_iri(p):
+            predicate = self.prefix_manager.contract(str(p))
         else:
-            # haven't seen this property before; map to element
-            if self.prefix_manager.is_iri(p):
-                predicate = self.prefix_manager.contract(str(p))
-            else:
-                predicate = None
-            if self.prefix_manager.is_curie(p):
-                property_name = self.prefix_manager.get_reference(p)
-                predicate = p
+            predicate = None
+        if self.prefix_manager.is_curie(p):
+            property_name = self.prefix_manager.get_reference(p)
+            predicate = p
+        else:
+            if predicate and self.prefix_manager.is_curie(predicate):
+                property_name = self.prefix_manager.get_reference(predicate)
             else:
-                if predicate and self.prefix_manager.is_curie(predicate):
-                    property_name = self.prefix_manager.get_reference(predicate)
+                property_name = p
+                predicate = f":{p}"
+        element = self.get_biolink_element(p)
+        canonical_uri = None
+        if element:
+            if isinstance(element, SlotDefinition):
+                # predicate corresponds to a biolink slot
+                if element.definition_uri:
+                    element_uri = self.prefix_manager.contract(element.definition_uri)
                 else:
-                    property_name = p
-                    predicate = f":{p}"
-            element = self.get_biolink_element(p)
-            canonical_uri = None
-            if element:
-                if isinstance(element, SlotDefinition):
-                    # predicate corresponds to a biolink slot
-                    if element.definition_uri:
-                        element_uri = self.prefix_manager.contract(
-                            element.definition_uri
-                        )
-                    else:
-                        element_uri = (
-                            f"biolink:{sentencecase_to_snakecase(element.name)}"
-                        )
-                    if element.slot_uri:
-                        canonical_uri = element.slot_uri
-                elif isinstance(element, ClassDefinition):
-                    # this will happen only when the IRI is actually
-                    # a reference to a class
-                    element_uri = self.prefix_manager.contract(element.class_uri)
-                else:
-                    element_uri = f"biolink:{sentencecase_to_camelcase(element.name)}"
-                if "biolink:Attribute" in get_biolink_ancestors(element.name):
                     element_uri = f"biolink:{sentencecase_to_snakecase(element.name)}"
-                if not predicate:
-                    predicate = element_uri
+                if element.slot_uri:
+                    canonical_uri = element.slot_uri
+            elif isinstance(element, ClassDefinition):
+                # this will happen only when the IRI is actually
+                # a reference to a class
+                element_uri = self.prefix_manager.contract(element.class_uri)
             else:
-                # no mapping to biolink model;
-                # look at predicate mappings
-                element_uri = None
-                if p in self.predicate_mapping:
-                    property_name = self.predicate_mapping[p]
-                    predicate = f":{property_name}"
-            self.cache[p] = {
-                "element_uri": element_uri,
-                "canonical_uri": canonical_uri,
-                "predicate": predicate,
-                "property_name": property_name,
-            }
+                element_uri = f"biolink:{sentencecase_to_camelcase(element.name)}"
+            if "biolink:Attribute" in get_biolink_ancestors(element.name):
+                element_uri = f"biolink:{sentencecase_to_snakecase(element.name)}"
+            if not predicate:
+                predicate = element_uri
+        else:
+            # no mapping to biolink model;
+            # look at predicate mappings
+            element_uri = None
+            if p in self.predicate_mapping:
+                property_name = self.predicate_mapping[p]
+                predicate = f":{property_name}"
+        self.cache[p] = (element_uri, canonical_uri, predicate, property_name)
         return element_uri, canonical_uri, predicate, property_name
 
     def update_node(self, n: Union[URIRef, str], data: Optional[Dict] = None) -> Dict:
@@ -840,3 +1016,158 @@ class RdfSource(Source):
             except ValueError as e:
                 log.error(e)
         return element
+
+
+class _RangeReader:
+    """
+    A binary file object for a byte range of a file.
+
+    Parameters
+    ----------
+    FH: IO[bytes]
+        A binary file object
+    start: int
+        The start offset
+    end: int
+        The end offset
+
+    """
+
+    def __init__(self, FH: IO[bytes], start: int, end: int):
+        self.FH = FH
+        self.FH.seek(start)
+        self.remaining = end - start
+
+    def read(self, size: int = -1) -> bytes:
+        """
+        Read bytes, up to the end of the range.
+
+        Parameters
+        ----------
+        size: int
+            Number of bytes to read
+
+        Returns
+        -------
+        bytes
+            The bytes read
+
+        """
+        if size < 0 or size > self.remaining:
+            size = self.remaining
+        data = self.FH.read(size)
+        self.remaining -= len(data)
+        return data
+
+
+def _spill(records: Iterable, directory: str) -> str:
+    """
+    Write records to a file, one pickle at a time.
+
+    Parameters
+    ----------
+    records: Iterable
+        The records
+    directory: str
+        The directory for the file
+
+    Returns
+    -------
+    str
+        The filename
+
+    """
+    fd, filename = tempfile.mkstemp(prefix="kgx-spill-", dir=directory)
+    with os.fdopen(fd, "wb") as FH:
+        for record in records:
+            pickle.dump(record, FH, pickle.HIGHEST_PROTOCOL)
+    return filename
+
+
+def _read_spill(filename: str) -> Generator:
+    """
+    Read the records of a file that was written by ``_spill``,
+    and remove the file.
+
+    Parameters
+    ----------
+    filename: str
+        The filename
+
+    Returns
+    -------
+    Generator
+        A generator for records
+
+    """
+    try:
+        with open(filename, "rb") as FH:
+            while True:
+                try:
+                    yield pickle.load(FH)
+                except EOFError:
+                    break
+    finally:
+        os.remove(filename)
+
+
+def _parse_shard(args: Tuple[str, int, int, str, Optional[int], str]) -> Dict:
+    """
+    Parse a byte range of an N-Triples file, in a worker process
+    forked from ``RdfSource.parse_shards``.
+
+    Parameters
+    ----------
+    args: Tuple[str, int, int, str, Optional[int], str]
+        The filename, the start and end offsets, the prefix for the
+        identifiers of blank nodes, the budget, in bytes, for the memory
+        of cached nodes and edges, and the directory for spilled records
+
+    Returns
+    -------
+    Dict
+        The files of the edges yielded while parsing, and of the cached
+        nodes and edges, and the rest of the state of the source
+
+    """
+    global _inherited_caches
+    filename, start, end, bnode_prefix, memory, directory = args
+    source = _shard_source
+    if _inherited_caches is None:
+        _inherited_caches = (source.node_cache, source.edge_cache)
+    if memory:
+        # nodes usually outnumber the edges that are cached until a flush
+        source.node_cache = DiskCache(memory * 3 // 4, directory)
+        source.edge_cache = DiskCache(memory // 4, directory)
+    else:
+        source.node_cache = {}
+        source.edge_cache = {}
+    source.reified_nodes = set()
+    source._incomplete_nodes = {}
+    source.node_properties = set()
+    source.edge_properties = set()
+    source.count = 0
+    # the predicates that were resolved before forking are shared by the workers
+    cache = set(source.cache)
+    predicate_table = set(source.predicate_table)
+    p = FastNTriplesParser(source, bnode_prefix=bnode_prefix)
+    with open(filename, "rb") as FH:
+        records = p.parse(_RangeReader(FH, start, end))
+        records_file = _spill((x for x in records if x is not None), directory)
+    result = {
+        "records": records_file,
+        "node_cache": _spill(source.node_cache.items(), directory),
+        "edge_cache": _spill(source.edge_cache.items(), directory),
+        "reified_nodes": source.reified_nodes,
+        "node_properties": source.node_properties,
+        "edge_properties": source.edge_properties,
+        "count": source.count,
+        "cache": {k: v for k, v in source.cache.items() if k not in cache},
+        "predicate_table": {
+            k: v for k, v in source.predicate_table.items() if k not in predicate_table
+        },
+    }
+    if memory:
+        source.node_cache.close()
+        source.edge_cache.close()
+    return result
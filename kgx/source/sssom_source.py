@@ -1,23 +1,26 @@
 """
 KGX Source for Simple Standard for Sharing Ontology Mappings ("SSSOM")
 """
-import gzip
 import re
 
 import pandas as pd
-from typing import Optional, Generator, Any, Dict, Tuple
+from typing import Optional, Generator, Any, Dict, Tuple, IO, List, Set
 
 import yaml
 
 from kgx.prefix_manager import PrefixManager
 from kgx.config import get_logger
 from kgx.source import Source
+from kgx.source.tsv_source import TsvSource
+from kgx.utils.archive_utils import open_input
 from kgx.utils.kgx_utils import (
     validate_node,
     sanitize_import,
     validate_edge,
     generate_uuid,
     generate_edge_key,
+    read_csv_chunks,
+    DEFAULT_NODE_CATEGORY,
 )
 from kgx.utils.rdf_utils import process_predicate
 
@@ -40,6 +43,8 @@ class SssomSource(Source):
     def __init__(self):
         super().__init__()
         self.predicate_mapping = {}
+        self.predicate_cache: Dict[str, Optional[str]] = {}
+        self.seen_nodes: Set[Tuple] = set()
 
     def set_prefix_map(self, m: Dict) -> None:
         """
@@ -82,9 +87,11 @@ class SssomSource(Source):
         format: str
             The input file format (``tsv``, by default)
         compression: Optional[str]
-            The compression (``gz``)
+            The compression (``gz``, ``bz2``, ``xz``, ``zst``)
         kwargs: Dict
-            Any additional arguments
+            Any additional arguments. ``chunksize`` sets the number of rows
+            per chunk and ``engine`` sets the parser engine (``c``, by default,
+            or ``pyarrow``).
 
         Returns
         -------
@@ -92,31 +99,26 @@ class SssomSource(Source):
             A generator for node and edge records
 
         """
+        chunksize = kwargs.pop("chunksize", None)
+        engine = kwargs.pop("engine", None)
         if "delimiter" not in kwargs:
             kwargs["delimiter"] = "\t"
-        self.parse_header(filename, compression)
+        self.seen_nodes = set()
 
-        # SSSOM 'mapping provider' may override the default 'knowledge_source' setting?
-        if "mapping_provider" in self.graph_metadata:
-            kwargs["knowledge_source"] = self.graph_metadata["mapping_provider"]
+        with open_input(filename, compression) as FH:
+            self.read_header(FH)
 
-        self.set_provenance_map(kwargs)
+            # SSSOM 'mapping provider' may override the default 'knowledge_source'
+            if "mapping_provider" in self.graph_metadata:
+                kwargs["knowledge_source"] = self.graph_metadata["mapping_provider"]
 
-        if compression:
-            FH = gzip.open(filename, "rb")
-        else:
-            FH = open(filename)
-        file_iter = pd.read_csv(
-            FH,
-            comment="#",
-            dtype=str,
-            chunksize=10000,
-            low_memory=False,
-            keep_default_na=False,
-            **kwargs,
-        )
-        for chunk in file_iter:
-            yield from self.load_edges(chunk)
+            self.set_provenance_map(kwargs)
+
+            file_iter = read_csv_chunks(
+                FH, chunksize=chunksize, engine=engine, comment="#", **kwargs
+            )
+            for chunk in file_iter:
+                yield from self.load_edges(chunk)
 
     def parse_header(self, filename: str, compression: Optional[str] = None) -> None:
         """
@@ -130,16 +132,24 @@ class SssomSource(Source):
             Compression type
 
         """
-        yamlstr = ""
-        if compression:
-            FH = gzip.open(filename, "rb")
-        else:
-            FH = open(filename)
-        for line in FH:
-            if line.startswith("#"):
-                yamlstr += re.sub("^#", "", line)
-            else:
-                break
+        with open_input(filename, compression, threaded=False) as FH:
+            self.read_header(FH)
+
+    def read_header(self, FH: IO[bytes]) -> None:
+        """
+        Read metadata from the SSSOM headers at the start of a file,
+        such that the file is left at the first line after the headers.
+
+        Parameters
+        ----------
+        FH: IO[bytes]
+            A binary file object, which supports ``peek``
+
+        """
+        lines = []
+        while FH.peek(1)[:1] == b"#":
+            lines.append(re.sub("^#", "", FH.readline().decode("utf-8")))
+        yamlstr = "".join(lines)
         if yamlstr:
             metadata = yaml.safe_load(yamlstr)
             log.info(f"Metadata: {metadata}")
@@ -165,6 +175,23 @@ class SssomSource(Source):
         """
         node = validate_node(node)
         node_data = sanitize_import(node.copy())
+        return self._load_node_data(node_data)
+
+    def _load_node_data(self, node_data: Dict) -> Optional[Tuple[str, Dict]]:
+        """
+        Apply provenance to a sanitized node.
+
+        Parameters
+        ----------
+        node_data: Dict
+            A sanitized node
+
+        Returns
+        -------
+        Optional[Tuple[str, Dict]]
+            A tuple that contains node id and node data
+
+        """
         if "id" in node_data:
             n = node_data["id"]
 
@@ -173,12 +200,17 @@ class SssomSource(Source):
             self.node_properties.update(list(node_data.keys()))
             return n, node_data
         else:
-            log.info("Ignoring node with no 'id': {}".format(node))
+            log.info("Ignoring node with no 'id': {}".format(node_data))
 
     def load_edges(self, df: pd.DataFrame) -> Generator:
         """
         Load edges from pandas.DataFrame into an instance of BaseGraph
 
+        The columns of ``df`` are sanitized as a whole, predicates and
+        categories are resolved once for each distinct value, and the
+        subject and object nodes are only yielded the first time
+        they are seen.
+
         Parameters
         ----------
         df : pandas.DataFrame
@@ -187,29 +219,173 @@ class SssomSource(Source):
         Returns
         -------
         Generator
-            A generator for edge records
+            A generator for node and edge records
 
         """
-        for obj in df.to_dict("records"):
-            yield from self.load_edge(obj)
+        if not {"subject_id", "predicate_id", "object_id"}.issubset(df.columns):
+            # let load_edge report the missing property
+            for obj in df.to_dict("records"):
+                yield from self.load_edge(obj)
+            return
+        predicates = []
+        for p in df["predicate_id"].tolist():
+            if p not in self.predicate_cache:
+                self.predicate_cache[p] = self.get_edge_predicate(p)
+            predicates.append(self.predicate_cache[p])
+
+        nodes = []
+        for prefix in ["subject", "object"]:
+            node_columns = {"id": TsvSource._sanitize_column("id", df[f"{prefix}_id"])}
+            if f"{prefix}_category" in df.columns:
+                column = df[f"{prefix}_category"]
+                categories = {
+                    v: v if PrefixManager.is_curie(v) else "biolink:OntologyClass"
+                    for v in column.unique()
+                }
+                node_columns["category"] = TsvSource._sanitize_column(
+                    "category", column.map(categories)
+                )
+            else:
+                size = len(df)
+                node_columns["category"] = (
+                    [[DEFAULT_NODE_CATEGORY]] * size,
+                    [False] * size,
+                    [True] * size,
+                )
+            nodes.append(self._build_nodes(node_columns))
 
-    def load_edge(self, edge: Dict) -> Generator:
+        edge_columns = {
+            "subject": TsvSource._sanitize_column("subject", df["subject_id"]),
+            "predicate": self._sanitize_values("predicate", predicates),
+            "object": TsvSource._sanitize_column("object", df["object_id"]),
+        }
+        for k in df.columns:
+            if k != "predicate_id" and k not in SSSOM_NODE_PROPERTY_MAPPING:
+                edge_columns[k] = TsvSource._sanitize_column(k, df[k])
+        metadata = sanitize_import(
+            {k: v for k, v in self.graph_metadata.items() if k not in {"curie_map"}}
+        )
+        for k in metadata:
+            edge_columns.pop(k, None)
+        edges = TsvSource._build_records(edge_columns, [True] * len(df))
+
+        for subject_node, object_node, edge_data in zip(nodes[0], nodes[1], edges):
+            for node_data in (subject_node, object_node):
+                if node_data is not None:
+                    record = self._load_node_data(node_data)
+                    if record is not None:
+                        yield record
+            # each edge gets its own lists, which are extended in place
+            # when duplicate edges are merged
+            edge_data.update(
+                {
+                    k: list(v) if isinstance(v, (list, set)) else v
+                    for k, v in metadata.items()
+                }
+            )
+            record = self._load_edge_data(edge_data)
+            if record is not None:
+                yield record
+
+    def _build_nodes(self, columns: Dict[str, Tuple]) -> List[Optional[Dict]]:
         """
-        Load an edge into an instance of BaseGraph
+        Build node records from sanitized columns, where nodes
+        that were seen before are ``None``.
 
         Parameters
         ----------
-        edge : Dict
-            An edge
+        columns: Dict[str, Tuple]
+            Sanitized ``id`` and ``category`` columns
 
         Returns
         -------
-        Generator
-            A generator for node and edge records
+        List[Optional[Dict]]
+            A list of node records
+
+        """
+        nodes: List[Optional[Dict]] = []
+        ids, id_nulls, _ = columns["id"]
+        categories, category_nulls, _ = columns["category"]
+        for n, n_null, c, c_null in zip(ids, id_nulls, categories, category_nulls):
+            if not self._is_new_node(None if n_null else n, None if c_null else c):
+                nodes.append(None)
+                continue
+            node_data = {}
+            if not n_null:
+                node_data["id"] = n
+            if not c_null:
+                node_data["category"] = list(c)
+            nodes.append(node_data)
+        return nodes
+
+    def _is_new_node(self, n: Optional[str], category: Optional[List]) -> bool:
+        """
+        Check whether a node, with the given id and category, was not seen
+        before, and mark it as seen.
+
+        Parameters
+        ----------
+        n: Optional[str]
+            The node id
+        category: Optional[List]
+            The node category
+
+        Returns
+        -------
+        bool
+            Whether the node is new
+
+        """
+        node_key = (n, tuple(category) if category else ())
+        if node_key in self.seen_nodes:
+            return False
+        self.seen_nodes.add(node_key)
+        return True
+
+    @staticmethod
+    def _sanitize_values(key: str, values: List) -> Tuple[List, List, List]:
+        """
+        Sanitize a list of values, of which few are distinct,
+        in the form of ``TsvSource._sanitize_column``.
+
+        Parameters
+        ----------
+        key: str
+            Key corresponding to an edge property
+        values: List
+            The values for the key
+
+        Returns
+        -------
+        Tuple[List, List, List]
+            The sanitized values, a mask of the null values
+            and a mask of the values that are lists
+
+        """
+        sanitized = {}
+        for v in set(values):
+            x = sanitize_import({key: v})
+            sanitized[v] = (x[key], False) if key in x else (None, True)
+        column = [sanitized[v][0] for v in values]
+        return column, [sanitized[v][1] for v in values], [False] * len(values)
+
+    def get_edge_predicate(self, predicate_id: str) -> Optional[str]:
+        """
+        Get the edge predicate for an SSSOM ``predicate_id``.
+
+        Parameters
+        ----------
+        predicate_id: str
+            The predicate of a mapping
+
+        Returns
+        -------
+        Optional[str]
+            The edge predicate
 
         """
         (element_uri, canonical_uri, predicate, property_name) = process_predicate(
-            self.prefix_manager, edge["predicate_id"], self.predicate_mapping
+            self.prefix_manager, predicate_id, self.predicate_mapping
         )
         if element_uri:
             edge_predicate = element_uri
@@ -219,6 +395,28 @@ class SssomSource(Source):
             edge_predicate = property_name
         if canonical_uri:
             edge_predicate = element_uri
+        return edge_predicate
+
+    def load_edge(self, edge: Dict) -> Generator:
+        """
+        Load an edge into an instance of BaseGraph
+
+        Parameters
+        ----------
+        edge : Dict
+            An edge
+
+        Returns
+        -------
+        Generator
+            A generator for node and edge records
+
+        """
+        if edge["predicate_id"] not in self.predicate_cache:
+            self.predicate_cache[edge["predicate_id"]] = self.get_edge_predicate(
+                edge["predicate_id"]
+            )
+        edge_predicate = self.predicate_cache[edge["predicate_id"]]
         data = {
             "subject": edge["subject_id"],
             "predicate": edge_predicate,
@@ -245,13 +443,39 @@ class SssomSource(Source):
             else:
                 data[k] = v
 
-        objs = [self.load_node(subject_node), self.load_node(object_node)]
+        objs = []
+        for node in (subject_node, object_node):
+            record = self.load_node(node)
+            if record is None:
+                objs.append(record)
+            elif self._is_new_node(record[0], record[1].get("category")):
+                objs.append(record)
 
         for k, v in self.graph_metadata.items():
             if k not in {"curie_map"}:
                 data[k] = v
 
         edge_data = sanitize_import(data.copy())
+        objs.append(self._load_edge_data(edge_data))
+
+        for o in objs:
+            yield o
+
+    def _load_edge_data(self, edge_data: Dict) -> Optional[Tuple]:
+        """
+        Apply provenance to a sanitized edge.
+
+        Parameters
+        ----------
+        edge_data: Dict
+            A sanitized edge
+
+        Returns
+        -------
+        Optional[Tuple]
+            A tuple that contains subject id, object id, edge key, and edge data
+
+        """
         if "subject" in edge_data and "object" in edge_data:
             if "id" not in edge_data:
                 edge_data["id"] = generate_uuid()
@@ -262,13 +486,10 @@ class SssomSource(Source):
 
             key = generate_edge_key(s, edge_data["predicate"], o)
             self.edge_properties.update(list(edge_data.keys()))
-            objs.append((s, o, key, edge_data))
+            return s, o, key, edge_data
         else:
             log.info(
                 "Ignoring edge with either a missing 'subject' or 'object': {}".format(
                     edge_data
                 )
             )
-
-        for o in objs:
-            yield o
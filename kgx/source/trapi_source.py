@@ -1,18 +1,28 @@
-import gzip
 import ijson
-from itertools import chain
-from typing import Dict, Tuple, Generator, Optional, Any
+from typing import Dict, Tuple, Generator, Optional, Any, IO, Iterator, List
 
 from kgx.source.json_source import JsonSource
+from kgx.utils.archive_utils import open_input
+from kgx.utils.json_utils import read_json_items
 
 
-# TODO: update for TRAPI 1.0 spec
+# The prefixes of the knowledge graph, in a TRAPI response or message
+KNOWLEDGE_GRAPH_PREFIXES = ["message.knowledge_graph", "knowledge_graph"]
 
 
 class TrapiSource(JsonSource):
     """
     TrapiSource is responsible for reading data as records
     from a TRAPI JSON.
+
+    The knowledge graph is read from a TRAPI response, which has it at
+    ``message.knowledge_graph``, or from a TRAPI message, which has it at
+    ``knowledge_graph``. Nodes and edges are read from the objects of
+    the knowledge graph, keyed by their identifiers, as in TRAPI 1.x,
+    or from lists, as in earlier versions.
+
+    The JSON is read incrementally, in a single pass, such that the
+    memory that is used does not grow with the size of the response.
     """
 
     def __init__(self):
@@ -37,7 +47,7 @@ class TrapiSource(JsonSource):
         format: str
             The format (``trapi-json``)
         compression: Optional[str]
-            The compression type (``gz``)
+            The compression type (``gz``, ``bz2``, ``xz``, ``zst``)
         kwargs: Any
             Any additional arguments
 
@@ -50,9 +60,64 @@ class TrapiSource(JsonSource):
 
         self.set_provenance_map(kwargs)
 
-        n = self.read_nodes(filename, compression)
-        e = self.read_edges(filename, compression)
-        yield from chain(n, e)
+        self.compression = compression
+        with open_input(filename, compression) as FH:
+            yield from self.read_batches(self.read_knowledge_graph(FH))
+
+    def read_knowledge_graph(self, FH: IO[bytes]) -> Iterator[Tuple[bool, List]]:
+        """
+        Read batches of nodes and edges from the knowledge graph
+        of a TRAPI JSON, in a single pass.
+
+        Parameters
+        ----------
+        FH: IO[bytes]
+            A binary file object
+
+        Returns
+        -------
+        Iterator[Tuple[bool, List]]
+            An iterator for tuples of whether the batch is a batch of
+            nodes, and a batch of nodes or edges in the KGX format
+
+        """
+        node_prefixes = {f"{x}.nodes" for x in KNOWLEDGE_GRAPH_PREFIXES}
+        edge_prefixes = {f"{x}.edges" for x in KNOWLEDGE_GRAPH_PREFIXES}
+        prefixes = node_prefixes | edge_prefixes
+        batches = read_json_items(FH, [f"{x}.item" for x in prefixes], prefixes)
+        for prefix, items in batches:
+            if prefix.endswith(".item"):
+                prefix = prefix[: -len(".item")]
+            else:
+                items = [self._with_id(k, v) for k, v in items]
+            if prefix in node_prefixes:
+                yield True, [self.prepare_node(n) for n in items]
+            else:
+                yield False, [self.prepare_edge(e) for e in items]
+
+    @staticmethod
+    def _with_id(key: str, value: Any) -> Dict:
+        """
+        Get a node or edge of a TRAPI 1.x knowledge graph, with the key
+        as its ``id``.
+
+        Parameters
+        ----------
+        key: str
+            The key of the node or edge in the knowledge graph
+        value: Any
+            The node or edge
+
+        Returns
+        -------
+        Dict
+            The node or edge
+
+        """
+        if not isinstance(value, dict):
+            value = {}
+        value.setdefault("id", key)
+        return value
 
     def read_nodes(self, filename: str, compression: Optional[str] = None) -> Generator:
         """
@@ -71,12 +136,9 @@ class TrapiSource(JsonSource):
             A generator for node records
 
         """
-        if compression == "gz":
-            FH = gzip.open(filename, "rb")
-        else:
-            FH = open(filename, "rb")
-        for n in ijson.items(FH, "knowledge_graph.nodes.item"):
-            yield self.load_node(n)
+        with open_input(filename, compression) as FH:
+            for n in ijson.items(FH, "knowledge_graph.nodes.item"):
+                yield self.load_node(n)
 
     def read_edges(self, filename: str, compression: Optional[str] = None) -> Generator:
         """
@@ -95,12 +157,9 @@ class TrapiSource(JsonSource):
             A generator for edge records
 
         """
-        if compression == "gz":
-            FH = gzip.open(filename, "rb")
-        else:
-            FH = open(filename, "rb")
-        for e in ijson.items(FH, "knowledge_graph.edges.item"):
-            yield self.load_edge(e)
+        with open_input(filename, compression) as FH:
+            for e in ijson.items(FH, "knowledge_graph.edges.item"):
+                yield self.load_edge(e)
 
     def load_node(self, node: Dict) -> Tuple[str, Dict]:
         """
@@ -115,11 +174,7 @@ class TrapiSource(JsonSource):
             A node
 
         """
-
-        if "type" in node and "category" not in node:
-            node["category"] = node["type"]
-            del node["type"]
-        return super().read_node(node)
+        return super().read_node(self.prepare_node(node))
 
     def load_edge(self, edge: Dict) -> Tuple[str, str, str, Dict]:
         """
@@ -133,6 +188,47 @@ class TrapiSource(JsonSource):
         edge : Dict
             An edge
 
+        """
+        return super().read_edge(self.prepare_edge(edge))
+
+    def prepare_node(self, node: Dict) -> Dict:
+        """
+        Transform the fields of a node in the Reasoner Std API format
+        to Biolink Model fields.
+
+        Parameters
+        ----------
+        node: Dict
+            A node
+
+        Returns
+        -------
+        Dict
+            The node
+
+        """
+        if "type" in node and "category" not in node:
+            node["category"] = node.pop("type")
+        if "categories" in node and "category" not in node:
+            node["category"] = node.pop("categories")
+        self._load_attributes(node)
+        return node
+
+    def prepare_edge(self, edge: Dict) -> Dict:
+        """
+        Transform the fields of an edge in the Reasoner Std API format
+        to Biolink Model fields.
+
+        Parameters
+        ----------
+        edge: Dict
+            An edge
+
+        Returns
+        -------
+        Dict
+            The edge
+
         """
         if "source_id" in edge:
             edge["subject"] = edge["source_id"]
@@ -140,4 +236,67 @@ class TrapiSource(JsonSource):
             edge["object"] = edge["target_id"]
         if "relation_label" in edge:
             edge["predicate"] = edge["relation_label"][0]
-        return super().read_edge(edge)
+        for qualifier in edge.pop("qualifiers", None) or []:
+            key = self._slot_name(qualifier.get("qualifier_type_id"))
+            if key:
+                edge[key] = qualifier.get("qualifier_value")
+        for source in edge.pop("sources", None) or []:
+            role = source.get("resource_role")
+            resource = source.get("resource_id")
+            if not role or not resource:
+                continue
+            if role == "primary_knowledge_source":
+                edge[role] = resource
+            else:
+                edge.setdefault(role, []).append(resource)
+        self._load_attributes(edge)
+        return edge
+
+    def _load_attributes(self, element: Dict) -> None:
+        """
+        Move the TRAPI 1.x attributes of a node or edge to properties.
+
+        Attributes of a Biolink Model slot are set as the slot, and other
+        attributes are set by their original name, or their type. The
+        properties of the node or edge take precedence over attributes.
+
+        Parameters
+        ----------
+        element: Dict
+            A node or edge
+
+        """
+        attributes = element.get("attributes")
+        if not isinstance(attributes, list):
+            return
+        del element["attributes"]
+        for attribute in attributes:
+            if not isinstance(attribute, dict) or "value" not in attribute:
+                continue
+            type_id = attribute.get("attribute_type_id")
+            key = self._slot_name(type_id)
+            if not key or key == type_id:
+                key = attribute.get("original_attribute_name") or type_id
+            if key and key not in element:
+                element[key] = attribute["value"]
+
+    @staticmethod
+    def _slot_name(curie: Optional[str]) -> Optional[str]:
+        """
+        Get the name of a Biolink Model slot from its CURIE.
+
+        Parameters
+        ----------
+        curie: Optional[str]
+            The CURIE
+
+        Returns
+        -------
+        Optional[str]
+            The name of the slot, or the CURIE if it is not of
+            a Biolink Model slot
+
+        """
+        if curie and curie.startswith("biolink:"):
+            return curie[len("biolink:") :]
+        return curie
@@ -1,10 +1,12 @@
 import re
 import tarfile
 from typing import Dict, Tuple, Any, Generator, Optional, List
+import numpy as np
 import pandas as pd
 
 from kgx.config import get_logger
 from kgx.source.source import Source
+from kgx.utils.archive_utils import open_input
 from kgx.utils.kgx_utils import (
     generate_uuid,
     generate_edge_key,
@@ -13,10 +15,18 @@ from kgx.utils.kgx_utils import (
     sanitize_import,
     validate_edge,
     validate_node,
+    column_types,
+    knowledge_provenance_properties,
+    DEFAULT_NODE_CATEGORY,
+    LIST_DELIMITER,
+    read_csv_chunks,
 )
 
 log = get_logger()
 
+# Cell values that are treated as null (see kgx.utils.kgx_utils.is_null)
+NULL_VALUES = ["", " "]
+
 
 class TsvSource(Source):
     """
@@ -68,9 +78,14 @@ class TsvSource(Source):
         format: str
             The format (``tsv``, ``csv``)
         compression: Optional[str]
-            The compression type (``tar``, ``tar.gz``)
+            The compression type (``tar``, ``tar.gz``, ``tar.bz2``, ``tar.xz``)
+            of an archive. Otherwise, the compression of the file
+            (``gz``, ``bz2``, ``xz``, ``zst``) is detected
         kwargs: Any
-            Any additional arguments
+            Any additional arguments. If ``batch`` is ``True`` then
+            each chunk of the file is yielded as a list of records.
+            ``chunksize`` sets the number of rows per chunk and ``engine``
+            sets the parser engine (``c``, by default, or ``pyarrow``).
 
         Returns
         -------
@@ -78,6 +93,9 @@ class TsvSource(Source):
             A generator for node and edge records
 
         """
+        batch = kwargs.pop("batch", False)
+        chunksize = kwargs.pop("chunksize", None)
+        engine = kwargs.pop("engine", None)
         if "delimiter" not in kwargs:
             # infer delimiter from file format
             kwargs["delimiter"] = extension_types[format]  # type: ignore
@@ -128,17 +146,12 @@ class TsvSource(Source):
                     # TODO: can this somehow be streamed here?
                     #       Question: who put the above comment here? One wonders whether the use of the chunk-based
                     #       file_iter, with the Generator yield statement below, isn't effectively streaming the file?
-                    file_iter = pd.read_csv(
-                        f,
-                        dtype=str,
-                        chunksize=10000,
-                        low_memory=False,
-                        keep_default_na=False,
-                        **kwargs,
+                    file_iter = read_csv_chunks(
+                        f, chunksize=chunksize, engine=engine, **kwargs
                     )
                     for chunk in file_iter:
                         self.node_properties.update(chunk.columns)
-                        yield from self.read_nodes(chunk)
+                        yield from self._emit(self.read_nodes(chunk), batch)
 
                 # Next, extract and capture contents of the edges files...
                 for name in edge_files:
@@ -152,44 +165,63 @@ class TsvSource(Source):
 
                     f = tar.extractfile(member)
                     # TODO: can this somehow be streamed here?
-                    file_iter = pd.read_csv(
-                        f,
-                        dtype=str,
-                        chunksize=10000,
-                        low_memory=False,
-                        keep_default_na=False,
-                        **kwargs,
+                    file_iter = read_csv_chunks(
+                        f, chunksize=chunksize, engine=engine, **kwargs
                     )
                     for chunk in file_iter:
                         self.edge_properties.update(chunk.columns)
-                        yield from self.read_edges(chunk)
+                        yield from self._emit(self.read_edges(chunk), batch)
         else:
-            file_iter = pd.read_csv(
-                filename,
-                dtype=str,
-                chunksize=10000,
-                low_memory=False,
-                keep_default_na=False,
-                **kwargs,
-            )
             if re.search(f"nodes.{format}", filename):
-                for chunk in file_iter:
-                    self.node_properties.update(chunk.columns)
-                    yield from self.read_nodes(chunk)
+                properties, read = self.node_properties, self.read_nodes
             elif re.search(f"edges.{format}", filename):
-                for chunk in file_iter:
-                    self.edge_properties.update(chunk.columns)
-                    yield from self.read_edges(chunk)
+                properties, read = self.edge_properties, self.read_edges
             else:
                 # This used to throw an exception but perhaps we should simply ignore it.
                 log.warning(
                     f"Parse function cannot resolve the KGX file type in name {filename}. Skipped..."
                 )
+                return
+            with open_input(filename, compression) as FH:
+                file_iter = read_csv_chunks(
+                    FH, chunksize=chunksize, engine=engine, **kwargs
+                )
+                for chunk in file_iter:
+                    properties.update(chunk.columns)
+                    yield from self._emit(read(chunk), batch)
+
+    @staticmethod
+    def _emit(records: Generator, batch: bool) -> Generator:
+        """
+        Yield records one at a time or, if ``batch`` is ``True``,
+        as a single list of records.
+
+        Parameters
+        ----------
+        records: Generator
+            A generator for records
+        batch: bool
+            Whether to yield the records as a list
+
+        Returns
+        -------
+        Generator
+            A generator for records or for a list of records
+
+        """
+        if batch:
+            yield [x for x in records if x]
+        else:
+            yield from records
 
     def read_nodes(self, df: pd.DataFrame) -> Generator:
         """
         Read records from pandas.DataFrame and yield records.
 
+        The columns of ``df`` are sanitized as a whole and node filters
+        are applied as boolean masks, such that records are only built
+        for the rows that pass the filters.
+
         Parameters
         ----------
         df: pandas.DataFrame
@@ -201,8 +233,17 @@ class TsvSource(Source):
             A generator for node records
 
         """
-        for obj in df.to_dict("records"):
-            yield self.read_node(obj)
+        if "id" not in df.columns:
+            # let read_node report the missing 'id'
+            for obj in df.to_dict("records"):
+                yield self.read_node(obj)
+            return
+        if "category" not in df.columns:
+            df = df.assign(category=DEFAULT_NODE_CATEGORY)
+        columns = {k: self._sanitize_column(k, df[k]) for k in df.columns}
+        mask = self._filter_mask(len(df), columns, self.node_filters)
+        for node_data in self._build_records(columns, mask):
+            yield self._read_node_data(node_data)
 
     def read_node(self, node: Dict) -> Optional[Tuple[str, Dict]]:
         """
@@ -220,6 +261,22 @@ class TsvSource(Source):
         """
         node = validate_node(node)
         node_data = sanitize_import(node.copy())
+        return self._read_node_data(node_data)
+
+    def _read_node_data(self, node_data: Dict) -> Optional[Tuple[str, Dict]]:
+        """
+        Apply provenance and node filters to a sanitized node.
+
+        Parameters
+        ----------
+        node_data: Dict
+            A sanitized node
+
+        Returns
+        -------
+        Optional[Tuple[str, Dict]]
+            A tuple that contains node id and node data
+        """
         if "id" in node_data:
 
             n = node_data["id"]
@@ -231,12 +288,16 @@ class TsvSource(Source):
                 self.node_properties.update(node_data.keys())
                 return n, node_data
         else:
-            log.info(f"Ignoring node with no 'id': {node}")
+            log.info(f"Ignoring node with no 'id': {node_data}")
 
     def read_edges(self, df: pd.DataFrame) -> Generator:
         """
         Load edges from pandas.DataFrame into an instance of BaseGraph.
 
+        The columns of ``df`` are sanitized as a whole and edge filters
+        are applied as boolean masks, such that records are only built
+        for the rows that pass the filters.
+
         Parameters
         ----------
         df: pandas.DataFrame
@@ -248,8 +309,15 @@ class TsvSource(Source):
             A generator for edge records
 
         """
-        for obj in df.to_dict("records"):
-            yield self.read_edge(obj)
+        if not {"subject", "predicate", "object"}.issubset(df.columns):
+            # let read_edge report the missing property
+            for obj in df.to_dict("records"):
+                yield self.read_edge(obj)
+            return
+        columns = {k: self._sanitize_column(k, df[k]) for k in df.columns}
+        mask = self._filter_mask(len(df), columns, self.edge_filters)
+        for edge_data in self._build_records(columns, mask):
+            yield self._read_edge_data(edge_data)
 
     def read_edge(self, edge: Dict) -> Optional[Tuple]:
         """
@@ -268,6 +336,23 @@ class TsvSource(Source):
         """
         edge = validate_edge(edge)
         edge_data = sanitize_import(edge.copy())
+        return self._read_edge_data(edge_data)
+
+    def _read_edge_data(self, edge_data: Dict) -> Optional[Tuple]:
+        """
+        Apply provenance and edge filters to a sanitized edge.
+
+        Parameters
+        ----------
+        edge_data: Dict
+            A sanitized edge
+
+        Returns
+        -------
+        Optional[Tuple]
+            A tuple that contains subject id, object id, edge key, and edge data
+
+        """
         if "id" not in edge_data:
             edge_data["id"] = generate_uuid()
         s = edge_data["subject"]
@@ -280,3 +365,144 @@ class TsvSource(Source):
         if self.check_edge_filter(edge_data):
             self.node_properties.update(edge_data.keys())
             return s, o, key, edge_data
+
+    @staticmethod
+    def _sanitize_column(key: str, column: pd.Series) -> Tuple[List, List, List]:
+        """
+        Sanitize a column of str values for the purpose of import.
+
+        This is the column-wise counterpart of
+        ``kgx.utils.kgx_utils.sanitize_import``. The whole column is
+        scanned once for line breaks, tabs and list delimiters, such
+        that the per-value work is only done when needed.
+
+        Parameters
+        ----------
+        key: str
+            Key corresponding to a node/edge property
+        column: pandas.Series
+            The values for the key
+
+        Returns
+        -------
+        Tuple[List, List, List]
+            The sanitized values, a mask of the null values
+            and a mask of the values that are lists
+
+        """
+        null = (column.isna() | column.isin(NULL_VALUES)).tolist()
+        column_type = column_types.get(key)
+        if column_type == bool:
+            return [True] * len(null), null, [False] * len(null)
+        values = column.tolist()
+        if column_type is not None and column_type != list:
+            return values, null, [False] * len(null)
+
+        values = ["" if n else x for x, n in zip(values, null)]
+        joined = "\0".join(values)
+        if "\n" in joined or "\t" in joined:
+            values = [x.replace("\n", " ").replace("\t", " ") for x in values]
+        if column_type == list:
+            is_list = [not n for n in null]
+        elif LIST_DELIMITER in joined:
+            is_list = [LIST_DELIMITER in x for x in values]
+        else:
+            return values, null, [False] * len(null)
+
+        # empty elements only occur with leading, trailing or repeated delimiters
+        d = LIST_DELIMITER
+        if (
+            joined.startswith(d)
+            or joined.endswith(d)
+            or f"{d}{d}" in joined
+            or f"{d}\0" in joined
+            or f"\0{d}" in joined
+        ):
+            values = [
+                [y for y in x.split(d) if y] if l else x
+                for x, l in zip(values, is_list)
+            ]
+        else:
+            values = [x.split(d) if l else x for x, l in zip(values, is_list)]
+        return values, null, is_list
+
+    @staticmethod
+    def _filter_mask(size: int, columns: Dict[str, Tuple], filters: Dict) -> List:
+        """
+        Build a boolean mask of the rows that may pass the given filters.
+
+        Filters on knowledge source properties, which are subject to
+        rewriting on import, are left to ``check_node_filter`` and
+        ``check_edge_filter``.
+
+        Parameters
+        ----------
+        size: int
+            The number of rows
+        columns: Dict[str, Tuple]
+            Sanitized columns, as returned by ``_sanitize_column``
+        filters: Dict
+            Node or edge filters
+
+        Returns
+        -------
+        List
+            A boolean mask
+
+        """
+        mask = np.ones(size, dtype=bool)
+        for k, v in filters.items():
+            if k in {"subject_category", "object_category"}:
+                continue
+            if k in knowledge_provenance_properties or column_types.get(k) == bool:
+                continue
+            if k not in columns:
+                return [False] * size
+            values, null, is_list = columns[k]
+            if isinstance(v, (list, set, tuple)):
+                v = set(v)
+                hit = [
+                    False
+                    if n
+                    else (not v.isdisjoint(x) if l else any(y in x for y in v))
+                    for x, n, l in zip(values, null, is_list)
+                ]
+            elif isinstance(v, str):
+                hit = [
+                    not n and not l and x == v
+                    for x, n, l in zip(values, null, is_list)
+                ]
+            else:
+                # reported by check_node_filter or check_edge_filter
+                continue
+            mask &= np.array(hit, dtype=bool)
+        return mask.tolist()
+
+    @staticmethod
+    def _build_records(columns: Dict[str, Tuple], mask: List) -> List[Dict]:
+        """
+        Build records, without null values, for the rows selected by ``mask``.
+
+        Parameters
+        ----------
+        columns: Dict[str, Tuple]
+            Sanitized columns, as returned by ``_sanitize_column``
+        mask: List
+            A boolean mask of the rows to build records for
+
+        Returns
+        -------
+        List[Dict]
+            A list of records
+
+        """
+        keys = list(columns.keys())
+        rows = [i for i, m in enumerate(mask) if m]
+        values = [[columns[k][0][i] for i in rows] for k in keys]
+        nulls = [[columns[k][1][i] for i in rows] for k in keys]
+        records = []
+        for row, row_nulls in zip(zip(*values), zip(*nulls)):
+            records.append(
+                {k: x for k, x, n in zip(keys, row, row_nulls) if not n}
+            )
+        return records
@@ -1,8 +1,14 @@
 import itertools
 import os
+import pickle
+import re
+import tempfile
+import traceback
+import multiprocessing as mp
 from os.path import exists
+from queue import Empty
 from sys import stderr
-from typing import Dict, Generator, List, Optional, Callable, Set
+from typing import Any, Dict, Generator, List, Optional, Callable, Set
 
 from kgx.config import get_logger
 from kgx.source import (
@@ -25,6 +31,7 @@ from kgx.sink import (
     JsonSink,
     JsonlSink,
     NeoSink,
+    NeoImportSink,
     RdfSink,
     NullSink,
 )
@@ -56,6 +63,7 @@ SINK_MAP = {
     "json": JsonSink,
     "jsonl": JsonlSink,
     "neo4j": NeoSink,
+    "neo4j-import": NeoImportSink,
     "nt": RdfSink,
     "null": NullSink,
 }
@@ -63,6 +71,10 @@ SINK_MAP = {
 
 log = get_logger()
 
+# Number of records that a parallel parse worker accumulates before handing
+# them over to the Transformer.process consumer
+PARALLEL_BATCH_SIZE = 10000
+
 
 class Transformer(object):
     """
@@ -75,11 +87,19 @@ class Transformer(object):
         Whether or not to stream
     infores_catalog: Optional[str]
         Optional dump of a TSV file of InfoRes CURIE to Knowledge Source mappings
+    processes: int
+        Number of worker processes used to parse input files in parallel
 
     """
 
-    def __init__(self, stream: bool = False, infores_catalog: Optional[str] = None):
+    def __init__(
+        self,
+        stream: bool = False,
+        infores_catalog: Optional[str] = None,
+        processes: int = 1,
+    ):
         self.stream = stream
+        self.processes = processes
         self.node_filters = {}
         self.edge_filters = {}
 
@@ -160,18 +180,42 @@ class Transformer(object):
 
             sources.append(source)
             generators.append(g)
+        elif self.processes > 1 and len(input_args.get("filename", [])) > 1:
+            filename = input_args.pop("filename", {})
+            # filters are applied by the workers, but Transformer.process
+            # still needs the combined node and edge filters
+            source = Source()
+            source.set_node_filters(node_filters)
+            source.set_edge_filters(edge_filters)
+            self.node_filters = source.node_filters
+            self.edge_filters = source.edge_filters
+
+            source_config = {
+                "prefix_map": prefix_map,
+                "predicate_mappings": predicate_mappings,
+                "node_property_predicates": node_property_predicates,
+                "node_filters": node_filters,
+                "edge_filters": edge_filters,
+            }
+            generators.append(
+                self._parallel_parse(filename, input_args, source_config, sources)
+            )
         else:
             filename = input_args.pop("filename", {})
+            if input_format in {"nt", "owl"} and self.processes > 1:
+                # a single N-Triples file is parsed in parallel shards,
+                # and the imports of an OWL are parsed in parallel
+                input_args.setdefault("workers", self.processes)
             for f in filename:
                 source = self.get_source(input_format)
-                source.set_prefix_map(prefix_map)
-                if isinstance(source, RdfSource):
-                    source.set_predicate_mapping(predicate_mappings)
-                    source.set_node_property_predicates(node_property_predicates)
-                source.set_node_filters(node_filters)
-                self.node_filters = source.node_filters
-                self.edge_filters = source.edge_filters
-                source.set_edge_filters(edge_filters)
+                _configure_source(
+                    source,
+                    prefix_map,
+                    predicate_mappings,
+                    node_property_predicates,
+                    node_filters,
+                    edge_filters,
+                )
                 self.node_filters = source.node_filters
                 self.edge_filters = source.edge_filters
 
@@ -240,7 +284,7 @@ class Transformer(object):
                     intermediate_sink.graph, **ks_args
                 )
 
-                if output_args["format"] in {"tsv", "csv"}:
+                if output_args["format"] in {"tsv", "csv", "neo4j-import"}:
                     if "node_properties" not in output_args:
                         output_args[
                             "node_properties"
@@ -287,6 +331,161 @@ class Transformer(object):
             for k, v in s.get_infores_catalog().items():
                 self._infores_catalog[k] = v
 
+    def _parallel_parse(
+        self, filenames: List[str], input_args: Dict, source_config: Dict, sources: List
+    ) -> Generator:
+        """
+        Parse each file in a separate worker process and yield
+        the batches of records produced by the workers.
+
+        All node records are yielded before any edge record.
+        Files are first partitioned by name into node files, edge files and
+        files that may contain both (like JSON or RDF). Node files and mixed
+        files are parsed first, with the edges of mixed files being spilled to
+        temporary files by the workers. Once every node has been yielded, the
+        edge files are parsed and the spilled edges are replayed.
+
+        Parameters
+        ----------
+        filenames: List[str]
+            The files to parse
+        input_args: Dict
+            Arguments passed to ``Source.parse``
+        source_config: Dict
+            Prefix map, predicate mappings, node property predicates and
+            filters used to configure each Source
+        sources: List
+            A list that is populated with a Source per parsed file, carrying
+            the node and edge properties that were seen in that file
+
+        Returns
+        -------
+        Generator
+            A generator for batches of node and edge records
+
+        """
+        input_format = input_args["format"]
+        node_files = []
+        edge_files = []
+        for f in filenames:
+            if re.search(f"nodes.{input_format}", f):
+                node_files.append(f)
+            elif re.search(f"edges.{input_format}", f):
+                edge_files.append(f)
+            else:
+                # a file with both nodes and edges
+                node_files.append(f)
+
+        spill_files: List[str] = []
+        # the spill files of all the workers are in one directory, such that
+        # they are removed even when a worker fails, or is terminated, or the
+        # records are not all consumed
+        spill_dir = tempfile.TemporaryDirectory(prefix="kgx-spill-")
+        try:
+            yield from self._run_workers(
+                node_files,
+                input_args,
+                source_config,
+                sources,
+                spill_files,
+                spill_dir.name,
+            )
+            yield from self._run_workers(edge_files, input_args, source_config, sources)
+            for spill_file in spill_files:
+                with open(spill_file, "rb") as SFH:
+                    while True:
+                        try:
+                            batch = pickle.load(SFH)
+                        except EOFError:
+                            break
+                        yield batch
+                os.remove(spill_file)
+        finally:
+            spill_dir.cleanup()
+
+    def _run_workers(
+        self,
+        filenames: List[str],
+        input_args: Dict,
+        source_config: Dict,
+        sources: List,
+        spill_files: Optional[List[str]] = None,
+        spill_dir: Optional[str] = None,
+    ) -> Generator:
+        """
+        Run at most ``self.processes`` parse workers at a time over
+        ``filenames`` and yield batches of records, as they arrive.
+
+        Parameters
+        ----------
+        filenames: List[str]
+            The files to parse
+        input_args: Dict
+            Arguments passed to ``Source.parse``
+        source_config: Dict
+            Arguments used to configure each Source
+        sources: List
+            A list that is populated with a Source per parsed file
+        spill_files: Optional[List[str]]
+            If defined, edge records are spilled by the workers and
+            the names of the spill files are appended to this list
+        spill_dir: Optional[str]
+            The directory for the spill files
+
+        Returns
+        -------
+        Generator
+            A generator for batches of node and edge records
+
+        """
+        if not filenames:
+            return
+        queue = mp.Queue(maxsize=self.processes * 4)
+        pending = list(filenames)
+        running: Dict[str, Any] = {}
+        try:
+            while pending or running:
+                while pending and len(running) < self.processes:
+                    f = pending.pop(0)
+                    p = mp.Process(
+                        target=_parse_worker,
+                        args=(
+                            f,
+                            input_args,
+                            source_config,
+                            queue,
+                            spill_dir if spill_files is not None else None,
+                        ),
+                    )
+                    p.start()
+                    running[f] = p
+                try:
+                    message, f, payload = queue.get(timeout=1)
+                except Empty:
+                    for f, p in running.items():
+                        if p.exitcode:
+                            raise RuntimeError(
+                                f"Worker parsing {f} exited with code {p.exitcode}"
+                            )
+                    continue
+                if message == "records":
+                    yield payload
+                elif message == "done":
+                    source = Source()
+                    source.node_properties.update(payload["node_properties"])
+                    source.edge_properties.update(payload["edge_properties"])
+                    sources.append(source)
+                    self._infores_catalog.update(payload["infores_catalog"])
+                    if payload["spill_file"] and spill_files is not None:
+                        spill_files.append(payload["spill_file"])
+                    running.pop(f).join()
+                else:
+                    raise RuntimeError(f"Error while parsing {f}:\n{payload}")
+        finally:
+            for p in running.values():
+                p.terminate()
+                p.join()
+
     def get_infores_catalog(self):
         """
         Return catalog of Information Resource mappings
@@ -300,6 +499,11 @@ class Transformer(object):
         and writing to ``sink`` by calling the relevant methods
         based on the incoming data.
 
+        The ``source`` may yield individual records or batches
+        (lists) of records. A batch is filtered and inspected as
+        a whole, and written to ``sink`` via ``write_nodes``
+        and ``write_edges``.
+
         .. note::
             The streamed data must not be mutated.
 
@@ -312,24 +516,11 @@ class Transformer(object):
 
         """
         for rec in source:
-            if rec:
+            if isinstance(rec, list):
+                self.process_batch(rec, sink)
+            elif rec:
                 if len(rec) == 4:  # infer an edge record
-                    write_edge = True
-                    if "subject_category" in self.edge_filters:
-                        if rec[0] in self._seen_nodes:
-                            write_edge = True
-                        else:
-                            write_edge = False
-                    if "object_category" in self.edge_filters:
-                        if rec[1] in self._seen_nodes:
-                            if "subject_category" in self.edge_filters:
-                                if write_edge:
-                                    write_edge = True
-                            else:
-                                write_edge = True
-                        else:
-                            write_edge = False
-                    if write_edge:
+                    if self._check_edge_nodes(rec):
                         if self.inspector:
                             self.inspector(GraphEntityType.EDGE, rec)
                         sink.write_edge(rec[-1])
@@ -340,6 +531,69 @@ class Transformer(object):
                         self.inspector(GraphEntityType.NODE, rec)
                     sink.write_node(rec[-1])
 
+    def process_batch(self, batch: List, sink: Sink) -> None:
+        """
+        Filter and inspect a batch of records and write them
+        to ``sink``.
+
+        Node records in the batch are written before edge records.
+
+        Parameters
+        ----------
+        batch: List
+            A list of node and/or edge records
+        sink: kgx.sink.sink.Sink
+            An instance of Sink
+
+        """
+        nodes = []
+        edges = []
+        track_nodes = "category" in self.node_filters
+        for rec in batch:
+            if not rec:
+                continue
+            if len(rec) == 4:
+                if self._check_edge_nodes(rec):
+                    edges.append(rec)
+            else:
+                if track_nodes:
+                    self._seen_nodes.add(rec[0])
+                nodes.append(rec)
+        if self.inspector:
+            for rec in nodes:
+                self.inspector(GraphEntityType.NODE, rec)
+            for rec in edges:
+                self.inspector(GraphEntityType.EDGE, rec)
+        if nodes:
+            sink.write_nodes([x[-1] for x in nodes])
+        if edges:
+            sink.write_edges([x[-1] for x in edges])
+
+    def _check_edge_nodes(self, rec: tuple) -> bool:
+        """
+        Check whether the subject and object of an edge record
+        were seen, as required by the 'subject_category' and
+        'object_category' edge filters.
+
+        Parameters
+        ----------
+        rec: tuple
+            An edge record
+
+        Returns
+        -------
+        bool
+            Whether the edge is to be written
+
+        """
+        if "subject_category" in self.edge_filters:
+            if rec[0] not in self._seen_nodes:
+                return False
+        if "object_category" in self.edge_filters:
+            if rec[1] not in self._seen_nodes:
+                return False
+        return True
+
     # TODO: review whether or not the 'save()' method need to be 'knowledge_source' aware?
     def save(self, output_args: Dict) -> None:
         """
@@ -417,3 +671,118 @@ class Transformer(object):
             return s(**kwargs)
         else:
             raise TypeError(f"{kwargs['format']} in an unrecognized format")
+
+
+def _configure_source(
+    source: Source,
+    prefix_map: Dict,
+    predicate_mappings: Dict,
+    node_property_predicates: Set,
+    node_filters: Dict,
+    edge_filters: Dict,
+) -> None:
+    """
+    Configure a Source with prefix map, RDF specific mappings and filters.
+
+    Parameters
+    ----------
+    source: kgx.source.source.Source
+        An instance of Source
+    prefix_map: Dict
+        Non-canonical CURIE mappings
+    predicate_mappings: Dict
+        A mapping of predicate IRIs to property names (applicable for RDF)
+    node_property_predicates: Set
+        A set of predicates that ought to be treated as node properties (applicable for RDF)
+    node_filters: Dict
+        Node filters
+    edge_filters: Dict
+        Edge filters
+
+    """
+    source.set_prefix_map(prefix_map)
+    if isinstance(source, RdfSource):
+        source.set_predicate_mapping(predicate_mappings)
+        source.set_node_property_predicates(node_property_predicates)
+    source.set_node_filters(node_filters)
+    source.set_edge_filters(edge_filters)
+
+
+def _parse_worker(
+    filename: str,
+    input_args: Dict,
+    source_config: Dict,
+    queue: Any,
+    spill_dir: Optional[str],
+) -> None:
+    """
+    Parse a file in a worker process and put batches of
+    records on to ``queue``.
+
+    Parameters
+    ----------
+    filename: str
+        The file to parse
+    input_args: Dict
+        Arguments passed to ``Source.parse``
+    source_config: Dict
+        Arguments used to configure the Source
+    queue: multiprocessing.Queue
+        The queue shared with the Transformer
+    spill_dir: Optional[str]
+        If defined, edge records are written to a spill file in this
+        directory instead of the queue
+
+    """
+    spill_file = None
+    SFH = None
+    try:
+        source = SOURCE_MAP[input_args["format"]]()
+        _configure_source(source, **source_config)
+        if spill_dir:
+            fd, spill_file = tempfile.mkstemp(suffix=".kgx", dir=spill_dir)
+            SFH = os.fdopen(fd, "wb")
+        batch = []
+        edge_batch = []
+        records = itertools.chain.from_iterable(
+            x if isinstance(x, list) else (x,)
+            for x in source.parse(
+                filename, default_provenance=os.path.basename(filename), **input_args
+            )
+        )
+        for rec in records:
+            if not rec:
+                continue
+            if SFH and len(rec) == 4:
+                edge_batch.append(rec)
+                if len(edge_batch) >= PARALLEL_BATCH_SIZE:
+                    pickle.dump(edge_batch, SFH, pickle.HIGHEST_PROTOCOL)
+                    edge_batch = []
+            else:
+                batch.append(rec)
+                if len(batch) >= PARALLEL_BATCH_SIZE:
+                    queue.put(("records", filename, batch))
+                    batch = []
+        if batch:
+            queue.put(("records", filename, batch))
+        if SFH:
+            if edge_batch:
+                pickle.dump(edge_batch, SFH, pickle.HIGHEST_PROTOCOL)
+            empty = SFH.tell() == 0
+            SFH.close()
+            if empty:
+                os.remove(spill_file)
+                spill_file = None
+        summary = {
+            "node_properties": source.node_properties,
+            "edge_properties": source.edge_properties,
+            "infores_catalog": source.get_infores_catalog(),
+            "spill_file": spill_file,
+        }
+        queue.put(("done", filename, summary))
+    except Exception:
+        if SFH:
+            SFH.close()
+        if spill_file and os.path.exists(spill_file):
+            os.remove(spill_file)
+        queue.put(("error", filename, traceback.format_exc()))
@@ -0,0 +1,541 @@
+import bz2
+import gzip
+import io
+import lzma
+import shutil
+import tarfile
+import tempfile
+import threading
+import time
+import zlib
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from queue import Queue, Full, Empty
+from typing import Optional, Dict, List, Any, Deque, IO
+
+from kgx.config import get_logger
+
+log = get_logger()
+
+# Number of bytes of a member that are compressed as one block
+BLOCK_SIZE = 1 << 20
+
+# Number of bytes of a spooled member that are kept in memory
+SPOOL_SIZE = 64 << 20
+
+# Magic bytes at the start of compressed files
+COMPRESSION_MAGIC = {
+    "gz": b"\x1f\x8b",
+    "bz2": b"BZh",
+    "xz": b"\xfd7zXZ\x00",
+    "zst": b"\x28\xb5\x2f\xfd",
+}
+
+# Number of decompressed chunks that the background reader runs ahead
+READ_AHEAD = 8
+
+
+class TarStreamWriter:
+    """
+    TarStreamWriter writes a tar archive, optionally compressed with
+    gzip or bzip2, where the content of each member is streamed as it
+    is written instead of being staged in a file first.
+
+    The content of a member is compressed in blocks, where each block is
+    an independent gzip member (or bzip2 stream). Readers of ``.gz`` and
+    ``.bz2``, including ``tarfile``, read such concatenated blocks as a
+    single stream. Since blocks are independent, they can be compressed
+    in parallel by a pool of threads.
+
+    The tar header of a member has to state its size, which is only known
+    once the member is complete. The content of one member (``stream_member``)
+    is written directly to the archive and its header is written in place
+    once the archive is closed. This is possible for ``tar`` and ``tar.gz``,
+    where the header is stored uncompressed. The content of other members is
+    compressed to spooled temporary files and appended to the archive when
+    the archive is closed.
+
+    Parameters
+    ----------
+    filename: str
+        The archive filename
+    mode: str
+        The archive write mode (``w``, ``w:gz``, ``w:bz2``)
+    stream_member: Optional[str]
+        The name of the member that is written directly to the archive
+    compression_level: int
+        The compression level
+    threads: int
+        Number of threads used for compression
+    spool_dir: Optional[str]
+        The directory for temporary files of spooled members
+
+    """
+
+    def __init__(
+        self,
+        filename: str,
+        mode: str = "w",
+        stream_member: Optional[str] = None,
+        compression_level: int = 9,
+        threads: int = 1,
+        spool_dir: Optional[str] = None,
+    ):
+        self.compression = mode.split(":")[1] if ":" in mode else None
+        if self.compression not in {None, "gz", "bz2"}:
+            raise ValueError(f"Unsupported archive write mode: {mode}")
+        self.compression_level = compression_level
+        self.threads = threads
+        self.executor = ThreadPoolExecutor(threads) if threads > 1 else None
+        self.stream_member = stream_member if self.compression != "bz2" else None
+        self.spool_dir = spool_dir
+        self.members: Dict[str, TarMemberWriter] = {}
+        self.FH = open(filename, "wb")
+
+    def open(self, name: str) -> "TarMemberWriter":
+        """
+        Open a member of the archive for writing.
+
+        Parameters
+        ----------
+        name: str
+            The member name
+
+        Returns
+        -------
+        TarMemberWriter
+            A file-like object to write the member content to
+
+        """
+        if name in self.members:
+            raise ValueError(f"Archive member {name} already open")
+        if name == self.stream_member and self.FH.tell() == 0:
+            # reserve room for the header, which is written once the size is known
+            self.FH.write(self._header(name, 0))
+            member = TarMemberWriter(self, name, self.FH)
+        else:
+            spool = tempfile.SpooledTemporaryFile(
+                max_size=SPOOL_SIZE, dir=self.spool_dir
+            )
+            member = TarMemberWriter(self, name, spool)
+        self.members[name] = member
+        return member
+
+    def close(self) -> None:
+        """
+        Complete all the members, and write their headers and
+        spooled content to the archive.
+        """
+        try:
+            for member in self.members.values():
+                member.close()
+            for name, member in self.members.items():
+                if member.FH is self.FH:
+                    end = self.FH.tell()
+                    self.FH.seek(0)
+                    self.FH.write(self._header(name, member.size))
+                    self.FH.seek(end)
+            for name, member in self.members.items():
+                if member.FH is not self.FH:
+                    self.FH.write(self._header(name, member.size))
+                    member.FH.seek(0)
+                    shutil.copyfileobj(member.FH, self.FH)
+                    member.FH.close()
+            # end-of-archive marker
+            self.FH.write(self.compress(tarfile.NUL * tarfile.BLOCKSIZE * 2))
+        finally:
+            self.FH.close()
+            if self.executor:
+                self.executor.shutdown()
+
+    def submit(self, data: bytes) -> Any:
+        """
+        Compress a block of data, in a separate thread if
+        more than one thread is used.
+
+        Parameters
+        ----------
+        data: bytes
+            The data
+
+        Returns
+        -------
+        Any
+            A ``concurrent.futures.Future`` or the compressed data
+
+        """
+        if self.executor:
+            return self.executor.submit(self.compress, data)
+        return self.compress(data)
+
+    def compress(self, data: bytes, level: Optional[int] = None) -> bytes:
+        """
+        Compress a block of data as a gzip member or bzip2 stream.
+
+        Parameters
+        ----------
+        data: bytes
+            The data
+        level: Optional[int]
+            The compression level, if other than ``compression_level``
+
+        Returns
+        -------
+        bytes
+            The compressed data
+
+        """
+        level = self.compression_level if level is None else level
+        if self.compression == "gz":
+            c = zlib.compressobj(level, zlib.DEFLATED, 31)
+            return c.compress(data) + c.flush()
+        elif self.compression == "bz2":
+            return bz2.compress(data, max(level, 1))
+        return data
+
+    def _header(self, name: str, size: int) -> bytes:
+        """
+        Build the header for a member.
+
+        Headers are in the GNU format, which encodes large sizes within
+        the header block, and gzip headers are stored without compression,
+        such that the length of a header does not depend on the size.
+
+        Parameters
+        ----------
+        name: str
+            The member name
+        size: int
+            The member size
+
+        Returns
+        -------
+        bytes
+            The header
+
+        """
+        info = tarfile.TarInfo(name)
+        info.size = size
+        info.mtime = int(time.time())
+        info.mode = 0o644
+        return self.compress(info.tobuf(format=tarfile.GNU_FORMAT), level=0)
+
+
+class TarMemberWriter:
+    """
+    A file-like object for writing the content of a member of a tar archive.
+
+    Parameters
+    ----------
+    archive: TarStreamWriter
+        The archive
+    name: str
+        The member name
+    FH: IO
+        The file to write the compressed content to
+
+    """
+
+    def __init__(self, archive: TarStreamWriter, name: str, FH: IO):
+        self.archive = archive
+        self.name = name
+        self.FH = FH
+        self.size = 0
+        self.closed = False
+        self.buffer: List[bytes] = []
+        self.buffered = 0
+        self.pending: Deque = deque()
+
+    def write(self, data: str) -> None:
+        """
+        Write str data to the member.
+
+        Parameters
+        ----------
+        data: str
+            The data
+
+        """
+        b = data.encode("utf-8")
+        self.buffer.append(b)
+        self.buffered += len(b)
+        self.size += len(b)
+        if self.buffered >= BLOCK_SIZE:
+            self._submit()
+
+    def close(self) -> None:
+        """
+        Pad the member content to a multiple of the tar block size
+        and write any pending blocks.
+        """
+        if self.closed:
+            return
+        remainder = self.size % tarfile.BLOCKSIZE
+        if remainder:
+            self.buffer.append(tarfile.NUL * (tarfile.BLOCKSIZE - remainder))
+        self._submit()
+        self._drain(0)
+        self.closed = True
+
+    def _submit(self) -> None:
+        """
+        Submit the buffered data for compression as one block.
+        """
+        if not self.buffer:
+            return
+        self.pending.append(self.archive.submit(b"".join(self.buffer)))
+        self.buffer = []
+        self.buffered = 0
+        self._drain(self.archive.threads * 2)
+
+    def _drain(self, limit: int) -> None:
+        """
+        Write compressed blocks, in order, until at most ``limit`` are pending.
+
+        Parameters
+        ----------
+        limit: int
+            Number of blocks that may remain pending
+
+        """
+        while len(self.pending) > limit:
+            block = self.pending.popleft()
+            self.FH.write(block if isinstance(block, bytes) else block.result())
+
+
+def detect_compression(filename: str) -> Optional[str]:
+    """
+    Detect the compression of a file from its magic bytes.
+
+    Parameters
+    ----------
+    filename: str
+        The filename
+
+    Returns
+    -------
+    Optional[str]
+        The compression type (``gz``, ``bz2``, ``xz``, ``zst``),
+        or ``None`` if the file is not compressed
+
+    """
+    with open(filename, "rb") as FH:
+        head = FH.read(8)
+    for compression, magic in COMPRESSION_MAGIC.items():
+        if head.startswith(magic):
+            return compression
+    return None
+
+
+def open_input(
+    filename: str, compression: Optional[str] = None, threaded: bool = True
+) -> IO[bytes]:
+    """
+    Open a file, which may be compressed, for reading bytes.
+
+    The compression is detected from the magic bytes of the file, such
+    that ``compression`` is only used to warn of a mismatch. Compressed
+    files are decompressed by a background thread, which runs ahead of
+    the reader, such that decompression overlaps with parsing.
+
+    Parameters
+    ----------
+    filename: str
+        The filename
+    compression: Optional[str]
+        The expected compression type (``gz``, ``bz2``, ``xz``, ``zst``)
+    threaded: bool
+        Whether to decompress in a background thread
+
+    Returns
+    -------
+    IO[bytes]
+        A binary file object
+
+    """
+    detected = detect_compression(filename)
+    if compression in COMPRESSION_MAGIC and compression != detected:
+        log.warning(
+            f"{filename} was expected to be '{compression}' compressed, "
+            f"but is {f'{detected!r} compressed' if detected else 'not compressed'}"
+        )
+    if detected is None:
+        return open(filename, "rb")
+    if detected == "gz":
+        FH: IO[bytes] = gzip.open(filename, "rb")
+    elif detected == "bz2":
+        FH = bz2.open(filename, "rb")
+    elif detected == "xz":
+        FH = lzma.open(filename, "rb")
+    else:
+        try:
+            import zstandard
+        except ImportError:
+            raise ImportError(
+                f"Reading zstd compressed {filename} requires the zstandard package"
+            )
+        FH = io.BufferedReader(
+            zstandard.ZstdDecompressor().stream_reader(
+                open(filename, "rb"), closefd=True
+            )
+        )
+    if not threaded:
+        return FH
+    return io.BufferedReader(BackgroundReader(FH, filename), buffer_size=BLOCK_SIZE)
+
+
+def open_output(
+    filename: str,
+    compression: Optional[str] = None,
+    compression_level: Optional[int] = None,
+) -> IO[bytes]:
+    """
+    Open a file, which may be compressed, for writing bytes.
+
+    Parameters
+    ----------
+    filename: str
+        The filename
+    compression: Optional[str]
+        The compression type (``gz``, ``bz2``, ``xz``, ``zst``)
+    compression_level: Optional[int]
+        The compression level, if other than the default of the compression type
+
+    Returns
+    -------
+    IO[bytes]
+        A binary file object
+
+    """
+    if not compression:
+        return open(filename, "wb")
+    if compression == "gz":
+        level = 9 if compression_level is None else compression_level
+        return gzip.open(filename, "wb", compresslevel=level)
+    elif compression == "bz2":
+        level = 9 if compression_level is None else compression_level
+        return bz2.open(filename, "wb", compresslevel=level)
+    elif compression == "xz":
+        return lzma.open(filename, "wb", preset=compression_level)
+    elif compression == "zst":
+        try:
+            import zstandard
+        except ImportError:
+            raise ImportError(
+                f"Writing zstd compressed {filename} requires the zstandard package"
+            )
+        level = 3 if compression_level is None else compression_level
+        return zstandard.ZstdCompressor(level=level).stream_writer(
+            open(filename, "wb"), closefd=True
+        )
+    raise ValueError(f"Unsupported compression type: {compression}")
+
+
+class BackgroundReader(io.RawIOBase):
+    """
+    A raw binary stream that reads from a file object in a background
+    thread, in chunks of ``BLOCK_SIZE`` bytes.
+
+    Decompressors for gzip, bzip2, xz and zstd release the GIL while
+    decompressing, such that reading from a compressed file object in a
+    background thread overlaps decompression with the consumer.
+
+    Parameters
+    ----------
+    FH: IO[bytes]
+        The file object to read from
+    name: str
+        The name of the file
+
+    """
+
+    def __init__(self, FH: IO[bytes], name: str):
+        super().__init__()
+        self.FH = FH
+        self.name = name
+        self.queue: Queue = Queue(maxsize=READ_AHEAD)
+        self.stopped = threading.Event()
+        self.chunk = memoryview(b"")
+        self.eof = False
+        self.thread = threading.Thread(target=self._run, daemon=True)
+        self.thread.start()
+
+    def _run(self) -> None:
+        """
+        Read chunks into the queue until the end of the file is reached,
+        an error occurs or the reader is closed.
+        """
+        try:
+            while not self.stopped.is_set():
+                data = self.FH.read(BLOCK_SIZE)
+                self._put(data)
+                if not data:
+                    break
+        except Exception as e:
+            self._put(e)
+
+    def _put(self, item: Any) -> None:
+        """
+        Put an item in the queue, unless the reader is closed.
+
+        Parameters
+        ----------
+        item: Any
+            A chunk of bytes or an exception
+
+        """
+        while not self.stopped.is_set():
+            try:
+                self.queue.put(item, timeout=0.1)
+                return
+            except Full:
+                continue
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, b: Any) -> int:
+        """
+        Read bytes into a pre-allocated, writable bytes-like object.
+
+        Parameters
+        ----------
+        b: Any
+            A writable bytes-like object
+
+        Returns
+        -------
+        int
+            The number of bytes read, or 0 at the end of the file
+
+        """
+        if not self.chunk:
+            if self.eof:
+                return 0
+            item = self.queue.get()
+            if isinstance(item, Exception):
+                self.eof = True
+                raise item
+            if not item:
+                self.eof = True
+                return 0
+            self.chunk = memoryview(item)
+        n = min(len(b), len(self.chunk))
+        b[:n] = self.chunk[:n]
+        self.chunk = self.chunk[n:]
+        return n
+
+    def close(self) -> None:
+        """
+        Stop the background thread and close the underlying file object.
+        """
+        if not self.closed:
+            self.stopped.set()
+            try:
+                while True:
+                    self.queue.get_nowait()
+            except Empty:
+                pass
+            self.thread.join()
+            self.FH.close()
+        super().close()
@@ -0,0 +1,250 @@
+import os
+import pickle
+import sqlite3
+import tempfile
+from typing import Any, Dict, Hashable, Iterator, MutableMapping, Optional, Set, Tuple
+
+from kgx.config import get_logger
+
+log = get_logger()
+
+# Estimated number of bytes of memory for each cached entry, until entries are spilled
+DEFAULT_ENTRY_SIZE = 1024
+
+# Ratio of the memory of an entry to the size of the entry when pickled
+MEMORY_OVERHEAD = 4
+
+# Fraction of the entries in memory that are spilled at a time
+SPILL_FRACTION = 0.25
+
+# Number of rows that are fetched at a time when iterating over spilled entries
+FETCH_SIZE = 10000
+
+_MISSING = object()
+
+
+class DiskCache(MutableMapping):
+    """
+    DiskCache is a mapping that keeps recently inserted entries in memory
+    and spills the oldest entries to a SQLite database on disk, such that
+    the memory held by the entries is bounded by a budget.
+
+    An entry that is looked up, or checked for, is moved back to memory,
+    such that changes to the value are kept, as they are for a ``dict``.
+    A value must not be changed after other entries have been inserted,
+    since the entry may have been spilled. The memory of entries is
+    estimated from the size of the spilled entries, when pickled.
+
+    Keys are strings or tuples of strings without NUL characters,
+    and values are picklable.
+    The cache must not be changed while iterating over it.
+
+    Parameters
+    ----------
+    memory: int
+        The number of bytes of memory for the entries in memory
+    directory: Optional[str]
+        The directory for the database, which is the default
+        temporary directory if not defined
+
+    """
+
+    def __init__(self, memory: int, directory: Optional[str] = None):
+        self.memory = memory
+        self.entry_size = DEFAULT_ENTRY_SIZE
+        self.capacity = self._capacity()
+        self.hot: Dict = {}
+        self.spilled = 0
+        # hashes of the keys on disk, such that most new keys are not looked up
+        self.spilled_hashes: Set[int] = set()
+        self.tmpdir = tempfile.TemporaryDirectory(prefix="kgx-cache-", dir=directory)
+        self.db = sqlite3.connect(os.path.join(self.tmpdir.name, "cache.sqlite"))
+        self.db.execute("PRAGMA journal_mode = OFF")
+        self.db.execute("PRAGMA synchronous = OFF")
+        self.db.execute("CREATE TABLE cache (key TEXT PRIMARY KEY, value BLOB)")
+
+    def _capacity(self) -> int:
+        """
+        Get the number of entries that fit in memory.
+
+        Returns
+        -------
+        int
+            The number of entries
+
+        """
+        return max(1, int(self.memory // (self.entry_size * MEMORY_OVERHEAD)))
+
+    @staticmethod
+    def _encode_key(key: Hashable) -> str:
+        """
+        Encode a key as a string for the database, where a tuple
+        is joined by, and prefixed with, a NUL character.
+
+        Parameters
+        ----------
+        key: Hashable
+            A string or a tuple of strings
+
+        Returns
+        -------
+        str
+            The encoded key
+
+        """
+        if isinstance(key, str):
+            return key
+        return "\0" + "\0".join(key)
+
+    @staticmethod
+    def _decode_key(key: str) -> Hashable:
+        """
+        Decode a key from the database.
+
+        Parameters
+        ----------
+        key: str
+            The encoded key
+
+        Returns
+        -------
+        Hashable
+            A string or a tuple of strings
+
+        """
+        if key.startswith("\0"):
+            return tuple(key[1:].split("\0"))
+        return key
+
+    def _load(self, key: Hashable) -> Any:
+        """
+        Take an entry from the database.
+
+        Parameters
+        ----------
+        key: Hashable
+            The key
+
+        Returns
+        -------
+        Any
+            The value, or a sentinel if the key is not in the database
+
+        """
+        if not self.spilled or hash(key) not in self.spilled_hashes:
+            return _MISSING
+        encoded = self._encode_key(key)
+        row = self.db.execute(
+            "SELECT value FROM cache WHERE key = ?", (encoded,)
+        ).fetchone()
+        if row is None:
+            return _MISSING
+        self.db.execute("DELETE FROM cache WHERE key = ?", (encoded,))
+        self.spilled -= 1
+        return pickle.loads(row[0])
+
+    def _spill(self) -> None:
+        """
+        Move the oldest entries in memory to the database, if there
+        are more entries in memory than fit in the budget.
+        """
+        if len(self.hot) <= self.capacity:
+            return
+        n = max(len(self.hot) - self.capacity, int(len(self.hot) * SPILL_FRACTION))
+        rows = []
+        size = 0
+        for key in list(self.hot)[:n]:
+            value = pickle.dumps(self.hot.pop(key), pickle.HIGHEST_PROTOCOL)
+            size += len(value)
+            rows.append((self._encode_key(key), value))
+            self.spilled_hashes.add(hash(key))
+        self.db.executemany("INSERT INTO cache (key, value) VALUES (?, ?)", rows)
+        self.spilled += len(rows)
+        self.entry_size = max(1, size // len(rows))
+        self.capacity = self._capacity()
+        log.debug(
+            f"Spilled {len(rows)} entries to disk; {self.spilled} entries on disk"
+        )
+
+    def __getitem__(self, key: Hashable) -> Any:
+        value = self.hot.get(key, _MISSING)
+        if value is _MISSING:
+            value = self._load(key)
+            if value is _MISSING:
+                raise KeyError(key)
+            self.hot[key] = value
+            self._spill()
+        return value
+
+    def __setitem__(self, key: Hashable, value: Any) -> None:
+        if key in self.hot:
+            self.hot[key] = value
+            return
+        if self.spilled:
+            self._load(key)
+        self.hot[key] = value
+        self._spill()
+
+    def __delitem__(self, key: Hashable) -> None:
+        if self.hot.pop(key, _MISSING) is _MISSING and self._load(key) is _MISSING:
+            raise KeyError(key)
+
+    def __contains__(self, key: Any) -> bool:
+        if key in self.hot:
+            return True
+        # an entry on disk is moved to memory, since it is usually looked up next
+        value = self._load(key)
+        if value is _MISSING:
+            return False
+        self.hot[key] = value
+        self._spill()
+        return True
+
+    def __len__(self) -> int:
+        return len(self.hot) + self.spilled
+
+    def __iter__(self) -> Iterator:
+        for key, _ in self.items():
+            yield key
+
+    def items(self) -> Iterator[Tuple[Hashable, Any]]:
+        """
+        Iterate over the entries in memory and then the entries on disk,
+        without moving entries between them.
+
+        Returns
+        -------
+        Iterator[Tuple[Hashable, Any]]
+            An iterator for keys and values
+
+        """
+        yield from list(self.hot.items())
+        if not self.spilled:
+            return
+        cursor = self.db.execute("SELECT key, value FROM cache")
+        while True:
+            rows = cursor.fetchmany(FETCH_SIZE)
+            if not rows:
+                break
+            for key, value in rows:
+                yield self._decode_key(key), pickle.loads(value)
+
+    def clear(self) -> None:
+        """
+        Remove all entries.
+        """
+        self.hot.clear()
+        if self.spilled:
+            self.db.execute("DELETE FROM cache")
+            self.spilled = 0
+        self.spilled_hashes.clear()
+
+    def close(self) -> None:
+        """
+        Close and remove the database.
+        """
+        self.hot.clear()
+        self.spilled = 0
+        self.spilled_hashes.clear()
+        self.db.close()
+        self.tmpdir.cleanup()
@@ -0,0 +1,431 @@
+import json
+import threading
+from queue import Queue, Full
+from typing import Any, Dict, IO, Iterator, List, Optional, Tuple
+
+import ijson
+import jsonlines
+
+from kgx.config import get_logger
+from kgx.utils.archive_utils import READ_AHEAD
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    # the C backend of ijson, if it was built with yajl2
+    ijson_backend = ijson.get_backend("yajl2_c")
+except ImportError:
+    ijson_backend = ijson
+
+log = get_logger()
+
+# Number of bytes of JSON Lines that are read, or buffered for writing, at a time
+JSONL_BLOCK_SIZE = 1 << 20
+
+ORJSON_OPTIONS = (
+    orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY if orjson else None
+)
+
+
+def dumps(obj: Any) -> bytes:
+    """
+    Serialize an object as UTF-8 encoded JSON, using orjson if it is
+    installed and the ``json`` module otherwise.
+
+    Parameters
+    ----------
+    obj: Any
+        The object to serialize
+
+    Returns
+    -------
+    bytes
+        The serialized object
+
+    """
+    if orjson:
+        try:
+            return orjson.dumps(obj, option=ORJSON_OPTIONS)
+        except TypeError:
+            # values that orjson does not support, like big integers
+            pass
+    return json.dumps(obj, ensure_ascii=False).encode("utf-8")
+
+
+def read_jsonl(FH: IO[bytes], block_size: int = JSONL_BLOCK_SIZE) -> Iterator[Any]:
+    """
+    Read JSON Lines from a binary file object and yield the decoded objects.
+
+    With orjson, lines are read in blocks of roughly ``block_size`` bytes
+    and decoded by orjson. Otherwise, lines are decoded by ``jsonlines.Reader``.
+    Blank lines are skipped.
+
+    Parameters
+    ----------
+    FH: IO[bytes]
+        A binary file object
+    block_size: int
+        Number of bytes of lines to read at a time
+
+    Returns
+    -------
+    Iterator[Any]
+        An iterator for the decoded objects
+
+    """
+    if not orjson:
+        yield from jsonlines.Reader(FH).iter(skip_empty=True)
+        return
+    loads = orjson.loads
+    lineno = 0
+    while True:
+        lines = FH.readlines(block_size)
+        if not lines:
+            break
+        for line in lines:
+            lineno += 1
+            try:
+                obj = loads(line)
+            except orjson.JSONDecodeError as e:
+                if line.isspace():
+                    continue
+                raise jsonlines.InvalidLineError(
+                    f"line contains invalid json: {e}", line, lineno
+                ) from e
+            yield obj
+
+
+class JsonlWriter:
+    """
+    JsonlWriter writes objects as JSON Lines to a binary file object,
+    through a buffer of serialized lines.
+
+    Parameters
+    ----------
+    FH: IO[bytes]
+        A binary file object
+    buffer_size: int
+        Number of bytes to buffer before writing to the file object
+
+    """
+
+    def __init__(self, FH: IO[bytes], buffer_size: int = JSONL_BLOCK_SIZE):
+        self.FH = FH
+        self.buffer_size = buffer_size
+        self.buffer: List[bytes] = []
+        self.buffered = 0
+
+    def write(self, obj: Dict) -> None:
+        """
+        Write an object as a line.
+
+        Parameters
+        ----------
+        obj: Dict
+            The object
+
+        """
+        line = dumps(obj)
+        self.buffer.append(line)
+        self.buffered += len(line) + 1
+        if self.buffered >= self.buffer_size:
+            self.flush()
+
+    def write_all(self, objs: List) -> None:
+        """
+        Write objects, each as a line.
+
+        Parameters
+        ----------
+        objs: List
+            A list of objects
+
+        """
+        lines = [dumps(x) for x in objs]
+        self.buffer.extend(lines)
+        self.buffered += sum(len(x) + 1 for x in lines)
+        if self.buffered >= self.buffer_size:
+            self.flush()
+
+    def flush(self) -> None:
+        """
+        Write buffered lines to the file object.
+        """
+        if self.buffer:
+            self.buffer.append(b"")
+            self.FH.write(b"\n".join(self.buffer))
+        self.buffer = []
+        self.buffered = 0
+
+    def close(self) -> None:
+        """
+        Write buffered lines and close the file object.
+        """
+        self.flush()
+        self.FH.close()
+
+
+def read_json_items(
+    FH: IO[bytes], prefixes: List[str], kv_prefixes: Optional[List[str]] = None
+) -> Iterator[Tuple[str, List]]:
+    """
+    Read the items of one or more arrays, and the key-value pairs of one
+    or more objects, from a JSON document, in a single pass over the file
+    object.
+
+    Each prefix is an ijson prefix for the items of an array, like
+    ``nodes.item`` or ``graphs.item.edges.item``. Each key-value prefix is
+    an ijson prefix for an object, like ``message.knowledge_graph.nodes``,
+    whose entries are read as ``(key, value)`` tuples, as by
+    ``ijson.kvitems``. The same path may be given in both forms, and is
+    read in the form that matches the value in the document. Items are
+    yielded in batches, in the order in which they appear in the document.
+
+    The document is parsed by ``ijson`` as a whole, such that it is
+    tokenized once and objects are built by the C backend, if available.
+    Items are taken from their arrays and objects as soon as they are
+    complete, and the values that are not at any of the prefixes are
+    discarded as they are built, such that only the items of the current
+    block are kept in memory. Since ijson only returns the document once
+    it is complete, the document is parsed in a background thread.
+
+    Parameters
+    ----------
+    FH: IO[bytes]
+        A binary file object
+    prefixes: List[str]
+        The prefixes of the arrays to read items from
+    kv_prefixes: Optional[List[str]]
+        The prefixes of the objects to read key-value pairs from
+
+    Returns
+    -------
+    Iterator[Tuple[str, List]]
+        An iterator for tuples of prefix and a batch of items
+
+    """
+    reader = JsonItemReader(FH, prefixes, kv_prefixes)
+    try:
+        while True:
+            batch = reader.queue.get()
+            if batch is None:
+                break
+            if isinstance(batch, Exception):
+                raise batch
+            yield batch
+    finally:
+        reader.close()
+
+
+class JsonItemReader:
+    """
+    JsonItemReader parses a JSON document in a background thread and puts
+    batches of items, from the arrays and objects at the given prefixes,
+    in a queue.
+
+    Batches are taken from the arrays and objects of the partially built
+    document whenever the parser reads the next block of the file, and
+    the other values of the document are discarded, such that the
+    document never holds more than a block of items.
+
+    Parameters
+    ----------
+    FH: IO[bytes]
+        A binary file object
+    prefixes: List[str]
+        The prefixes of the arrays to read items from
+    kv_prefixes: Optional[List[str]]
+        The prefixes of the objects to read key-value pairs from
+
+    """
+
+    def __init__(
+        self,
+        FH: IO[bytes],
+        prefixes: List[str],
+        kv_prefixes: Optional[List[str]] = None,
+    ):
+        self.FH = FH
+        # a trie of the keys of the prefixes, where the prefix of array items
+        # is at the key 'item', and the prefix of an object is at the key None
+        self.paths: Dict = {}
+        for prefix in prefixes:
+            path = prefix.split(".")
+            if path[-1] != "item":
+                raise ValueError(f"Prefix {prefix} is not a prefix of array items")
+            trie = self.paths
+            for key in path[:-1]:
+                trie = trie.setdefault(key, {})
+            trie["item"] = prefix
+        for prefix in kv_prefixes or []:
+            trie = self.paths
+            for key in prefix.split(".") if prefix else []:
+                trie = trie.setdefault(key, {})
+            trie[None] = prefix
+        self.root: Optional[Dict] = None
+        self.queue: Queue = Queue(maxsize=READ_AHEAD)
+        self.stopped = threading.Event()
+        self.thread = threading.Thread(target=self._run, daemon=True)
+        self.thread.start()
+
+    def _run(self) -> None:
+        """
+        Parse the document, and put the batches and a final ``None``
+        in the queue, or an exception if parsing failed.
+        """
+        try:
+            for _ in ijson_backend.items(self, "", map_type=self._map):
+                pass
+            if self.root is not None:
+                self._take(self.root, self.paths, True)
+            self._put(None)
+        except _Stopped:
+            pass
+        except Exception as e:
+            self._put(e)
+
+    def _map(self) -> Dict:
+        """
+        Create a map for an object of the document, where the
+        first one is the root of the document.
+
+        Returns
+        -------
+        Dict
+            An empty map
+
+        """
+        m: Dict = {}
+        if self.root is None:
+            self.root = m
+        return m
+
+    def read(self, size: int = -1) -> bytes:
+        """
+        Take the complete items from the document, and read
+        the next block of the file for the parser.
+
+        Parameters
+        ----------
+        size: int
+            Number of bytes to read
+
+        Returns
+        -------
+        bytes
+            The bytes read
+
+        """
+        if self.stopped.is_set():
+            raise _Stopped()
+        if self.root is not None:
+            self._take(self.root, self.paths, False)
+        return self.FH.read(size)
+
+    def _take(self, value: Any, trie: Dict, complete: bool) -> None:
+        """
+        Take the items from the arrays and objects at the prefixes, within
+        a value of the document, and put them in the queue. The complete
+        values that are not at, or within, any of the prefixes are removed.
+
+        Parameters
+        ----------
+        value: Any
+            A value of the document
+        trie: Dict
+            The remaining keys of the prefixes, as a trie
+        complete: bool
+            Whether the value is complete
+
+        """
+        if isinstance(value, dict):
+            keys = list(value)
+            # the value at the last key may not be complete yet
+            n = len(keys) if complete else len(keys) - 1
+            prefix = trie.get(None)
+            if prefix is not None:
+                if n > 0:
+                    self._put((prefix, [(k, value.pop(k)) for k in keys[:n]]))
+                return
+            for i, key in enumerate(keys):
+                subtrie = trie.get(key)
+                if isinstance(subtrie, dict):
+                    self._take(value[key], subtrie, i < n)
+                elif i < n:
+                    del value[key]
+                else:
+                    self._prune(value[key])
+        elif isinstance(value, list):
+            item = trie.get("item")
+            n = len(value) if complete else len(value) - 1
+            if isinstance(item, str):
+                if n > 0:
+                    self._put((item, value[:n]))
+                    del value[:n]
+            elif item is not None:
+                for i, element in enumerate(value):
+                    self._take(element, item, i < n)
+            else:
+                self._prune(value)
+
+    def _prune(self, value: Any) -> None:
+        """
+        Remove the complete values within a value that is not read,
+        which may not be complete yet, such that only the value that
+        is being built is kept.
+
+        Parameters
+        ----------
+        value: Any
+            A value of the document
+
+        """
+        while True:
+            if isinstance(value, dict):
+                keys = list(value)
+                for key in keys[:-1]:
+                    del value[key]
+                if not keys:
+                    return
+                value = value[keys[-1]]
+            elif isinstance(value, list):
+                del value[:-1]
+                if not value:
+                    return
+                value = value[-1]
+            else:
+                return
+
+    def _put(self, item: Any) -> None:
+        """
+        Put an item in the queue, unless the reader is closed.
+
+        Parameters
+        ----------
+        item: Any
+            A batch, an exception or ``None``
+
+        """
+        while not self.stopped.is_set():
+            try:
+                self.queue.put(item, timeout=0.1)
+                return
+            except Full:
+                continue
+        raise _Stopped()
+
+    def close(self) -> None:
+        """
+        Stop the background thread.
+        """
+        self.stopped.set()
+        self.thread.join()
+
+
+class _Stopped(Exception):
+    """
+    Raised in the parser thread when the reader is closed.
+    """
@@ -1,9 +1,10 @@
+import csv
 import importlib
 import re
 import time
 import uuid
 from enum import Enum
-from typing import List, Dict, Set, Optional, Any, Union
+from typing import List, Dict, Set, Optional, Any, Union, IO, Iterator
 import stringcase
 from linkml_runtime.linkml_model.meta import (
     TypeDefinitionName,
@@ -70,7 +71,12 @@ knowledge_provenance_properties = set(provenance_slot_types.keys())
 
 extension_types = {"csv": ",", "tsv": "\t", "csv:neo4j": ",", "tsv:neo4j": "\t"}
 
-archive_read_mode = {"tar": "r", "tar.gz": "r:gz", "tar.bz2": "r:bz2"}
+archive_read_mode = {
+    "tar": "r",
+    "tar.gz": "r:gz",
+    "tar.bz2": "r:bz2",
+    "tar.xz": "r:xz",
+}
 archive_write_mode = {"tar": "w", "tar.gz": "w:gz", "tar.bz2": "w:bz2"}
 
 archive_format = {
@@ -82,6 +88,12 @@ archive_format = {
     "w:bz2": "tar.bz2",
 }
 
+# Number of rows per DataFrame chunk when reading TSV/CSV
+DEFAULT_CHUNK_SIZE = 10000
+
+# Engines that can be used for reading TSV/CSV
+csv_engines = {"c", "pyarrow"}
+
 is_provenance_property_multivalued = {
     "knowledge_source": True,
     "primary_knowledge_source": False,
@@ -1097,3 +1109,172 @@ def apply_graph_operations(graph: BaseGraph, operations: List) -> None:
         function_name = op_name.split(".")[-1]
         f = getattr(importlib.import_module(module_name), function_name)
         f(graph, **op_args)
+
+
+def read_csv_chunks(
+    source: Union[str, IO],
+    chunksize: Optional[int] = None,
+    engine: Optional[str] = None,
+    **kwargs: Any,
+) -> Iterator[pd.DataFrame]:
+    """
+    Read a TSV/CSV as chunks of pandas.DataFrame, where all the values
+    are read as str and empty cells are read as empty strings.
+
+    Parameters
+    ----------
+    source: Union[str, IO]
+        A filename or a file object
+    chunksize: Optional[int]
+        Number of rows per chunk (``DEFAULT_CHUNK_SIZE``, by default)
+    engine: Optional[str]
+        The parser engine. Either ``c`` (default) for the pandas C parser or
+        ``pyarrow`` for the multithreaded pyarrow CSV reader, which requires
+        the optional pyarrow package
+    kwargs: Any
+        Any additional arguments to the parser
+
+    Returns
+    -------
+    Iterator[pandas.DataFrame]
+        An iterator for chunks of the TSV/CSV
+
+    """
+    if not chunksize:
+        chunksize = DEFAULT_CHUNK_SIZE
+    if engine is None:
+        engine = "c"
+    if engine not in csv_engines:
+        raise ValueError(
+            f"Unsupported CSV engine '{engine}'. Can be one of {sorted(csv_engines)}"
+        )
+    if engine == "pyarrow":
+        return _read_csv_chunks_pyarrow(source, int(chunksize), **kwargs)
+    return pd.read_csv(
+        source,
+        dtype=str,
+        chunksize=int(chunksize),
+        low_memory=False,
+        keep_default_na=False,
+        **kwargs,
+    )
+
+
+def _read_csv_chunks_pyarrow(
+    source: Union[str, IO],
+    chunksize: int,
+    delimiter: str = ",",
+    quoting: int = csv.QUOTE_MINIMAL,
+    comment: Optional[str] = None,
+    **kwargs: Any,
+) -> Iterator[pd.DataFrame]:
+    """
+    Read a TSV/CSV as chunks of pandas.DataFrame using the pyarrow
+    streaming CSV reader, which decodes blocks of the file in parallel.
+
+    Parameters
+    ----------
+    source: Union[str, IO]
+        A filename or a binary file object
+    chunksize: int
+        Number of rows per chunk
+    delimiter: str
+        The field delimiter
+    quoting: int
+        The quoting behavior, as defined by the ``csv`` module
+    comment: Optional[str]
+        The prefix for comment lines at the head of the file
+    kwargs: Any
+        Any additional arguments. Only ``lineterminator`` of ``\n``
+        is supported; any other argument is ignored
+
+    Returns
+    -------
+    Iterator[pandas.DataFrame]
+        An iterator for chunks of the TSV/CSV
+
+    """
+    try:
+        import pyarrow as pa
+        from pyarrow import csv as pa_csv
+    except ImportError:
+        raise ImportError("The 'pyarrow' CSV engine requires the pyarrow package")
+
+    ignored = set(kwargs.keys())
+    if kwargs.pop("lineterminator", "\n") != "\n":
+        ignored.add("lineterminator")
+    else:
+        ignored.discard("lineterminator")
+    if ignored:
+        log.warning(
+            f"Arguments not supported by the 'pyarrow' CSV engine are ignored: {sorted(ignored)}"
+        )
+
+    FH = open(source, "rb") if isinstance(source, str) else source
+    try:
+        # The header is parsed up front such that every column can be
+        # read as str, instead of relying on type inference
+        line = FH.readline()
+        while comment and line.startswith(comment.encode()):
+            line = FH.readline()
+        header = line.decode("utf-8-sig").rstrip("\r\n")
+        if not header:
+            return
+        if quoting == csv.QUOTE_NONE:
+            split = lambda x: x.split(delimiter)  # noqa: E731
+        else:
+            split = lambda x: next(csv.reader([x], delimiter=delimiter))  # noqa: E731
+        names = split(header)
+
+        # Unlike pandas, pyarrow rejects rows with missing trailing fields.
+        # These are set aside and padded with empty values, and then yielded along
+        # with the chunk that is being read when they are encountered.
+        short_rows: List[str] = []
+
+        def handle_invalid_row(row: Any) -> str:
+            if row.actual_columns < row.expected_columns:
+                short_rows.append(row.text)
+                return "skip"
+            return "error"
+
+        def with_short_rows(df: pd.DataFrame) -> pd.DataFrame:
+            if not short_rows:
+                return df
+            rows = [split(x) for x in short_rows]
+            del short_rows[:]
+            padded = pd.DataFrame(
+                [x + [""] * (len(names) - len(x)) for x in rows], columns=names
+            )
+            return pd.concat([df, padded], ignore_index=True)
+
+        reader = pa_csv.open_csv(
+            FH,
+            read_options=pa_csv.ReadOptions(column_names=names, use_threads=True),
+            parse_options=pa_csv.ParseOptions(
+                delimiter=delimiter,
+                quote_char=False if quoting == csv.QUOTE_NONE else '"',
+                invalid_row_handler=handle_invalid_row,
+            ),
+            convert_options=pa_csv.ConvertOptions(
+                column_types={x: pa.string() for x in names},
+                strings_can_be_null=False,
+                quoted_strings_can_be_null=False,
+            ),
+        )
+        batches: List = []
+        size = 0
+        for record_batch in reader:
+            batches.append(record_batch)
+            size += record_batch.num_rows
+            while size >= chunksize:
+                table = pa.Table.from_batches(batches, schema=reader.schema)
+                yield with_short_rows(table.slice(0, chunksize).to_pandas())
+                table = table.slice(chunksize)
+                batches = table.to_batches()
+                size = table.num_rows
+        if size or short_rows:
+            table = pa.Table.from_batches(batches, schema=reader.schema)
+            yield with_short_rows(table.to_pandas())
+    finally:
+        if isinstance(source, str):
+            FH.close()
@@ -0,0 +1,84 @@
+from typing import Any
+from urllib.parse import urlparse
+
+# URI schemes of the Bolt protocol, for which the official Neo4j driver is used
+BOLT_SCHEMES = {"bolt", "bolt+s", "bolt+ssc", "neo4j", "neo4j+s", "neo4j+ssc"}
+
+# Names of the errors of the Neo4j driver that are transient, for versions
+# of the driver where errors cannot be asked whether they are retryable
+TRANSIENT_ERRORS = {"TransientError", "ServiceUnavailable", "SessionExpired"}
+
+
+def is_bolt_uri(uri: str) -> bool:
+    """
+    Check whether a URI is for the Bolt protocol.
+
+    Parameters
+    ----------
+    uri: str
+        The URI for a Neo4j instance
+
+    Returns
+    -------
+    bool
+        Whether the URI is for the Bolt protocol
+
+    """
+    return urlparse(uri).scheme.lower() in BOLT_SCHEMES
+
+
+def get_bolt_driver(uri: str, username: str, password: str, **kwargs: Any) -> Any:
+    """
+    Get a driver for a Neo4j instance over the Bolt protocol,
+    which keeps a pool of connections that are shared by sessions.
+
+    Parameters
+    ----------
+    uri: str
+        The URI for the Neo4j instance.
+        For example, bolt://localhost:7687
+    username: str
+        The username
+    password: str
+        The password
+    kwargs: Any
+        Any additional configuration of the driver, like
+        ``max_connection_pool_size``
+
+    Returns
+    -------
+    neo4j.Driver
+        The driver
+
+    """
+    try:
+        import neo4j
+    except ImportError:
+        raise ImportError(f"Connecting to {uri} requires the neo4j package")
+    return neo4j.GraphDatabase.driver(uri, auth=(username, password), **kwargs)
+
+
+def is_transient_error(error: Exception) -> bool:
+    """
+    Check whether an error of the Neo4j driver is transient, such that
+    the transaction that failed may succeed when it is retried. For
+    example, deadlocks between transactions and lost connections are
+    transient.
+
+    Parameters
+    ----------
+    error: Exception
+        The error
+
+    Returns
+    -------
+    bool
+        Whether the error is transient
+
+    """
+    retryable = getattr(error, "is_retryable", None) or getattr(
+        error, "is_retriable", None
+    )
+    if callable(retryable):
+        return bool(retryable())
+    return any(x.__name__ in TRANSIENT_ERRORS for x in type(error).__mro__)
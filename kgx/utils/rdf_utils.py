@@ -1,12 +1,22 @@
+import hashlib
+import multiprocessing as mp
+import os
+import pickle
+import tempfile
 from collections import OrderedDict
-from typing import List, Optional, Any, Union, Dict, Tuple
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import List, Optional, Any, Union, Dict, Tuple, Generator
+from urllib.parse import urlparse
+from urllib.request import url2pathname
+
 import rdflib
+import requests
 from linkml_runtime.linkml_model.meta import Element, SlotDefinition, ClassDefinition
 from cachetools import cached, LRUCache
 from rdflib import Namespace, URIRef
 from rdflib.namespace import RDF, RDFS, OWL, SKOS
 
-from kgx.config import get_logger
+from kgx.config import get_logger, get_config
 from kgx.prefix_manager import PrefixManager
 from kgx.utils.graph_utils import get_category_via_superclass
 from kgx.utils.kgx_utils import (
@@ -26,6 +36,17 @@ BIOLINK = Namespace("https://w3id.org/biolink/vocab/")
 OIO = Namespace("http://www.geneontology.org/formats/oboInOwl#")
 OBO = Namespace("http://purl.obolibrary.org/obo/")
 
+# Number of triples of a parsed ontology that are pickled together
+ONTOLOGY_BATCH_SIZE = 10000
+
+# Media types that are accepted when downloading an ontology
+ONTOLOGY_ACCEPT = (
+    "application/rdf+xml, text/turtle;q=0.9, application/n-triples;q=0.8, */*;q=0.1"
+)
+
+# Number of seconds to wait for the server of an ontology to respond
+ONTOLOGY_TIMEOUT = 60
+
 property_mapping: Dict = dict()
 reverse_property_mapping: Dict = dict()
 
@@ -239,3 +260,150 @@ def process_predicate(
         # cache[p] = {'element_uri': element_uri, 'canonical_uri': canonical_uri,
         # 'predicate': predicate, 'property_name': property_name}
     return element_uri, canonical_uri, predicate, property_name
+
+
+def get_ontology_cache_dir() -> Optional[str]:
+    """
+    Get the directory where parsed ontologies are cached,
+    from the ``ontology-cache`` entry of the config.
+
+    Returns
+    -------
+    Optional[str]
+        The directory, or ``None`` if parsed ontologies are not cached
+
+    """
+    directory = get_config().get("ontology-cache")
+    return os.path.expanduser(directory) if directory else None
+
+
+def parse_ontology(iri: str, cache_dir: str) -> str:
+    """
+    Parse an ontology into a file of pickled batches of triples, in
+    ``cache_dir``, unless the ontology was parsed before.
+
+    The file is keyed by the IRI and the modification time and size
+    of a local file, or the hash of the content of a downloaded one,
+    such that an ontology is parsed again when it changes.
+
+    Parameters
+    ----------
+    iri: str
+        The IRI of the ontology, or a filename
+    cache_dir: str
+        The directory for parsed ontologies
+
+    Returns
+    -------
+    str
+        The filename of the parsed ontology
+
+    """
+    if iri.startswith("file:"):
+        path: Optional[str] = url2pathname(urlparse(iri).path)
+    elif "://" not in iri:
+        path = iri
+    else:
+        path = None
+    data = None
+    if path is not None:
+        stat = os.stat(path)
+        stamp = f"{stat.st_mtime_ns}:{stat.st_size}"
+    else:
+        response = requests.get(
+            iri, headers={"Accept": ONTOLOGY_ACCEPT}, timeout=ONTOLOGY_TIMEOUT
+        )
+        response.raise_for_status()
+        data = response.content
+        stamp = hashlib.sha256(data).hexdigest()
+    key = hashlib.sha256(f"{rdflib.__version__}\0{iri}\0{stamp}".encode("utf-8"))
+    filename = os.path.join(cache_dir, f"{key.hexdigest()}.pickle")
+    if os.path.exists(filename):
+        log.info(f"Using parsed ontology {iri} from {filename}")
+        return filename
+
+    log.info(f"Parsing ontology: {iri}")
+    rdfgraph = rdflib.Graph()
+    input_format = rdflib.util.guess_format(iri)
+    if data is None:
+        rdfgraph.parse(path, format=input_format)
+    else:
+        rdfgraph.parse(data=data, format=input_format, publicID=iri)
+    # written to a temporary file first, such that a partial file is never read
+    with tempfile.NamedTemporaryFile(dir=cache_dir, suffix=".tmp", delete=False) as FH:
+        batch = []
+        for triple in rdfgraph:
+            batch.append(triple)
+            if len(batch) >= ONTOLOGY_BATCH_SIZE:
+                pickle.dump(batch, FH, pickle.HIGHEST_PROTOCOL)
+                batch = []
+        if batch:
+            pickle.dump(batch, FH, pickle.HIGHEST_PROTOCOL)
+    os.replace(FH.name, filename)
+    log.info(f"Parsed ontology {iri} with {len(rdfgraph)} triples")
+    return filename
+
+
+def load_ontologies(
+    iris: List[str], workers: int = 1, cache_dir: Optional[str] = None
+) -> Generator:
+    """
+    Load ontologies, which are parsed concurrently by a pool of
+    workers, and yield batches of their triples, in order of the IRIs.
+
+    Parsed ontologies are cached in ``cache_dir`` by ``parse_ontology``,
+    such that an ontology that has not changed is not parsed again.
+
+    Parameters
+    ----------
+    iris: List[str]
+        The IRIs of the ontologies, or filenames
+    workers: int
+        Number of workers that parse ontologies
+    cache_dir: Optional[str]
+        The directory for parsed ontologies, which are
+        not kept after loading them, if not defined
+
+    Returns
+    -------
+    Generator
+        A generator for the IRI of an ontology and a batch of its triples
+
+    """
+    if not iris:
+        return
+    tmpdir = None
+    if cache_dir:
+        os.makedirs(cache_dir, exist_ok=True)
+    else:
+        tmpdir = tempfile.TemporaryDirectory(prefix="kgx-ontologies-")
+        cache_dir = tmpdir.name
+    executor: Optional[Executor] = None
+    if workers > 1 and len(iris) > 1:
+        if mp.current_process().daemon:
+            # daemonic processes, such as parse workers, cannot have children
+            executor = ThreadPoolExecutor(min(workers, len(iris)))
+        else:
+            executor = ProcessPoolExecutor(min(workers, len(iris)))
+    futures = []
+    try:
+        if executor is not None:
+            futures = [executor.submit(parse_ontology, x, cache_dir) for x in iris]
+            filenames = (f.result() for f in futures)
+        else:
+            filenames = (parse_ontology(x, cache_dir) for x in iris)
+        for iri, filename in zip(iris, filenames):
+            with open(filename, "rb") as FH:
+                while True:
+                    try:
+                        batch = pickle.load(FH)
+                    except EOFError:
+                        break
+                    yield iri, batch
+    finally:
+        if executor is not None:
+            for future in futures:
+                future.cancel()
+            executor.shutdown()
+        if tmpdir is not None:
+            tmpdir.cleanup()
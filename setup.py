@@ -12,7 +12,12 @@ LICENSE = 'BSD'
 with open("requirements.txt", "r") as FH:
     REQUIREMENTS = FH.readlines()
 
-EXTRAS = {}
+EXTRAS = {
+    "pyarrow": ["pyarrow>=7.0.0"],
+    "zstd": ["zstandard"],
+    "orjson": ["orjson>=3.6"],
+    "neo4j": ["neo4j>=4.0"],
+}
 
 setup(
     name=NAME,
@@ -0,0 +1,238 @@
+"""
+A benchmark of uploading a graph to Neo4j with NeoSink, and downloading it
+with NeoSource, against an in-process stand-in for Neo4j, which reports
+the number of records per second for each ``cache_size`` of the upload,
+and each ``page_size`` of the download.
+
+For example, for a server that takes 5 ms for each query, and 10 µs for
+each record of a query:
+
+    python -m tests.benchmark_neo4j --nodes 100000 --latency 0.005 \\
+        --record-latency 0.00001 --cache-size 1000 10000 100000 \\
+        --page-size 1000 10000 50000 --workers 1 4
+"""
+import argparse
+import itertools
+import time
+from typing import Dict, List, Optional, Tuple
+
+from kgx.sink import NeoSink
+from kgx.source import NeoSource
+from tests.neo4j_stand_in import Neo4jStandIn
+
+CATEGORIES = [
+    ["biolink:Gene", "biolink:NamedThing"],
+    ["biolink:Disease", "biolink:NamedThing"],
+    ["biolink:ChemicalEntity", "biolink:NamedThing"],
+]
+PREDICATES = ["biolink:related_to", "biolink:interacts_with", "biolink:treats"]
+
+
+def generate_graph(nodes: int, degree: int) -> Tuple[List[Dict], List[Dict]]:
+    """
+    Generate node and edge records, with ``degree`` edges from each node.
+
+    Parameters
+    ----------
+    nodes: int
+        The number of nodes
+    degree: int
+        The number of edges from each node
+
+    Returns
+    -------
+    Tuple[List[Dict], List[Dict]]
+        The node records and the edge records
+
+    """
+    node_records = [
+        {
+            "id": f"KGX:{i}",
+            "name": f"node {i}",
+            "category": CATEGORIES[i % len(CATEGORIES)],
+            "provided_by": ["benchmark"],
+        }
+        for i in range(nodes)
+    ]
+    edge_records = [
+        {
+            "id": f"KGX:{i}-{j}",
+            "subject": f"KGX:{i}",
+            "predicate": PREDICATES[j % len(PREDICATES)],
+            "object": f"KGX:{(i * 7919 + j + 1) % nodes}",
+            "knowledge_source": ["benchmark"],
+        }
+        for i in range(nodes)
+        for j in range(degree)
+    ]
+    return node_records, edge_records
+
+
+def upload(
+    stand_in: Neo4jStandIn,
+    nodes: List[Dict],
+    edges: List[Dict],
+    uri: str,
+    **kwargs,
+) -> float:
+    """
+    Upload node and edge records with NeoSink.
+
+    Parameters
+    ----------
+    stand_in: Neo4jStandIn
+        The stand-in for Neo4j
+    nodes: List[Dict]
+        The node records
+    edges: List[Dict]
+        The edge records
+    uri: str
+        The URI, which is for Bolt or HTTP
+    kwargs: Dict
+        The arguments of NeoSink, like ``cache_size``
+
+    Returns
+    -------
+    float
+        The number of seconds
+
+    """
+    begin = time.perf_counter()
+    with stand_in.patch():
+        sink = NeoSink(uri=uri, username="neo4j", password="neo4j", **kwargs)
+        for record in nodes:
+            sink.write_node(record)
+        for record in edges:
+            sink.write_edge(record)
+        sink.finalize()
+    return time.perf_counter() - begin
+
+
+def download(stand_in: Neo4jStandIn, **kwargs) -> Tuple[int, int, float]:
+    """
+    Download node and edge records with NeoSource.
+
+    Parameters
+    ----------
+    stand_in: Neo4jStandIn
+        The stand-in for Neo4j
+    kwargs: Dict
+        The arguments of ``NeoSource.parse``, like ``page_size``
+
+    Returns
+    -------
+    Tuple[int, int, float]
+        The number of node records, and edge records, that were read,
+        other than the subject and object nodes of edges, and the number
+        of seconds
+
+    """
+    begin = time.perf_counter()
+    nodes = 0
+    edges = 0
+    with stand_in.patch():
+        source = NeoSource()
+        for record in source.parse(
+            uri="http://localhost:7474", username="neo4j", password="neo4j", **kwargs
+        ):
+            if len(record) == 4:
+                edges += 1
+            else:
+                nodes += 1
+    # the subject and object nodes of each edge are read along with the edge
+    return nodes - 2 * edges, edges, time.perf_counter() - begin
+
+
+def report(operation: str, settings: str, records: int, seconds: float) -> None:
+    """
+    Print the number of records per second of an operation.
+    """
+    print(
+        f"{operation:<8} {settings:<36} {records:>10} "
+        f"{seconds:>9.2f}s {records / seconds:>12.0f} records/s"
+    )
+
+
+def main(args: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(
+        description="Benchmark NeoSink and NeoSource against a stand-in for Neo4j"
+    )
+    parser.add_argument("--nodes", type=int, default=20000, help="Number of nodes")
+    parser.add_argument(
+        "--degree", type=int, default=2, help="Number of edges from each node"
+    )
+    parser.add_argument(
+        "--cache-size", type=int, nargs="+", default=[1000, 10000, 100000]
+    )
+    parser.add_argument("--batch-size", type=int, default=10000)
+    parser.add_argument("--page-size", type=int, nargs="+", default=[1000, 10000])
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 4])
+    parser.add_argument(
+        "--http", action="store_true", help="Upload over HTTP, rather than Bolt"
+    )
+    parser.add_argument(
+        "--latency", type=float, default=0.0, help="Seconds for each query"
+    )
+    parser.add_argument(
+        "--record-latency",
+        type=float,
+        default=0.0,
+        help="Seconds for each record of a query",
+    )
+    parser.add_argument(
+        "--failure-rate",
+        type=float,
+        default=0.0,
+        help="Probability of a transient error for each query",
+    )
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(args)
+
+    nodes, edges = generate_graph(args.nodes, args.degree)
+    uri = "http://localhost:7474" if args.http else "bolt://localhost:7687"
+    records = len(nodes) + len(edges)
+
+    def stand_in() -> Neo4jStandIn:
+        return Neo4jStandIn(
+            latency=args.latency,
+            record_latency=args.record_latency,
+            failure_rate=args.failure_rate,
+            seed=args.seed,
+        )
+
+    graph = None
+    for cache_size, workers in itertools.product(args.cache_size, args.workers):
+        graph = stand_in()
+        seconds = upload(
+            graph,
+            nodes,
+            edges,
+            uri,
+            cache_size=cache_size,
+            batch_size=args.batch_size,
+            workers=workers,
+            max_retries=100,
+        )
+        settings = f"cache_size={cache_size} workers={workers}"
+        report("upload", settings, records, seconds)
+        if len(graph.nodes) != len(nodes) or len(graph.edges) != len(edges):
+            print(
+                f"upload lost records: {len(graph.nodes)} nodes "
+                f"and {len(graph.edges)} edges were written"
+            )
+
+    for page_size, workers in itertools.product(args.page_size, args.workers):
+        read_nodes, read_edges, seconds = download(
+            graph, page_size=page_size, workers=workers
+        )
+        settings = f"page_size={page_size} workers={workers}"
+        report("download", settings, read_nodes + read_edges, seconds)
+        if read_nodes != len(graph.nodes) or read_edges != len(graph.edges):
+            print(
+                f"download lost records: {read_nodes} nodes "
+                f"and {read_edges} edges were read"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,16 @@
+from typing import Iterator
+
+import pytest
+
+from tests.neo4j_stand_in import Neo4jStandIn
+
+
+@pytest.fixture
+def neo4j_stand_in() -> Iterator[Neo4jStandIn]:
+    """
+    Use an in-process stand-in for Neo4j, for every URI of NeoSource
+    and NeoSink.
+    """
+    stand_in = Neo4jStandIn()
+    with stand_in.patch():
+        yield stand_in
@@ -3,6 +3,8 @@ import pytest
 
 from kgx.transformer import Transformer
 from tests import RESOURCE_DIR, TARGET_DIR
+from tests.benchmark_neo4j import main as benchmark_neo4j
+from tests.neo4j_stand_in import Neo4jStandIn
 from tests.integration import (
     check_container,
     CONTAINER_NAME,
@@ -59,3 +61,71 @@ def test_neo_to_graph_transform():
     assert t.store.graph.number_of_edges() == 11
     assert os.path.exists(f"{output_filename}_nodes.csv")
     assert os.path.exists(f"{output_filename}_edges.csv")
+
+
+@pytest.mark.parametrize(
+    "uri,failure_rate",
+    [("http://localhost:7474", 0.0), ("bolt://localhost:7687", 0.2)],
+)
+def test_csv_neo_round_trip_stand_in(uri, failure_rate):
+    """
+    Test to load a CSV to a stand-in for Neo4j, where transactions over
+    Bolt fail and are retried, and to read it back.
+    """
+    stand_in = Neo4jStandIn(failure_rate=failure_rate, seed=1)
+    with stand_in.patch():
+        input_args1 = {
+            "filename": [
+                os.path.join(RESOURCE_DIR, "cm_nodes.csv"),
+                os.path.join(RESOURCE_DIR, "cm_edges.csv"),
+            ],
+            "format": "csv",
+        }
+        t1 = Transformer()
+        t1.transform(input_args1)
+        output_args = {
+            "uri": uri,
+            "username": DEFAULT_NEO4J_USERNAME,
+            "password": DEFAULT_NEO4J_PASSWORD,
+            "format": "neo4j",
+            "workers": 2,
+            "max_retries": 20,
+        }
+        t1.save(output_args)
+        assert len(stand_in.nodes) == 10
+        assert len(stand_in.edges) == 11
+        assert (stand_in.failures > 0) == (failure_rate > 0)
+
+        stand_in.failure_rate = 0
+        input_args2 = {
+            "uri": "http://localhost:7474",
+            "username": DEFAULT_NEO4J_USERNAME,
+            "password": DEFAULT_NEO4J_PASSWORD,
+            "format": "neo4j",
+            "page_size": 3,
+            "workers": 2,
+        }
+        t2 = Transformer()
+        t2.transform(input_args2)
+    assert t2.store.graph.number_of_nodes() == 10
+    assert t2.store.graph.number_of_edges() == 11
+    n = t2.store.graph.get_node("HGNC:7670")
+    assert "biolink:Gene" in n["category"]
+    assert stand_in.constraints >= {"biolink:NamedThing", "biolink:Gene"}
+
+
+def test_benchmark_neo4j_stand_in(capsys):
+    """
+    Test the benchmark of NeoSink and NeoSource against a stand-in
+    for Neo4j.
+    """
+    args = ["--nodes", "30", "--cache-size", "10", "--page-size", "7"]
+    benchmark_neo4j(args + ["--workers", "1", "3"])
+    lines = capsys.readouterr().out.splitlines()
+    assert [x.split()[:3] for x in lines] == [
+        ["upload", "cache_size=10", "workers=1"],
+        ["upload", "cache_size=10", "workers=3"],
+        ["download", "page_size=7", "workers=1"],
+        ["download", "page_size=7", "workers=3"],
+    ]
+    assert all(x.split()[3] == "90" for x in lines)
@@ -1,4 +1,5 @@
 import os
+import tempfile
 from typing import List
 
 import pytest
@@ -150,6 +151,101 @@ def test_transform_filters2(query):
     assert t.store.graph.number_of_edges() == query[3]
 
 
+@pytest.mark.parametrize(
+    "query",
+    [
+        ({}, {}, 512, 531),
+        ({"category": {"biolink:Gene"}}, {}, 178, 177),
+        ({}, {"subject_category": {"biolink:Disease"}}, 56, 35),
+    ],
+)
+def test_transform_parallel(query):
+    """
+    Test transform where input files are parsed by parallel worker processes.
+    The edges file is listed first to ensure that nodes are still processed
+    before edges.
+    """
+    input_args = {
+        "filename": [
+            os.path.join(RESOURCE_DIR, "graph_edges.tsv"),
+            os.path.join(RESOURCE_DIR, "graph_nodes.tsv"),
+        ],
+        "format": "tsv",
+        "node_filters": query[0],
+        "edge_filters": query[1],
+        "lineterminator": None,
+    }
+    t = Transformer(processes=2)
+    t.transform(input_args)
+
+    assert t.store.graph.number_of_nodes() == query[2]
+    assert t.store.graph.number_of_edges() == query[3]
+    assert "category" in t.store.node_properties
+    assert "predicate" in t.store.edge_properties
+
+
+def test_transform_parallel_error(tmp_path, monkeypatch):
+    """
+    Test that the edges that parallel workers spilled to temporary files
+    are removed when a file cannot be parsed.
+    """
+    spill_dir = tmp_path / "spill"
+    spill_dir.mkdir()
+    monkeypatch.setattr(tempfile, "tempdir", str(spill_dir))
+    invalid = tmp_path / "invalid.json"
+    invalid.write_text('{"nodes": [{"id": "A"}], "edges": [')
+    input_args = {
+        "filename": [os.path.join(RESOURCE_DIR, "graph.json"), str(invalid)],
+        "format": "json",
+    }
+    t = Transformer(processes=2)
+    with pytest.raises(RuntimeError):
+        t.transform(input_args)
+    assert not os.listdir(spill_dir)
+
+
+@pytest.mark.parametrize(
+    "query",
+    [
+        ({}, {}, 512, 531),
+        ({"category": {"biolink:Gene"}}, {}, 178, 177),
+    ],
+)
+def test_transform_batch(query):
+    """
+    Test streaming transform where the source yields batches of records.
+    """
+    input_args = {
+        "filename": [
+            os.path.join(RESOURCE_DIR, "graph_nodes.tsv"),
+            os.path.join(RESOURCE_DIR, "graph_edges.tsv"),
+        ],
+        "format": "tsv",
+        "node_filters": query[0],
+        "lineterminator": None,
+        "batch": True,
+    }
+    output_args = {
+        "filename": os.path.join(TARGET_DIR, "graph_batch"),
+        "format": "jsonl",
+    }
+    t = Transformer(stream=True)
+    t.transform(input_args, output_args)
+
+    t2 = Transformer()
+    t2.transform(
+        {
+            "filename": [
+                f"{output_args['filename']}_nodes.jsonl",
+                f"{output_args['filename']}_edges.jsonl",
+            ],
+            "format": "jsonl",
+        }
+    )
+    assert t2.store.graph.number_of_nodes() == query[2]
+    assert t2.store.graph.number_of_edges() == query[3]
+
+
 @pytest.mark.parametrize(
     "query",
     [
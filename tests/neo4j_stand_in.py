@@ -0,0 +1,546 @@
+"""
+An in-process stand-in for a Neo4j instance, for testing and benchmarking
+NeoSource and NeoSink without a server.
+
+The stand-in keeps a graph in memory and answers the Cypher queries that
+NeoSource and NeoSink generate, through the subset of the neo4jrestclient
+API (``GraphDatabase.query``) and of the neo4j driver API (sessions and
+explicit transactions) that they use. Any other query raises an error.
+
+Queries can be slowed down by a fixed latency, and by a latency for each
+record that is sent or returned, and can fail with a transient error at
+a given rate, to see how the Neo4j paths behave against a remote server.
+"""
+import random
+import re
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from neo4jrestclient.query import CypherException
+
+from kgx.sink import neo_sink
+from kgx.source import neo_source
+
+NODE_QUERY = re.compile(
+    r"UNWIND \$nodes AS node\s+"
+    r"MERGE \(n:`([^`]+)` \{id: node\.id\}\)\s+"
+    r"ON CREATE SET n \+= node, n:(\S+)\s+"
+    r"ON MATCH SET n \+= node, n:\S+$"
+)
+EDGE_QUERY = re.compile(
+    r"UNWIND \$edges AS edge\s+"
+    r"MATCH \(s:`([^`]+)` \{id: edge\.subject\}\), \(o:`[^`]+` \{id: edge\.object\}\)\s+"
+    r"MERGE \(s\)-\[r:`([^`]+)`\]->\(o\)\s+"
+    r"SET r \+= edge$"
+)
+CONSTRAINT_QUERY = re.compile(
+    r"CREATE CONSTRAINT ON \(n:`([^`]+)`\) ASSERT n\.id IS UNIQUE$"
+)
+MATCH_NODES_QUERY = re.compile(r"MATCH \(n\)(?: WHERE (.+))? RETURN n$")
+MATCH_EDGES_QUERY = re.compile(
+    r"MATCH \(s\)-\[p\](->|-)\(o\)(?: WHERE (.+))? RETURN (s, p, o|COUNT\(\*\) AS count)$"
+)
+MAX_NODE_ID_QUERY = re.compile(r"MATCH \(n\) RETURN max\(id\(n\)\)$")
+MAX_EDGE_ID_QUERY = re.compile(r"MATCH \(\)-\[p\]->\(\) RETURN max\(id\(p\)\)$")
+DELETE_QUERY = re.compile(r"MATCH \(n\) DETACH DELETE \(?n\)?$")
+
+ID_RANGE = re.compile(r"id\((\w+)\) IN range\(\$lower, \$upper - 1\)$")
+ID_FROM = re.compile(r"id\((\w+)\) >= \$lower$")
+HAS_LABEL = re.compile(r"(\w+):`([^`]+)`$")
+IN_PROPERTY = re.compile(r"'([^']*)' IN (\w+)\.(\w+)$")
+TYPE_IN = re.compile(r"type\((\w+)\) IN \[(.*)\]$")
+EQUALS = re.compile(r"(\w+)\.(\w+) = '([^']*)'$")
+
+
+class StandInError(Exception):
+    """
+    An error of a query, like a syntax error or a constraint that
+    already exists, which fails again if it is retried.
+    """
+
+    def is_retryable(self) -> bool:
+        return False
+
+
+class TransientError(StandInError):
+    """
+    A transient error of a query, like a deadlock, which may succeed
+    if it is retried.
+    """
+
+    def is_retryable(self) -> bool:
+        return True
+
+
+class Element:
+    """
+    A node or relationship, with its internal ID.
+    """
+
+    __slots__ = ("id", "labels", "type", "start", "end", "properties")
+
+    def __init__(
+        self,
+        id: int,
+        labels: Optional[set] = None,
+        type: Optional[str] = None,
+        start: Optional["Element"] = None,
+        end: Optional["Element"] = None,
+    ):
+        self.id = id
+        self.labels = labels or set()
+        self.type = type
+        self.start = start
+        self.end = end
+        self.properties: Dict = {}
+
+    def update(self, properties: Dict) -> None:
+        """
+        Set properties, as with ``+=``, where properties that are
+        ``None`` are removed.
+        """
+        for key, value in properties.items():
+            if value is None:
+                self.properties.pop(key, None)
+                continue
+            values = value if isinstance(value, (list, tuple)) else [value]
+            if not all(isinstance(x, (str, int, float, bool)) for x in values):
+                raise StandInError(
+                    f"Property values can only be of primitive types or arrays "
+                    f"thereof, not {key}: {value!r}"
+                )
+            self.properties[key] = list(values) if values is value else value
+
+
+class Neo4jStandIn:
+    """
+    An in-process stand-in for a Neo4j instance.
+
+    Parameters
+    ----------
+    latency: float
+        The number of seconds that each query takes
+    record_latency: float
+        The number of seconds that each record that is sent or returned
+        adds to a query
+    failure_rate: float
+        The probability that a query fails with a transient error,
+        before it changes the graph
+    seed: int
+        The seed for the failures
+
+    """
+
+    def __init__(
+        self,
+        latency: float = 0.0,
+        record_latency: float = 0.0,
+        failure_rate: float = 0.0,
+        seed: int = 0,
+    ):
+        self.latency = latency
+        self.record_latency = record_latency
+        self.failure_rate = failure_rate
+        self.random = random.Random(seed)
+        self.lock = threading.Lock()
+        self.queries = 0
+        self.failures = 0
+        # the queries that succeeded, with their parameters, in the order
+        # that they were run
+        self.history: List[Tuple[str, Dict]] = []
+        self.constraints: set = set()
+        self.nodes: Dict[int, Element] = {}
+        self.edges: Dict[int, Element] = {}
+        # nodes by label and id, for the label of ``MERGE``
+        self.node_index: Dict[Tuple[str, str], Element] = {}
+        self.edge_index: Dict[Tuple[int, str, int], Element] = {}
+        self.next_node_id = 0
+        self.next_edge_id = 0
+
+    def http_driver(self, *args: Any, **kwargs: Any) -> "StandInGraphDatabase":
+        """
+        Get a driver like ``neo4jrestclient.client.GraphDatabase``.
+        """
+        return StandInGraphDatabase(self)
+
+    def bolt_driver(self, *args: Any, **kwargs: Any) -> "StandInBoltDriver":
+        """
+        Get a driver like ``neo4j.Driver``.
+        """
+        return StandInBoltDriver(self)
+
+    @contextmanager
+    def patch(self) -> Iterator["Neo4jStandIn"]:
+        """
+        Use the stand-in for every URI of NeoSource and NeoSink,
+        over HTTP and Bolt.
+        """
+        targets = [
+            (neo_sink, "GraphDatabase", self.http_driver),
+            (neo_sink, "get_bolt_driver", self.bolt_driver),
+            (neo_source, "GraphDatabase", self.http_driver),
+        ]
+        originals = [(m, name, getattr(m, name)) for m, name, _ in targets]
+        try:
+            for module, name, value in targets:
+                setattr(module, name, value)
+            yield self
+        finally:
+            for module, name, value in originals:
+                setattr(module, name, value)
+
+    def run(self, query: str, params: Optional[Dict] = None) -> List[List]:
+        """
+        Run a query, after the latency, which fails at the failure rate.
+
+        Parameters
+        ----------
+        query: str
+            The query
+        params: Optional[Dict]
+            The parameters of the query
+
+        Returns
+        -------
+        List[List]
+            The rows of the results
+
+        """
+        params = params or {}
+        with self.lock:
+            self.queries += 1
+            failed = self.random.random() < self.failure_rate
+            if failed:
+                self.failures += 1
+        if failed:
+            time.sleep(self.latency)
+            raise TransientError("Deadlock detected while trying to acquire locks")
+        with self.lock:
+            rows = self.execute(query.strip(), params)
+            self.history.append((query, params))
+        records = len(rows) + sum(
+            len(x) for x in params.values() if isinstance(x, list)
+        )
+        time.sleep(self.latency + self.record_latency * records)
+        return rows
+
+    def execute(self, query: str, params: Dict) -> List[List]:
+        """
+        Execute a query on the graph.
+
+        Parameters
+        ----------
+        query: str
+            The query
+        params: Dict
+            The parameters of the query
+
+        Returns
+        -------
+        List[List]
+            The rows of the results
+
+        """
+        match = NODE_QUERY.match(query)
+        if match:
+            labels = set(re.findall(r"`([^`]+)`", match.group(2)))
+            for record in params["nodes"]:
+                self.merge_node(match.group(1), labels, record)
+            return []
+        match = EDGE_QUERY.match(query)
+        if match:
+            for record in params["edges"]:
+                self.merge_edge(match.group(1), match.group(2), record)
+            return []
+        match = CONSTRAINT_QUERY.match(query)
+        if match:
+            if match.group(1) in self.constraints:
+                raise StandInError(
+                    f"An equivalent constraint already exists for {match.group(1)}"
+                )
+            self.constraints.add(match.group(1))
+            return []
+        if MAX_NODE_ID_QUERY.match(query):
+            return [[max(self.nodes, default=None)]]
+        if MAX_EDGE_ID_QUERY.match(query):
+            return [[max(self.edges, default=None)]]
+        match = MATCH_NODES_QUERY.match(query)
+        if match:
+            return [
+                [dict(n.properties)]
+                for n in self.seek(self.nodes, "n", match.group(1), params)
+                if self.matches(match.group(1), {"n": n}, params)
+            ]
+        match = MATCH_EDGES_QUERY.match(query)
+        if match:
+            direction, condition, returns = match.groups()
+            rows = []
+            for e in self.seek(self.edges, "p", condition, params):
+                bindings = [(e.start, e.end)]
+                if direction == "-":
+                    bindings.append((e.end, e.start))
+                for s, o in bindings:
+                    if self.matches(condition, {"s": s, "p": e, "o": o}, params):
+                        rows.append([s, e, o])
+            if returns.startswith("COUNT"):
+                return [[len(rows)]]
+            return [[dict(x.properties) for x in row] for row in rows]
+        if DELETE_QUERY.match(query):
+            self.clear()
+            return []
+        raise StandInError(f"Unsupported query: {query}")
+
+    def merge_node(self, label: str, labels: set, record: Dict) -> None:
+        """
+        Merge a node on its ``label`` and ``id``, and set its
+        properties and labels.
+        """
+        node = self.node_index.get((label, record["id"]))
+        if node is None:
+            node = Element(self.next_node_id, {label})
+            self.next_node_id += 1
+        node.update(record)
+        if node.id not in self.nodes:
+            self.nodes[node.id] = node
+            self.node_index[(label, record["id"])] = node
+        node.labels.update(labels)
+
+    def merge_edge(self, label: str, type: str, record: Dict) -> None:
+        """
+        Merge a relationship of ``type`` between the nodes of ``label``
+        with the ``subject`` and ``object`` of the record, if both exist,
+        and set its properties.
+        """
+        s = self.node_index.get((label, record.get("subject")))
+        o = self.node_index.get((label, record.get("object")))
+        if s is None or o is None:
+            return
+        edge = self.edge_index.get((s.id, type, o.id))
+        if edge is None:
+            edge = Element(self.next_edge_id, type=type, start=s, end=o)
+            self.next_edge_id += 1
+        edge.update(record)
+        if edge.id not in self.edges:
+            self.edges[edge.id] = edge
+            self.edge_index[(s.id, type, o.id)] = edge
+
+    def clear(self) -> None:
+        """
+        Delete all nodes, relationships and constraints.
+        """
+        self.constraints.clear()
+        self.nodes.clear()
+        self.edges.clear()
+        self.node_index.clear()
+        self.edge_index.clear()
+
+    def seek(
+        self,
+        elements: Dict[int, Element],
+        variable: str,
+        condition: Optional[str],
+        params: Dict,
+    ) -> Iterator[Element]:
+        """
+        Get the nodes or relationships that may match a condition, which
+        are looked up by ID if the condition is on a range of IDs, as
+        Neo4j does, rather than scanned.
+        """
+        if condition:
+            for atom in self.split(condition, " AND "):
+                match = ID_RANGE.match(atom)
+                if match and match.group(1) == variable:
+                    ids = range(params["lower"], params["upper"])
+                    return (elements[i] for i in ids if i in elements)
+        return iter(list(elements.values()))
+
+    @staticmethod
+    def split(condition: str, operator: str) -> List[str]:
+        """
+        Split a condition on an operator, outside parentheses, brackets
+        and quotes, and strip the parentheses around each part.
+        """
+        parts = []
+        depth = 0
+        quoted = False
+        begin = 0
+        i = 0
+        while i < len(condition):
+            c = condition[i]
+            if c == "'":
+                quoted = not quoted
+            elif not quoted and c in "([":
+                depth += 1
+            elif not quoted and c in ")]":
+                depth -= 1
+            elif not quoted and depth == 0 and condition.startswith(operator, i):
+                parts.append(condition[begin:i])
+                i += len(operator)
+                begin = i
+                continue
+            i += 1
+        parts.append(condition[begin:])
+        return [Neo4jStandIn.unwrap(x.strip()) for x in parts]
+
+    @staticmethod
+    def unwrap(condition: str) -> str:
+        """
+        Strip the parentheses around a condition.
+        """
+        while condition.startswith("(") and condition.endswith(")"):
+            depth = 0
+            for i, c in enumerate(condition):
+                depth += {"(": 1, ")": -1}.get(c, 0)
+                if depth == 0 and i < len(condition) - 1:
+                    return condition
+            condition = condition[1:-1].strip()
+        return condition
+
+    def matches(self, condition: Optional[str], bindings: Dict, params: Dict) -> bool:
+        """
+        Check whether nodes and relationships match a condition of
+        a ``WHERE`` clause, of the forms that NeoSource generates.
+        """
+        if not condition:
+            return True
+        conjunction = self.split(condition, " AND ")
+        if len(conjunction) > 1:
+            return all(self.matches(x, bindings, params) for x in conjunction)
+        disjunction = self.split(conjunction[0], " OR ")
+        if len(disjunction) > 1:
+            return any(self.matches(x, bindings, params) for x in disjunction)
+        atom = disjunction[0]
+        match = ID_RANGE.match(atom)
+        if match:
+            element = bindings[match.group(1)]
+            return params["lower"] <= element.id < params["upper"]
+        match = ID_FROM.match(atom)
+        if match:
+            return bindings[match.group(1)].id >= params["lower"]
+        match = HAS_LABEL.match(atom)
+        if match:
+            return match.group(2) in bindings[match.group(1)].labels
+        match = IN_PROPERTY.match(atom)
+        if match:
+            value, variable, key = match.groups()
+            return value in (bindings[variable].properties.get(key) or [])
+        match = TYPE_IN.match(atom)
+        if match:
+            types = re.findall(r"'([^']*)'", match.group(2))
+            return bindings[match.group(1)].type in types
+        match = EQUALS.match(atom)
+        if match:
+            variable, key, value = match.groups()
+            return bindings[variable].properties.get(key) == value
+        raise StandInError(f"Unsupported condition: {atom}")
+
+
+class StandInResults:
+    """
+    The results of a query, like those of neo4jrestclient.
+    """
+
+    def __init__(self, rows: List[List]):
+        self.rows = rows
+
+    def __iter__(self) -> Iterator[List]:
+        return iter(self.rows)
+
+    def __len__(self) -> int:
+        return len(self.rows)
+
+    def __getitem__(self, index: int) -> List:
+        return self.rows[index]
+
+
+class StandInGraphDatabase:
+    """
+    A stand-in for ``neo4jrestclient.client.GraphDatabase``, where
+    each query is run in its own transaction.
+    """
+
+    def __init__(self, stand_in: Neo4jStandIn):
+        self.stand_in = stand_in
+
+    def query(
+        self,
+        q: str,
+        params: Optional[Dict] = None,
+        returns: Any = None,
+        data_contents: Any = None,
+        tx: Any = None,
+    ) -> StandInResults:
+        try:
+            return StandInResults(self.stand_in.run(q, params))
+        except StandInError as e:
+            raise CypherException(str(e))
+
+
+class StandInBoltDriver:
+    """
+    A stand-in for ``neo4j.Driver``.
+    """
+
+    def __init__(self, stand_in: Neo4jStandIn):
+        self.stand_in = stand_in
+        self.closed = False
+
+    def session(self, **kwargs: Any) -> "StandInSession":
+        return StandInSession(self.stand_in)
+
+    def close(self) -> None:
+        self.closed = True
+
+
+class StandInSession:
+    """
+    A stand-in for ``neo4j.Session``.
+    """
+
+    def __init__(self, stand_in: Neo4jStandIn):
+        self.stand_in = stand_in
+
+    def __enter__(self) -> "StandInSession":
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        pass
+
+    def begin_transaction(self) -> "StandInTransaction":
+        return StandInTransaction(self.stand_in)
+
+    def run(self, query: str, params: Optional[Dict] = None) -> StandInResults:
+        return StandInResults(self.stand_in.run(query, params))
+
+
+class StandInTransaction:
+    """
+    A stand-in for ``neo4j.Transaction``, where a query changes the graph
+    when it is run, since queries fail before they change the graph.
+    """
+
+    def __init__(self, stand_in: Neo4jStandIn):
+        self.stand_in = stand_in
+
+    def __enter__(self) -> "StandInTransaction":
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        pass
+
+    def run(self, query: str, params: Optional[Dict] = None) -> "StandInResult":
+        return StandInResult(self.stand_in.run(query, params))
+
+    def commit(self) -> None:
+        pass
+
+
+class StandInResult(StandInResults):
+    """
+    A stand-in for ``neo4j.Result``.
+    """
+
+    def consume(self) -> None:
+        pass
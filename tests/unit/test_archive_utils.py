@@ -0,0 +1,95 @@
+import bz2
+import gzip
+import lzma
+import os
+import tarfile
+
+import pytest
+
+from kgx.utils.archive_utils import (
+    TarStreamWriter,
+    detect_compression,
+    open_input,
+)
+from tests import RESOURCE_DIR, TARGET_DIR
+
+
+def compress(filename: str, compression: str) -> str:
+    """
+    Write a compressed copy of a file to the target directory.
+    """
+    data = open(filename, "rb").read()
+    target = os.path.join(TARGET_DIR, f"{os.path.basename(filename)}.{compression}")
+    if compression == "gz":
+        data = gzip.compress(data)
+    elif compression == "bz2":
+        data = bz2.compress(data)
+    elif compression == "xz":
+        data = lzma.compress(data)
+    elif compression == "zst":
+        zstandard = pytest.importorskip("zstandard")
+        data = zstandard.ZstdCompressor().compress(data)
+    with open(target, "wb") as FH:
+        FH.write(data)
+    return target
+
+
+@pytest.mark.parametrize("compression", ["gz", "bz2", "xz", "zst"])
+@pytest.mark.parametrize("threaded", [True, False])
+def test_open_input(compression, threaded):
+    """
+    Test reading a compressed file, where the compression
+    is detected from the magic bytes.
+    """
+    filename = os.path.join(RESOURCE_DIR, "valid_nodes.jsonl")
+    target = compress(filename, compression)
+    assert detect_compression(target) == compression
+    with open_input(target, threaded=threaded) as FH:
+        lines = FH.readlines()
+    assert lines == open(filename, "rb").readlines()
+
+
+def test_open_input_uncompressed():
+    """
+    Test reading an uncompressed file.
+    """
+    filename = os.path.join(RESOURCE_DIR, "valid_nodes.jsonl")
+    assert detect_compression(filename) is None
+    with open_input(filename, "gz") as FH:
+        assert FH.read() == open(filename, "rb").read()
+
+
+def test_open_input_close_early():
+    """
+    Test closing a compressed file before reading all of it.
+    """
+    filename = os.path.join(RESOURCE_DIR, "graph_edges.tsv")
+    target = compress(filename, "gz")
+    FH = open_input(target)
+    assert FH.readline().startswith(b"subject")
+    FH.close()
+    assert FH.closed
+
+
+@pytest.mark.parametrize("mode", ["w", "w:gz", "w:bz2"])
+def test_tar_stream_writer(mode):
+    """
+    Test writing a tar archive with TarStreamWriter.
+    """
+    filename = os.path.join(TARGET_DIR, f"test_stream.{mode.replace(':', '.')}")
+    archive = TarStreamWriter(filename, mode, stream_member="b.txt", threads=2)
+    a = archive.open("a.txt")
+    b = archive.open("b.txt")
+    for i in range(1000):
+        a.write(f"a{i}\n")
+        b.write(f"b{i}\n" * 10)
+    archive.close()
+
+    with tarfile.open(filename, mode.replace("w", "r")) as tar:
+        assert set(tar.getnames()) == {"a.txt", "b.txt"}
+        a_lines = tar.extractfile("a.txt").read().decode().splitlines()
+        b_lines = tar.extractfile("b.txt").read().decode().splitlines()
+    assert len(a_lines) == 1000
+    assert a_lines[-1] == "a999"
+    assert len(b_lines) == 10000
+    assert b_lines[-1] == "b999"
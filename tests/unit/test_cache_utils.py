@@ -0,0 +1,75 @@
+import os
+
+import pytest
+
+from kgx.utils.cache_utils import DiskCache
+
+
+@pytest.fixture
+def cache(tmp_path):
+    c = DiskCache(1, str(tmp_path))
+    # keep 10 entries in memory
+    c.entry_size = 1
+    c.memory = 40
+    c.capacity = c._capacity()
+    yield c
+    c.close()
+
+
+def test_disk_cache(cache):
+    """
+    Insert, update and remove entries of a DiskCache that spills to disk.
+    """
+    expected = {}
+    for i in range(100):
+        cache[f"n{i}"] = {"id": f"n{i}", "name": [str(i)]}
+        expected[f"n{i}"] = {"id": f"n{i}", "name": [str(i)]}
+    assert cache.spilled > 0
+    assert len(cache.hot) <= cache.capacity
+    assert len(cache) == 100
+
+    # values that are looked up are moved to memory, where changes are kept
+    for i in range(0, 100, 3):
+        cache[f"n{i}"]["name"].append("x")
+        expected[f"n{i}"]["name"].append("x")
+    cache["n1"] = {"id": "n1"}
+    expected["n1"] = {"id": "n1"}
+    assert cache.pop("n2") == expected.pop("n2")
+    del cache["n4"]
+    del expected["n4"]
+    with pytest.raises(KeyError):
+        del cache["n4"]
+
+    assert len(cache) == len(expected)
+    assert "n5" in cache
+    assert "n4" not in cache
+    assert cache.get("n4") is None
+    assert dict(cache.items()) == expected
+    assert sorted(cache) == sorted(expected)
+
+    cache.clear()
+    assert len(cache) == 0
+    assert dict(cache.items()) == {}
+
+
+def test_disk_cache_tuple_keys(cache):
+    """
+    Use tuples of strings as keys of a DiskCache.
+    """
+    for i in range(50):
+        cache[("a", f"b{i}", "c")] = {"subject": "a"}
+    assert cache.spilled > 0
+    assert ("a", "b0", "c") in cache
+    assert ("a", "b0") not in cache
+    assert sorted(k for k, _ in cache.items())[0] == ("a", "b0", "c")
+
+
+def test_disk_cache_close(tmp_path):
+    """
+    Close a DiskCache, which removes the database.
+    """
+    cache = DiskCache(1 << 20, str(tmp_path))
+    cache["x"] = 1
+    assert os.listdir(tmp_path)
+    cache.close()
+    assert not os.listdir(tmp_path)
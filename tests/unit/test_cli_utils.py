@@ -532,6 +532,33 @@ def test_transform1():
             break
 
 
+def test_transform_chunksize_engine():
+    """
+    Transform graph from TSV to JSON, reading the TSV with
+    a small chunk size and the pyarrow engine.
+    """
+    pytest.importorskip("pyarrow")
+    inputs = [
+        os.path.join(RESOURCE_DIR, "graph_nodes.tsv"),
+        os.path.join(RESOURCE_DIR, "graph_edges.tsv"),
+    ]
+    output = os.path.join(TARGET_DIR, "graph_pyarrow.json")
+    transform(
+        inputs=inputs,
+        input_format="tsv",
+        input_compression=None,
+        output=output,
+        output_format="json",
+        output_compression=None,
+        chunksize=100,
+        engine="pyarrow",
+    )
+    assert os.path.exists(output)
+    data = json.load(open(output, "r"))
+    assert len(data["nodes"]) == 512
+    assert len(data["edges"]) == 531
+
+
 def test_transform_knowledge_source_suppression():
     """
     Transform graph from TSV to JSON.
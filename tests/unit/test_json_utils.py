@@ -0,0 +1,166 @@
+import io
+
+import ijson
+import jsonlines
+import pytest
+
+from kgx.utils import json_utils
+from kgx.utils.json_utils import JsonlWriter, read_json_items, read_jsonl
+
+RECORDS = [
+    {"id": "HGNC:11603", "name": "TBX4", "category": ["biolink:Gene"]},
+    {"id": "MONDO:0017148", "name": "pulmonary hypertension é", "score": 0.5},
+    {"id": "CHEBI:15377", "count": 12345, "flag": True},
+]
+
+
+@pytest.fixture(params=[True, False], ids=["orjson", "json"])
+def codec(request, monkeypatch):
+    """
+    Run a test with and without orjson.
+    """
+    if request.param:
+        pytest.importorskip("orjson")
+    else:
+        monkeypatch.setattr(json_utils, "orjson", None)
+    return request.param
+
+
+def test_jsonl_round_trip(codec):
+    """
+    Write records with JsonlWriter and read them back with read_jsonl.
+    """
+    FH = io.BytesIO()
+    writer = JsonlWriter(FH, buffer_size=64)
+    writer.write(RECORDS[0])
+    writer.write_all(RECORDS[1:])
+    writer.flush()
+    data = FH.getvalue()
+    assert data.count(b"\n") == len(RECORDS)
+    assert list(read_jsonl(io.BytesIO(data), block_size=16)) == RECORDS
+    assert list(jsonlines.Reader(io.BytesIO(data))) == RECORDS
+
+
+def test_dumps_fallback(codec):
+    """
+    Serialize values that orjson does not support.
+    """
+    assert json_utils.dumps({"count": 12345678901234567890123}) == (
+        b'{"count": 12345678901234567890123}'
+    )
+
+
+def test_read_jsonl_blank_lines(codec):
+    """
+    Read JSON Lines with blank lines.
+    """
+    data = b'{"id": "A"}\n\n  \n{"id": "B"}\n'
+    assert list(read_jsonl(io.BytesIO(data))) == [{"id": "A"}, {"id": "B"}]
+
+
+def test_read_jsonl_invalid(codec):
+    """
+    Read JSON Lines with an invalid line.
+    """
+    data = b'{"id": "A"}\n{"id": \n'
+    with pytest.raises(jsonlines.InvalidLineError):
+        list(read_jsonl(io.BytesIO(data)))
+
+
+def test_read_json_items():
+    """
+    Read items of arrays at several prefixes from a JSON in a single pass.
+    """
+    graphs = [
+        {"id": "g1", "nodes": [{"id": "A"}, {"id": "B"}], "edges": [{"sub": "A"}]},
+        {"meta": {"nodes": [1]}, "nodes": [{"id": "C"}]},
+    ]
+    data = json_utils.dumps({"graphs": graphs, "nodes": [{"id": "X"}]})
+    prefixes = ["graphs.item.nodes.item", "graphs.item.edges.item"]
+    items = [
+        (prefix, item)
+        for prefix, batch in read_json_items(io.BytesIO(data), prefixes)
+        for item in batch
+    ]
+    assert items == [
+        ("graphs.item.nodes.item", {"id": "A"}),
+        ("graphs.item.nodes.item", {"id": "B"}),
+        ("graphs.item.edges.item", {"sub": "A"}),
+        ("graphs.item.nodes.item", {"id": "C"}),
+    ]
+
+
+def test_read_json_items_close():
+    """
+    Stop reading items before the end of a JSON.
+    """
+    data = json_utils.dumps({"nodes": [{"id": str(i)} for i in range(100000)]})
+    items = read_json_items(io.BytesIO(data), ["nodes.item"])
+    prefix, batch = next(items)
+    assert prefix == "nodes.item" and batch[0] == {"id": "0"}
+    items.close()
+
+
+def test_read_json_items_invalid():
+    """
+    Read items from an invalid JSON.
+    """
+    data = b'{"nodes": [{"id": "A"}, {"id": }]}'
+    with pytest.raises(ijson.JSONError):
+        list(read_json_items(io.BytesIO(data), ["nodes.item"]))
+
+
+def test_read_json_kv_items():
+    """
+    Read key-value pairs of objects, and items of arrays, at the
+    same prefixes from a JSON in a single pass.
+    """
+    nodes = {f"N:{i}": {"name": str(i)} for i in range(20000)}
+    data = json_utils.dumps(
+        {
+            "message": {
+                "knowledge_graph": {"nodes": nodes, "edges": [{"id": "e1"}]},
+                "results": [{"score": i} for i in range(20000)],
+            }
+        }
+    )
+    prefixes = ["message.knowledge_graph.nodes", "message.knowledge_graph.edges"]
+    items = [
+        (prefix, item)
+        for prefix, batch in read_json_items(
+            io.BytesIO(data), [f"{x}.item" for x in prefixes], prefixes
+        )
+        for item in batch
+    ]
+    assert items[:-1] == [("message.knowledge_graph.nodes", x) for x in nodes.items()]
+    assert items[-1] == ("message.knowledge_graph.edges.item", {"id": "e1"})
+
+
+def test_read_json_items_prune():
+    """
+    Read items from a JSON, where the values that are not read
+    are not kept in the document.
+    """
+    data = json_utils.dumps(
+        {"results": [{"score": [i]} for i in range(20000)], "nodes": [{"id": "A"}]}
+    )
+    sizes = []
+
+    class Probe(io.BytesIO):
+        reader = None
+
+        def read(self, size=-1):
+            if self.reader is not None and self.reader.root is not None:
+                sizes.append(len(self.reader.root.get("results", [])))
+            return super().read(size)
+
+    FH = Probe(data)
+    reader = json_utils.JsonItemReader(FH, ["nodes.item"])
+    FH.reader = reader
+    try:
+        assert reader.queue.get() == ("nodes.item", [{"id": "A"}])
+        assert reader.queue.get() is None
+    finally:
+        reader.close()
+    assert len(sizes) > 3
+    assert max(sizes) <= 1
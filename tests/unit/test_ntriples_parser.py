@@ -0,0 +1,138 @@
+import io
+import os
+
+import pytest
+from rdflib import BNode, Literal, URIRef
+from rdflib.plugins.parsers.ntriples import ParseError
+
+from kgx.parsers.ntriples_parser import (
+    CustomNTriplesParser,
+    FastNTriplesParser,
+    split_ntriples,
+)
+from tests import RESOURCE_DIR
+
+
+class TripleSink:
+    """
+    A sink that collects the triples from a parser.
+    """
+
+    def __init__(self):
+        self.triples = []
+
+    def triple(self, s, p, o):
+        self.triples.append((s, p, o))
+        yield None
+
+
+def terms(triples):
+    """
+    Get comparable terms, where blank nodes are numbered in order.
+    """
+    bnodes = {}
+
+    def term(t):
+        if isinstance(t, BNode):
+            return "_", bnodes.setdefault(t, len(bnodes))
+        return type(t), t, getattr(t, "datatype", None), getattr(t, "language", None)
+
+    return [tuple(term(t) for t in triple) for triple in triples]
+
+
+def parse(parser_class, data: bytes, **kwargs):
+    sink = TripleSink()
+    for _ in parser_class(sink, **kwargs).parse(io.BytesIO(data)):
+        pass
+    return sink.triples
+
+
+@pytest.mark.parametrize(
+    "filename", ["test1.nt", "test2.nt", "test3.nt", "oban-test.nt"]
+)
+def test_fast_ntriples_parser(filename):
+    """
+    Parse N-Triples with FastNTriplesParser, in blocks smaller than
+    the file, and compare the triples with CustomNTriplesParser.
+    """
+    data = open(os.path.join(RESOURCE_DIR, "rdf", filename), "rb").read()
+    expected = parse(CustomNTriplesParser, data)
+    assert expected
+    assert terms(parse(FastNTriplesParser, data, block_size=256)) == terms(expected)
+
+
+def test_fast_ntriples_parser_forms():
+    """
+    Parse N-Triples with escapes, language tags, datatypes, blank nodes,
+    comments and CRLF line endings with FastNTriplesParser.
+    """
+    lines = [
+        "# comment",
+        "",
+        '<http://a.org/x>\t<http://a.org/p>   "x\\u00e9 \\"q\\"" . # trailing',
+        '<http://a.org/x> <http://a.org/p> "a."@en-GB .',
+        '<http://a.org/x\\u0041> <http://a.org/p> "1"^^<http://www.w3.org/2001/XMLSchema#integer>.',
+        "_:b1 <http://a.org/p> _:b2 .",
+        '_:b2 <http://a.org/p> "line\\nbreak" .',
+    ]
+    data = "\r\n".join(lines).encode("utf-8")
+    triples = parse(FastNTriplesParser, data, block_size=16)
+    assert terms(triples) == terms(parse(CustomNTriplesParser, data))
+    assert len(triples) == 5
+    assert triples[0][2] == Literal('xé "q"')
+    assert triples[1][2] == Literal("a.", lang="en-GB")
+    assert triples[2][0] == URIRef("http://a.org/xA")
+    assert triples[2][2].toPython() == 1
+    assert triples[3][2] is triples[4][0]
+    assert triples[4][2] == Literal("line\nbreak")
+
+
+def test_fast_ntriples_parser_invalid():
+    """
+    Parse an invalid line with FastNTriplesParser.
+    """
+    data = b'<http://a.org/x> <http://a.org/p> "x" "y" .\n'
+    with pytest.raises(ParseError):
+        parse(FastNTriplesParser, data)
+
+
+def test_fast_ntriples_parser_bnode_prefix():
+    """
+    Parse blank nodes with a prefix, such that the same label
+    is the same blank node when parsed separately.
+    """
+    data = b"_:b1 <http://a.org/p> _:b2 .\n"
+    first = parse(FastNTriplesParser, data, bnode_prefix="Nx")
+    second = parse(FastNTriplesParser, data, bnode_prefix="Nx")
+    assert first == second
+    assert first[0][0] == BNode("Nxb1")
+
+
+@pytest.mark.parametrize("shards", [1, 2, 5, 50])
+def test_split_ntriples(tmp_path, shards):
+    """
+    Split N-Triples into byte ranges that cover the file, where
+    each range starts at a line with a different subject.
+    """
+    lines = []
+    for i in range(20):
+        lines.append("# comment")
+        for j in range(i % 4 + 1):
+            lines.append(f'<http://a.org/s{i}> <http://a.org/p> "{j}" .')
+    data = "\n".join(lines).encode("utf-8")
+    filename = str(tmp_path / "data.nt")
+    with open(filename, "wb") as FH:
+        FH.write(data)
+
+    ranges = split_ntriples(filename, shards)
+    assert 1 <= len(ranges) <= shards
+    assert ranges[0][0] == 0
+    assert ranges[-1][1] == len(data)
+    subjects = []
+    for (start, end), (next_start, _) in zip(ranges, ranges[1:] + [(len(data), 0)]):
+        assert start < end == next_start
+        triples = parse(FastNTriplesParser, data[start:end])
+        subjects.append({s for s, _, _ in triples})
+    for a, b in zip(subjects, subjects[1:]):
+        assert not a & b
+    assert sum(len(x) for x in subjects) == 20
@@ -1,9 +1,14 @@
 import os
 import pytest
-from rdflib import URIRef, Graph
+from rdflib import URIRef, Graph, RDFS
 
 from kgx.prefix_manager import PrefixManager
-from kgx.utils.rdf_utils import infer_category, process_predicate
+from kgx.utils.rdf_utils import (
+    infer_category,
+    process_predicate,
+    load_ontologies,
+    parse_ontology,
+)
 from tests import RESOURCE_DIR
 
 
@@ -94,3 +99,49 @@ def test_process_predicate(query):
     assert x[1] == query[2]
     assert x[2] == query[3]
     assert x[3] == query[4]
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_load_ontologies(tmp_path, workers):
+    """
+    Test loading of ontologies, which are parsed once into a cache.
+    """
+    cache_dir = str(tmp_path / "cache")
+    filename = str(tmp_path / "goslim_generic.owl")
+    with open(os.path.join(RESOURCE_DIR, "goslim_generic.owl"), "rb") as FH:
+        content = FH.read()
+    with open(filename, "wb") as FH:
+        FH.write(content)
+    graph = Graph()
+    graph.parse(filename)
+
+    triples = {}
+    for iri, batch in load_ontologies([filename, filename], workers, cache_dir):
+        assert iri == filename
+        triples.setdefault(iri, []).extend(batch)
+    assert len(triples[filename]) == 2 * len(graph)
+    labels = {
+        t for t in graph.triples((None, RDFS.label, None)) if isinstance(t[0], URIRef)
+    }
+    assert {
+        t for t in triples[filename] if t[1] == RDFS.label and isinstance(t[0], URIRef)
+    } == labels
+    [cached] = os.listdir(cache_dir)
+
+    # the parsed ontology is reused, until the file changes
+    assert parse_ontology(filename, cache_dir) == os.path.join(cache_dir, cached)
+    with open(filename, "ab") as FH:
+        FH.write(b"\n")
+    assert parse_ontology(filename, cache_dir) != os.path.join(cache_dir, cached)
+    assert len(os.listdir(cache_dir)) == 2
+
+
+def test_load_ontologies_without_cache():
+    """
+    Test loading of ontologies without a cache.
+    """
+    filename = os.path.join(RESOURCE_DIR, "goslim_generic.owl")
+    graph = Graph()
+    graph.parse(filename)
+    triples = [t for _, batch in load_ontologies([filename]) for t in batch]
+    assert len(triples) == len(graph)
@@ -1,7 +1,11 @@
 import json
 import os
 
+import pytest
+
 from kgx.sink import JsonSink
+from kgx.source import JsonSource
+from kgx.utils.archive_utils import open_input
 from tests import TARGET_DIR
 from tests.unit.test_sink import get_graph
 
@@ -34,3 +38,35 @@ def test_write_json2():
         s.write_edge(data)
     s.finalize()
     assert os.path.exists(f"{filename}.gz")
+
+
+@pytest.mark.parametrize("compression", [None, "gz", "bz2", "xz", "zst"])
+@pytest.mark.parametrize("pretty", [False, True])
+def test_write_json_compressed(compression, pretty):
+    """
+    Write a graph as a compressed, compact or indented JSON using JsonSink,
+    and read it back.
+    """
+    if compression == "zst":
+        pytest.importorskip("zstandard")
+    graph = get_graph()
+    filename = os.path.join(TARGET_DIR, f"test_graph3_{pretty}.json")
+    s = JsonSink(filename=filename, compression=compression, pretty=pretty)
+    s.write_nodes([data for n, data in graph.nodes(data=True)])
+    for u, v, k, data in graph.edges(data=True, keys=True):
+        s.write_edge(data)
+    s.finalize()
+    if compression:
+        filename = f"{filename}.{compression}"
+    with open_input(filename) as FH:
+        data = FH.read()
+    if pretty:
+        assert b'\n        {\n            "id": "A",' in data
+    else:
+        # one line for each record, and for the start and end of each array
+        assert len(data.splitlines()) == 6 + 6 + 3
+    obj = json.loads(data)
+    assert len(obj["nodes"]) == 6
+    assert len(obj["edges"]) == 6
+    records = [rec for rec in JsonSource().parse(filename) if rec]
+    assert len(records) == 12
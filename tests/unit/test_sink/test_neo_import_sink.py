@@ -0,0 +1,124 @@
+import csv
+import gzip
+import os
+
+from kgx.sink import NeoImportSink
+from tests import TARGET_DIR
+from tests.unit.test_sink import get_graph
+
+
+def read_csv(filename):
+    opener = gzip.open if filename.endswith(".gz") else open
+    with opener(filename, "rt", newline="") as f:
+        return list(csv.reader(f))
+
+
+def test_write_neo_import1():
+    """
+    Write a graph as CSVs for neo4j-admin import using NeoImportSink.
+    """
+    graph = get_graph()
+    filename = os.path.join(TARGET_DIR, "neo_import_graph1")
+    s = NeoImportSink(filename=filename, database="kgx")
+    for n, data in graph.nodes(data=True):
+        s.write_node(data)
+    for u, v, k, data in graph.edges(data=True, keys=True):
+        s.write_edge(data)
+    s.finalize()
+
+    assert s.node_files == [f"{filename}_nodes.csv"]
+    assert s.edge_files == [f"{filename}_edges.csv"]
+    nodes = read_csv(f"{filename}_nodes.csv")
+    edges = read_csv(f"{filename}_edges.csv")
+    assert nodes[0][:4] == ["id:ID", ":LABEL", "category:string[]", "name"]
+    assert len(nodes) == 7
+    assert nodes[1][:4] == ["A", "biolink:NamedThing", "biolink:NamedThing", "Node A"]
+    assert edges[0][:3] == [":START_ID", ":END_ID", ":TYPE"]
+    assert len(edges) == 7
+    assert ["B", "A", "biolink:sub_class_of"] in [x[:3] for x in edges]
+
+    assert s.command[:4] == ["neo4j-admin", "database", "import", "full"]
+    assert "--array-delimiter=|" in s.command
+    assert f"--nodes={filename}_nodes.csv" in s.command
+    assert f"--relationships={filename}_edges.csv" in s.command
+    assert s.command[-1] == "kgx"
+    script = open(f"{filename}_import.sh").read()
+    assert script.startswith("#!/bin/sh\n") and f"{filename}_edges.csv" in script
+
+
+def test_write_neo_import2():
+    """
+    Write nodes and edges with typed and new properties as compressed
+    CSVs for neo4j-admin import, where a CSV is started for each change
+    of columns.
+    """
+    filename = os.path.join(TARGET_DIR, "neo_import_graph2")
+    s = NeoImportSink(
+        filename=filename,
+        compression="gz",
+        node_properties={"id", "name", "category"},
+        edge_properties={"subject", "predicate", "object"},
+    )
+    s.write_node(
+        {
+            "id": "HGNC:11603",
+            "name": "TBX4",
+            "category": ["biolink:Gene", "biolink:NamedThing"],
+            "xref": ["NCBIGene:9496", "ENSEMBL:ENSG00000121075"],
+        }
+    )
+    s.write_node({"id": "MONDO:0005002", "name": "COPD", "category": "biolink:Disease"})
+    s.write_node({"id": "MONDO:0013238", "category": ["biolink:Disease"], "rank": 2})
+    s.write_node({"id": "MONDO:0013239", "category": ["biolink:Disease"], "rank": 2.5})
+    s.write_edge(
+        {
+            "subject": "HGNC:11603",
+            "predicate": "biolink:related_to",
+            "object": "MONDO:0005002",
+            "negated": False,
+            "publications": "PMID:1",
+        }
+    )
+    s.finalize()
+
+    assert s.node_files == [
+        f"{filename}_nodes.csv.gz",
+        f"{filename}_nodes_2.csv.gz",
+        f"{filename}_nodes_3.csv.gz",
+    ]
+    nodes = [read_csv(x) for x in s.node_files]
+    assert nodes[0] == [
+        ["id:ID", ":LABEL", "category:string[]", "name", "xref:string[]"],
+        [
+            "HGNC:11603",
+            "biolink:NamedThing|biolink:Gene",
+            "biolink:Gene|biolink:NamedThing",
+            "TBX4",
+            "NCBIGene:9496|ENSEMBL:ENSG00000121075",
+        ],
+        [
+            "MONDO:0005002",
+            "biolink:NamedThing|biolink:Disease",
+            "biolink:Disease",
+            "COPD",
+            "",
+        ],
+    ]
+    header = ["id:ID", ":LABEL", "category:string[]", "name", "xref:string[]"]
+    assert nodes[1][0] == header + ["rank:long"]
+    assert nodes[1][1][-1] == "2"
+    assert nodes[2][0] == header + ["rank:double"]
+    assert nodes[2][1][-1] == "2.5"
+
+    edges = read_csv(s.edge_files[0])
+    assert edges[0] == [
+        ":START_ID",
+        ":END_ID",
+        ":TYPE",
+        "subject",
+        "predicate",
+        "object",
+        "negated:boolean",
+        "publications:string[]",
+    ]
+    assert edges[1][-2:] == ["false", "PMID:1"]
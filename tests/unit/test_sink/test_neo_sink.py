@@ -1,11 +1,12 @@
-from time import sleep
+import threading
 
 import pytest
 from neo4jrestclient.client import GraphDatabase, Node, Relationship
 from neo4jrestclient.query import CypherException
 
-from kgx.sink import NeoSink
+from kgx.sink import NeoSink, neo_sink
 from tests import print_graph
+from tests.neo4j_stand_in import StandInError, TransientError
 from tests.unit import (
     clean_slate,
     DEFAULT_NEO4J_URL,
@@ -164,3 +165,142 @@ def test_write_neo3(clean_slate):
     )
     for edge in er:
         edges.append(edge)
+
+
+@pytest.mark.parametrize("workers", [1, 4])
+def test_write_bolt(neo4j_stand_in, workers):
+    """
+    Write nodes and edges over Bolt with concurrent workers, where all
+    the nodes are written before any edge.
+    """
+    # let other transactions run in between
+    neo4j_stand_in.latency = 0.001
+    s = NeoSink(
+        uri="bolt://localhost:7687",
+        username="neo4j",
+        password="test",
+        workers=workers,
+        batch_size=3,
+        cache_size=20,
+    )
+    for i in range(50):
+        s.write_node({"id": f"N:{i}", "category": ["biolink:NamedThing"]})
+    for i in range(49):
+        s.write_edge(
+            {
+                "subject": f"N:{i}",
+                "object": f"N:{i + 1}",
+                "predicate": "biolink:related_to",
+            }
+        )
+    s.finalize()
+    assert s.bolt_driver is None
+    assert len(neo4j_stand_in.nodes) == 50
+    assert len(neo4j_stand_in.edges) == 49
+
+    batches = [p for q, p in neo4j_stand_in.history if p]
+    nodes = [n["id"] for p in batches if "nodes" in p for n in p["nodes"]]
+    edges = [e["subject"] for p in batches if "edges" in p for e in p["edges"]]
+    assert sorted(nodes) == sorted(f"N:{i}" for i in range(50))
+    assert sorted(edges) == sorted(f"N:{i}" for i in range(49))
+    assert max(len(p.get("nodes", p.get("edges"))) for p in batches) == 3
+    # each edge is written after its subject and object
+    written = set()
+    for p in batches:
+        written.update(n["id"] for n in p.get("nodes", []))
+        for e in p.get("edges", []):
+            assert e["subject"] in written and e["object"] in written
+
+
+def test_write_bolt_retry(neo4j_stand_in, monkeypatch):
+    """
+    Retry transactions after transient errors over Bolt, and raise
+    other errors.
+    """
+    monkeypatch.setattr(neo_sink, "RETRY_DELAY", 0)
+    s = NeoSink(
+        uri="neo4j://localhost:7687", username="neo4j", password="test", workers=2
+    )
+    neo4j_stand_in.failure_rate = 1.0
+    s.write_node({"id": "N:1", "category": ["biolink:NamedThing"]})
+    with pytest.raises(TransientError):
+        s.finalize()
+    # the constraint and the batch are each retried up to max_retries times,
+    # and the error of the constraint is only logged
+    assert neo4j_stand_in.queries == 2 * (1 + neo_sink.MAX_RETRIES)
+    assert not neo4j_stand_in.nodes
+
+    neo4j_stand_in.failure_rate = 0.5
+    neo4j_stand_in.failures = 0
+    s.write_node({"id": "N:1", "category": ["biolink:NamedThing"]})
+    s.finalize()
+    assert neo4j_stand_in.failures > 0
+    assert [p["nodes"][0]["id"] for q, p in neo4j_stand_in.history] == ["N:1"]
+
+    neo4j_stand_in.failure_rate = 0.0
+    queries = neo4j_stand_in.queries
+    s.write_node({"id": "N:2", "category": ["biolink:NamedThing"], "x": {"y": 1}})
+    with pytest.raises(StandInError):
+        s.finalize()
+    assert neo4j_stand_in.queries == queries + 1
+
+
+def test_write_bolt_driver_thread(neo4j_stand_in, monkeypatch):
+    """
+    Create the Bolt driver on the thread that writes records, and not
+    on the threads of the workers, also after the sink is finalized.
+    """
+    threads = []
+    drivers = []
+
+    def get_bolt_driver(**kwargs):
+        threads.append(threading.current_thread())
+        drivers.append(neo4j_stand_in.bolt_driver())
+        return drivers[-1]
+
+    monkeypatch.setattr(neo_sink, "get_bolt_driver", get_bolt_driver)
+    s = NeoSink(
+        uri="bolt://localhost:7687",
+        username="neo4j",
+        password="test",
+        workers=4,
+        cache_size=1,
+    )
+    for _ in range(2):
+        for i in range(10):
+            s.write_node({"id": f"N:{i}", "category": ["biolink:NamedThing"]})
+        s.finalize()
+    assert threads == [threading.main_thread()] * 2
+    assert all(x.closed for x in drivers)
+    assert len(neo4j_stand_in.nodes) == 10
+
+
+def test_write_bolt_instances(neo4j_stand_in):
+    """
+    Write with several instances of NeoSink, which each have their own
+    cache, and create each constraint once, before its nodes are written.
+    """
+    s1 = NeoSink(uri="bolt://localhost:7687", username="neo4j", password="test")
+    s2 = NeoSink(
+        uri="bolt://localhost:7687",
+        username="neo4j",
+        password="test",
+        cache_memory=1,
+    )
+    s1.write_node({"id": "N:1", "category": ["biolink:Gene"]})
+    s2.write_node({"id": "N:2", "category": ["biolink:Gene", "biolink:NamedThing"]})
+    assert s1.node_count == 1 and s2.node_count == 1
+    assert list(s1.node_cache) == ["`biolink:Gene`"]
+    # the cache of s2 is written once it uses up its memory
+    s2.write_node({"id": "N:3", "category": ["biolink:Gene"]})
+    s2.write_node({"id": "N:4", "category": ["biolink:Gene"]})
+    s2.finalize()
+    s1.finalize()
+    assert s1.node_count == 0 and not s1.node_cache
+
+    gene = NeoSink.create_constraint_query("`biolink:Gene`")
+    named_thing = NeoSink.create_constraint_query("`biolink:NamedThing`")
+    writes = [p["nodes"][0]["id"] if p else q for q, p in neo4j_stand_in.history]
+    # the constraints that s1 creates already exist, which is logged
+    assert writes == [gene, named_thing, "N:2", "N:3", "N:4", "N:1"]
+    assert neo4j_stand_in.constraints == {"biolink:Gene", "biolink:NamedThing"}
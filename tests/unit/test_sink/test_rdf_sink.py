@@ -2,8 +2,10 @@ import os
 
 import pytest
 import rdflib
+from rdflib.plugins.serializers.nt import _quoteLiteral
 
 from kgx.sink import RdfSink
+from kgx.utils.archive_utils import open_input
 from tests import TARGET_DIR
 from tests.unit.test_sink import get_graph
 
@@ -48,6 +50,28 @@ def test_write_rdf2():
     assert len(lines) == 18
 
 
+def test_write_rdf_property_table():
+    """
+    Write nodes with RdfSink, where the predicates of properties are
+    resolved once, and resolved again when the mappings change.
+    """
+    filename = os.path.join(TARGET_DIR, "test_graph_property_table.nt")
+    s = RdfSink(filename=filename)
+    s.write_node({"id": "A:1", "name": "a", "custom_property": "x"})
+    assert set(s.node_property_table) == {"name", "custom_property"}
+    entry = s.node_property_table["custom_property"]
+    s.write_node({"id": "A:2", "name": "b", "custom_property": "y"})
+    assert s.node_property_table["custom_property"] is entry
+
+    s.set_reverse_predicate_mapping({"http://example.org/custom": "custom_property"})
+    s.write_node({"id": "A:3", "custom_property": "z"})
+    s.finalize()
+    assert s.node_property_table["custom_property"][0] == "<http://example.org/custom>"
+    lines = open(filename, "r").readlines()
+    assert len(lines) == 5
+    assert " <http://example.org/custom> " in lines[-1]
+
+
 def test_write_rdf3():
     """
     Write a graph as RDF N-Triples using RdfSink, where all edges are reified.
@@ -71,35 +95,56 @@ def test_write_rdf3():
 @pytest.mark.parametrize(
     "query",
     [
-        ("id", "uriorcurie", "MONDO:000001", "URIRef", None),
-        (
-            "name",
-            "xsd:string",
-            "Test concept name",
-            "Literal",
-            rdflib.term.URIRef("http://www.w3.org/2001/XMLSchema#string"),
-        ),
-        ("predicate", "uriorcurie", "biolink:related_to", "URIRef", None),
-        ("relation", "uriorcurie", "RO:000000", "URIRef", None),
-        ("custom_property1", "uriorcurie", "X:123", "URIRef", None),
-        (
-            "custom_property2",
-            "xsd:float",
-            "480.213",
-            "Literal",
-            rdflib.term.URIRef("http://www.w3.org/2001/XMLSchema#float"),
-        ),
+        ("uriorcurie", "MONDO:000001", "MONDO:000001"),
+        ("uriorcurie", "biolink:related_to", "biolink:related_to"),
+        ("uriorcurie", "http://example.org/x", "http://example.org/x"),
+        ("uriorcurie", "http://example.org/x y", None),
+        ("uriorcurie", "not a curie", None),
+        ("xsd:anyURI", 123, None),
+        ("xsd:string", "Test concept name", "xsd:string"),
+        ("xsd:string", 'a "quoted"\nline with \\ and é', "xsd:string"),
+        ("xsd:string", 123, "xsd:string"),
+        ("xsd:float", "480.213", "xsd:float"),
+        ("xsd:integer", 5, "xsd:integer"),
+        ("xsd:boolean", True, "xsd:boolean"),
+        ("biolink:CustomType", "x", "xsd:string"),
     ],
 )
-def test_prepare_object(query):
+def test_format_object(query):
     """
-    Test internal _prepare_object method.
+    Test that internal _format_object method formats IRIs, CURIEs and
+    typed literals as the N-Triples terms of rdflib.
     """
     sink = RdfSink(os.path.join(TARGET_DIR, "test_graph3.nt"))
-    o = sink._prepare_object(query[0], query[1], query[2])
-    assert type(o).__name__ == query[3]
-    if query[4]:
-        assert o.datatype == query[4]
+    prop_type, value, term = query
+    if term is None:
+        expected = _quoteLiteral(rdflib.Literal(value))
+    elif prop_type in {"uriorcurie", "xsd:anyURI"}:
+        expected = sink.uriref(term).n3()
+    else:
+        datatype = sink.prefix_manager.expand(term)
+        expected = _quoteLiteral(rdflib.Literal(value, datatype=datatype))
+    assert sink._format_object(prop_type, value) == expected
+
+
+@pytest.mark.parametrize("compression", ["gz", "bz2", "xz", "zst"])
+def test_write_rdf_compressed(compression):
+    """
+    Write a graph as compressed RDF N-Triples using RdfSink.
+    """
+    graph = get_graph()
+    filename = os.path.join(TARGET_DIR, f"test_graph_compressed.nt.{compression}")
+
+    s = RdfSink(filename=filename, compression=compression, buffer_size=256)
+    for n, data in graph.nodes(data=True):
+        s.write_node(data)
+    for u, v, k, data in graph.edges(data=True, keys=True):
+        s.write_edge(data)
+    s.finalize()
+
+    with open_input(filename) as FH:
+        lines = FH.read().decode("ascii").splitlines()
+    assert len(lines) == 18
 
 
 @pytest.mark.parametrize(
@@ -1,8 +1,13 @@
 import os
+import tarfile
+
+import pytest
 
 from kgx.graph.nx_graph import NxGraph
 from kgx.sink import TsvSink
+from kgx.utils.kgx_utils import archive_read_mode
 from tests import TARGET_DIR
+from tests.unit.test_sink import get_graph
 
 
 def test_write_tsv1():
@@ -117,3 +122,93 @@ def test_write_tsv2():
     s.finalize()
 
     assert os.path.exists(os.path.join(TARGET_DIR, "test_graph.tar.gz"))
+
+
+@pytest.mark.parametrize("compression", ["tar", "tar.gz", "tar.bz2"])
+def test_write_tsv_archive_streamed(compression):
+    """
+    Write a graph to a TSV archive using TsvSink, where rows are
+    streamed to the archive without writing TSV files first.
+    """
+    graph = get_graph()
+    basename = f"test_graph_streamed_{compression.replace('.', '_')}"
+    s = TsvSink(
+        filename=os.path.join(TARGET_DIR, basename),
+        format="tsv",
+        compression=compression,
+        node_properties={"id", "name"},
+        edge_properties={"subject", "predicate", "object"},
+        buffer_size=2,
+        compression_threads=2,
+    )
+    for n, data in graph.nodes(data=True):
+        s.write_node(data)
+    for u, v, k, data in graph.edges(data=True, keys=True):
+        s.write_edge(data)
+    s.finalize()
+
+    assert not os.path.exists(os.path.join(TARGET_DIR, f"{basename}_nodes.tsv"))
+    assert not os.path.exists(os.path.join(TARGET_DIR, f"{basename}_edges.tsv"))
+    filename = os.path.join(TARGET_DIR, f"{basename}.{compression}")
+    with tarfile.open(filename, mode=archive_read_mode[compression]) as tar:
+        # nodes come first, as when the archive is written from TSV files
+        assert tar.getnames() == [
+            f"{basename}_nodes.tsv",
+            f"{basename}_edges.tsv",
+        ]
+        nodes = tar.extractfile(f"{basename}_nodes.tsv").read().decode().splitlines()
+        edges = tar.extractfile(f"{basename}_edges.tsv").read().decode().splitlines()
+    assert nodes[0] == "id\tname"
+    assert nodes[1] == "A\tNode A"
+    assert len(nodes) == 7
+    assert edges[0] == "subject\tpredicate\tobject"
+    assert len(edges) == 7
+
+
+def test_write_tsv_batch():
+    """
+    Write a graph to a TSV file using the batch methods of TsvSink.
+    """
+    graph = get_graph()
+    s = TsvSink(
+        filename=os.path.join(TARGET_DIR, "test_graph_batch"),
+        format="tsv",
+        node_properties={"id", "name", "category"},
+        edge_properties={"subject", "predicate", "object"},
+    )
+    s.write_nodes([data for n, data in graph.nodes(data=True)])
+    s.write_edges([data for u, v, k, data in graph.edges(data=True, keys=True)])
+    s.finalize()
+
+    node_lines = open(os.path.join(TARGET_DIR, "test_graph_batch_nodes.tsv")).readlines()
+    edge_lines = open(os.path.join(TARGET_DIR, "test_graph_batch_edges.tsv")).readlines()
+    assert len(node_lines) == 7
+    assert len(edge_lines) == 7
+    assert node_lines[1].rstrip("\n").split("\t") == ["A", "biolink:NamedThing", "Node A"]
+
+
+def test_write_tsv_buffered():
+    """
+    Write a graph to a TSV file using TsvSink, where rows are
+    written to file once the buffer is full.
+    """
+    s = TsvSink(
+        filename=os.path.join(TARGET_DIR, "test_graph_buffered"),
+        format="tsv",
+        node_properties={"id", "name", "category", "xref"},
+        buffer_size=2,
+    )
+    s.write_node({"id": "A", "name": "Node\tA", "category": ["biolink:Gene", ""]})
+    assert len(s.node_buffer) == 1
+    s.write_node({"id": "B", "name": " ", "xref": ["X:1", "X:2"]})
+    assert len(s.node_buffer) == 0
+    s.write_node({"id": "C", "category": "biolink:Disease", "xref": []})
+    s.finalize()
+
+    lines = open(os.path.join(TARGET_DIR, "test_graph_buffered_nodes.tsv")).readlines()
+    assert [x.rstrip("\n").split("\t") for x in lines] == [
+        ["id", "category", "name", "xref"],
+        ["A", "biolink:Gene", "Node A", ""],
+        ["B", "", "", "X:1|X:2"],
+        ["C", "biolink:Disease", "", ""],
+    ]
@@ -1,7 +1,8 @@
+import json
 import os
 
 from kgx.source import JsonSource
-from tests import RESOURCE_DIR
+from tests import RESOURCE_DIR, TARGET_DIR
 
 
 def test_read_json1():
@@ -99,3 +100,20 @@ def test_read_json_compressed():
     assert e["object"] == "MONDO:0017148"
     assert e["predicate"] == "biolink:related_to"
     assert e["relation"] == "RO:0004013"
+
+
+def test_read_json_edges_first():
+    """
+    Read from a JSON where edges appear before nodes using JsonSource,
+    and check that nodes are yielded before edges.
+    """
+    data = json.load(open(os.path.join(RESOURCE_DIR, "valid.json")))
+    filename = os.path.join(TARGET_DIR, "valid_edges_first.json")
+    with open(filename, "w") as FH:
+        json.dump({"edges": data["edges"], "nodes": data["nodes"]}, FH)
+    s = JsonSource()
+    records = [rec for rec in s.parse(filename) if rec]
+    sizes = [len(rec) for rec in records]
+    assert sizes == sorted(sizes)
+    assert sizes.count(2) == len(data["nodes"])
+    assert sizes.count(4) == len(data["edges"])
@@ -1,7 +1,10 @@
 import os
 
+import pytest
+
 from kgx.source import JsonlSource
 from tests import RESOURCE_DIR
+from tests.unit.test_archive_utils import compress
 
 
 def test_read_jsonl1():
@@ -77,3 +80,15 @@ def test_read_jsonl2():
     assert e["predicate"] == "biolink:related_to"
     assert e["relation"] == "RO:0004013"
     assert "Test JSON" in e["knowledge_source"]
+
+
+@pytest.mark.parametrize("compression", ["gz", "bz2", "xz"])
+def test_read_jsonl_compressed(compression):
+    """
+    Read from compressed JSON Lines using JsonlSource, where
+    the compression is detected.
+    """
+    s = JsonlSource()
+    filename = compress(os.path.join(RESOURCE_DIR, "valid_nodes.jsonl"), compression)
+    nodes = [rec for rec in s.parse(filename) if rec]
+    assert len(nodes) == 6
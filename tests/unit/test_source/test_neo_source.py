@@ -1,7 +1,10 @@
+import threading
+
 import pytest
 from neo4jrestclient.client import GraphDatabase
 
-from kgx.source import NeoSource
+from kgx.sink import NeoSink
+from kgx.source import NeoSource, neo_source
 from tests.unit import (
     clean_slate,
     DEFAULT_NEO4J_URL,
@@ -66,3 +69,117 @@ def test_read_neo(clean_slate):
     assert e1["object"] == "C"
     assert e1["predicate"] == "biolink:related_to"
     assert e1["relation"] == "biolink:related_to"
+
+
+class FakeResults:
+    def __init__(self, rows):
+        self.rows = rows
+
+    def __len__(self):
+        return len(self.rows)
+
+
+class FakeGraphDatabase:
+    """
+    A stand-in for the driver of neo4jrestclient, with nodes and edges
+    that have gaps between their internal IDs.
+    """
+
+    nodes = {
+        i: {"id": f"N:{i}", "category": ["biolink:NamedThing"]}
+        for i in range(10)
+        if i not in {3, 4, 5}
+    }
+    edges = {i: (f"N:{i}", f"N:{i + 6}") for i in [0, 1, 2]}
+    queries = []
+    threads = set()
+
+    def __init__(self, url, username, password):
+        pass
+
+    def query(self, query, params=None, returns=None, data_contents=False):
+        FakeGraphDatabase.queries.append(query)
+        FakeGraphDatabase.threads.add(threading.get_ident())
+        if "max(id(n))" in query:
+            return [[max(self.nodes)]]
+        if "max(id(p))" in query:
+            return [[max(self.edges)]]
+        lower, upper = params["lower"], params["upper"]
+        if query.startswith("MATCH (n)"):
+            rows = [[dict(n)] for i, n in self.nodes.items() if lower <= i < upper]
+        else:
+            rows = [
+                [
+                    {"id": s, "category": ["biolink:NamedThing"]},
+                    {"predicate": "biolink:related_to"},
+                    {"id": o, "category": ["biolink:NamedThing"]},
+                ]
+                for i, (s, o) in self.edges.items()
+                if lower <= i < upper
+            ]
+        return FakeResults(rows)
+
+
+@pytest.mark.parametrize("workers", [1, 3])
+def test_read_neo_pages(monkeypatch, workers):
+    """
+    Read nodes and edges from Neo4j in pages of ranges of internal IDs,
+    which are fetched concurrently and are returned in order.
+    """
+    monkeypatch.setattr(neo_source, "GraphDatabase", FakeGraphDatabase)
+    FakeGraphDatabase.queries = []
+    FakeGraphDatabase.threads = set()
+    s = NeoSource()
+    records = list(
+        s.parse(
+            uri="http://localhost:7474",
+            username="neo4j",
+            password="test",
+            page_size=2,
+            workers=workers,
+        )
+    )
+    nodes = [r[0] for r in records if len(r) == 2]
+    edges = [(r[0], r[1]) for r in records if len(r) == 4]
+    assert nodes[:7] == ["N:0", "N:1", "N:2", "N:6", "N:7", "N:8", "N:9"]
+    assert edges == [("N:0", "N:6"), ("N:1", "N:7"), ("N:2", "N:8")]
+    assert not any("SKIP" in q for q in FakeGraphDatabase.queries)
+    pages = [q for q in FakeGraphDatabase.queries if "max" not in q]
+    assert all("range($lower, $upper - 1)" in q for q in pages)
+    # pages are fetched by workers, other than the main thread
+    assert (len(FakeGraphDatabase.threads) > 1) == (workers > 1)
+
+    pages = list(
+        s.get_pages(s.get_nodes, start=2, end=5, page_size=2, workers=workers, max_id=9)
+    )
+    assert [[n["id"] for n in p] for p in pages] == [["N:2"], ["N:6", "N:7"]]
+
+
+def test_read_neo_filters(neo4j_stand_in):
+    """
+    Read nodes and edges from a stand-in for Neo4j, with node and
+    edge filters.
+    """
+    sink = NeoSink(uri="http://localhost:7474", username="neo4j", password="test")
+    for i, category in enumerate(["biolink:Gene", "biolink:Disease", "biolink:Gene"]):
+        sink.write_node({"id": f"N:{i}", "category": [category], "provided_by": ["a"]})
+    for predicate in ["biolink:related_to", "biolink:treats"]:
+        sink.write_edge({"subject": "N:0", "predicate": predicate, "object": "N:1"})
+    sink.finalize()
+
+    s = NeoSource()
+    records = s.parse(
+        uri="http://localhost:7474",
+        username="neo4j",
+        password="test",
+        node_filters={"category": ["biolink:Gene"], "provided_by": ["a"]},
+        edge_filters={"predicate": ["biolink:treats"]},
+        page_size=2,
+    )
+    nodes, edges = process_stream(records)
+    assert sorted(nodes) == ["N:0", "N:1", "N:2"]
+    assert list(edges) == [("N:0", "N:1")]
+    assert [e["predicate"] for e in edges[("N:0", "N:1")]] == ["biolink:treats"]
+    # the nodes of edges are read along with the edges
+    assert [n["id"] for n in s.get_nodes(0, 3)] == ["N:0", "N:2"]
+    assert not s.get_nodes(3, 5)
@@ -3,6 +3,7 @@ import os
 import pytest
 
 from kgx.source import ObographSource
+from kgx.source.obograph_source import category_index
 from tests import RESOURCE_DIR
 
 
@@ -175,3 +176,34 @@ def test_get_category(query):
     s = ObographSource()
     c = s.get_category(node["id"], node)
     assert c == query[1]
+
+
+def test_get_category_index(monkeypatch):
+    """
+    Get the category of nodes from the index of OBO namespaces,
+    which is shared by instances of ObographSource.
+    """
+    s = ObographSource()
+    g = s.parse(os.path.join(RESOURCE_DIR, "goslim_generic.json"))
+    nodes = {rec[0]: rec[1] for rec in g if rec and len(rec) == 2}
+    assert nodes["GO:0003677"]["category"] == ["biolink:MolecularActivity"]
+    assert category_index["molecular_function"] == "biolink:MolecularActivity"
+
+    def lookup(*args, **kwargs):
+        raise AssertionError("category should be indexed")
+
+    s = ObographSource()
+    monkeypatch.setattr(s.toolkit, "get_element", lookup)
+    monkeypatch.setattr(s.toolkit, "get_element_by_mapping", lookup)
+    node = {
+        "id": "http://purl.obolibrary.org/obo/GO_0003677",
+        "meta": {
+            "basicPropertyValues": [
+                {"pred": s.HAS_OBO_NAMESPACE, "val": "molecular_function"}
+            ]
+        },
+    }
+    assert s.get_category("GO:0003677", node) == "biolink:MolecularActivity"
+    assert s.get_category("HP:0000001", {"id": "HP:0000001"}) == (
+        "biolink:PhenotypicFeature"
+    )
@@ -1,6 +1,11 @@
 import os
+from pathlib import Path
+
+import rdflib
+from rdflib import BNode, OWL, RDF, RDFS
 
 from kgx.source import OwlSource
+from kgx.source.owl_source import SpoolStore
 from tests import RESOURCE_DIR
 
 
@@ -198,3 +203,157 @@ def test_read_owl4():
         "logical_interpretation" in e2
         and e2["logical_interpretation"] == "owlstar:AllSomeInterpretation"
     )
+
+
+def test_read_owl_low_memory():
+    """
+    Read an OWL ontology using OwlSource, with the ontology spooled
+    to disk, and compare with reading it into an in-memory graph.
+    """
+    records = []
+    for low_memory in [False, True]:
+        s = OwlSource()
+        g = s.parse(
+            os.path.join(RESOURCE_DIR, "goslim_generic.owl"),
+            low_memory=low_memory,
+        )
+        nodes = {}
+        edges = set()
+        for rec in g:
+            if rec:
+                if len(rec) == 4:
+                    edges.add((rec[0], rec[1]))
+                else:
+                    nodes[rec[0]] = rec[1]
+        records.append((nodes, edges))
+
+    assert records[0][0].keys() == records[1][0].keys()
+    assert records[0][1] == records[1][1]
+    n1 = records[1][0]["GO:0008150"]
+    assert n1["name"] == "biological_process"
+    assert "synonym" in n1 and "biological process" in n1["synonym"]
+    assert ("GO:0031012", "GO:0005576") in records[1][1]
+
+
+def test_read_owl_uri():
+    """
+    Read an OWL ontology from a URI, which is passed to rdflib.
+    """
+    filename = os.path.join(RESOURCE_DIR, "goslim_generic.owl")
+    s = OwlSource()
+    nodes = {}
+    for rec in s.parse(Path(filename).as_uri()):
+        if rec and len(rec) == 2:
+            nodes[rec[0]] = rec[1]
+    assert nodes["GO:0008150"]["name"] == "biological_process"
+
+
+def test_spool_store():
+    """
+    Load an OWL ontology into a graph with a SpoolStore.
+    """
+    store = SpoolStore()
+    graph = rdflib.Graph(store=store)
+    graph.parse(os.path.join(RESOURCE_DIR, "goslim_generic.owl"), format="xml")
+    reference = rdflib.Graph()
+    reference.parse(os.path.join(RESOURCE_DIR, "goslim_generic.owl"), format="xml")
+    assert len(graph) == len(reference)
+
+    expected = {
+        (s, o)
+        for s, o in reference.subject_objects(RDFS.subClassOf)
+        if not isinstance(o, BNode)
+    }
+    assert {
+        (s, o)
+        for s, o in graph.subject_objects(RDFS.subClassOf)
+        if not isinstance(o, BNode)
+    } == expected
+    restrictions = [
+        o for o in graph.objects(None, RDFS.subClassOf) if isinstance(o, BNode)
+    ]
+    assert restrictions
+    for o in restrictions:
+        assert list(graph.objects(o, OWL.onProperty))
+    assert set(graph.subjects(RDF.type, OWL.ObjectProperty)) == set(
+        reference.subjects(RDF.type, OWL.ObjectProperty)
+    )
+    for relation in graph.subjects(RDF.type, OWL.ObjectProperty):
+        assert {
+            t
+            for t in graph.triples((relation, None, None))
+            if not isinstance(t[2], BNode)
+        } == {
+            t
+            for t in reference.triples((relation, None, None))
+            if not isinstance(t[2], BNode)
+        }
+    assert {
+        t for t in graph if not isinstance(t[0], BNode) and not isinstance(t[2], BNode)
+    } == {
+        t
+        for t in reference
+        if not isinstance(t[0], BNode) and not isinstance(t[2], BNode)
+    }
+    store.close()
+
+
+def test_read_owl_imports(tmp_path):
+    """
+    Read an OWL ontology with an import, which is parsed
+    once and loaded with the ontology, if asked for.
+    """
+    imported = tmp_path / "imported.owl"
+    imported.write_text(
+        """<?xml version="1.0"?>
+<rdf:RDF xmlns:rdf="http://www.w3.org/1999/02/22-rdf-syntax-ns#"
+    xmlns:rdfs="http://www.w3.org/2000/01/rdf-schema#"
+    xmlns:owl="http://www.w3.org/2002/07/owl#">
+    <owl:Class rdf:about="http://purl.obolibrary.org/obo/GO_0099999">
+        <rdfs:label>imported class</rdfs:label>
+        <rdfs:subClassOf rdf:resource="http://purl.obolibrary.org/obo/GO_0008150"/>
+    </owl:Class>
+</rdf:RDF>
+"""
+    )
+    ontology = tmp_path / "ontology.owl"
+    ontology.write_text(
+        f"""<?xml version="1.0"?>
+<rdf:RDF xmlns:rdf="http://www.w3.org/1999/02/22-rdf-syntax-ns#"
+    xmlns:rdfs="http://www.w3.org/2000/01/rdf-schema#"
+    xmlns:owl="http://www.w3.org/2002/07/owl#">
+    <owl:Ontology rdf:about="http://purl.obolibrary.org/obo/test.owl">
+        <owl:imports rdf:resource="{imported.as_uri()}"/>
+    </owl:Ontology>
+    <owl:Class rdf:about="http://purl.obolibrary.org/obo/GO_0008150">
+        <rdfs:label>biological_process</rdfs:label>
+    </owl:Class>
+</rdf:RDF>
+"""
+    )
+    cache_dir = tmp_path / "cache"
+    s = OwlSource()
+    nodes = {}
+    for rec in s.parse(str(ontology), import_cache_dir=str(cache_dir)):
+        if rec and len(rec) == 2:
+            nodes[rec[0]] = rec[1]
+    assert "GO:0099999" not in nodes
+    assert nodes["GO:0008150"]["name"] == "biological_process"
+    assert not cache_dir.exists()
+
+    for _ in range(2):
+        s = OwlSource()
+        nodes = {}
+        edges = {}
+        for rec in s.parse(
+            str(ontology), emit_imports=True, import_cache_dir=str(cache_dir)
+        ):
+            if rec:
+                if len(rec) == 4:
+                    edges[(rec[0], rec[1])] = rec[3]
+                else:
+                    nodes[rec[0]] = rec[1]
+        assert nodes["GO:0099999"]["name"] == "imported class"
+        assert nodes["GO:0008150"]["name"] == "biological_process"
+        assert edges["GO:0099999", "GO:0008150"]["predicate"] == "biolink:subclass_of"
+        assert len(os.listdir(cache_dir)) == 1
@@ -244,6 +244,59 @@ def test_read_nt5():
     assert e2["frequencyOfPhenotype"] == "HP:0040283"
 
 
+@pytest.mark.parametrize("filename", ["test3.nt", "oban-test.nt"])
+@pytest.mark.parametrize("cache_memory", [None, 1])
+def test_read_nt_parallel(tmp_path, monkeypatch, filename, cache_memory):
+    """
+    Parse subject-sorted N-Triples in parallel shards, with or without
+    a memory budget for the caches of the workers, and compare with
+    parsing in a single process.
+    """
+    monkeypatch.setattr("kgx.source.rdf_source.MIN_SHARD_SIZE", 1)
+    with open(os.path.join(RESOURCE_DIR, "rdf", filename)) as FH:
+        lines = sorted(x.rstrip("\n") + "\n" for x in FH if x.strip())
+    sorted_filename = str(tmp_path / filename)
+    with open(sorted_filename, "w") as FH:
+        FH.writelines(lines)
+
+    nodes, edges = process_stream(RdfSource().parse(sorted_filename))
+    cache_dir = tmp_path / "cache"
+    cache_dir.mkdir()
+    s = RdfSource()
+    parallel_nodes, parallel_edges = process_stream(
+        s.parse(
+            sorted_filename,
+            workers=3,
+            cache_memory=cache_memory,
+            cache_dir=str(cache_dir),
+        )
+    )
+    assert parallel_nodes == nodes
+    assert parallel_edges == edges
+    assert s.count == len(lines)
+    # the records that the workers spilled are removed
+    assert not os.listdir(cache_dir)
+
+
+@pytest.mark.parametrize("filename", ["test3.nt", "oban-test.nt"])
+def test_read_nt_disk_cache(tmp_path, filename):
+    """
+    Parse N-Triples with a memory budget for the caches, such that
+    nodes and edges are spilled to disk, and compare with parsing
+    with in-memory caches.
+    """
+    filename = os.path.join(RESOURCE_DIR, "rdf", filename)
+    nodes, edges = process_stream(RdfSource().parse(filename))
+    s = RdfSource()
+    cached_nodes, cached_edges = process_stream(
+        s.parse(filename, cache_memory=1, cache_dir=str(tmp_path))
+    )
+    assert cached_nodes == nodes
+    assert cached_edges == edges
+    assert s.node_cache == {}
+    assert not os.listdir(tmp_path)
+
+
 def test_read_nt6():
     prefix_map = {
         "HGNC": "https://www.genenames.org/data/gene-symbol-report/#!/hgnc_id/",
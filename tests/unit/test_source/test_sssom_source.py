@@ -1,5 +1,7 @@
 import os
 
+import pytest
+
 from kgx.source.sssom_source import SssomSource
 from tests import RESOURCE_DIR
 from tests.unit import process_stream
@@ -89,3 +91,80 @@ def test_load3():
         and e["license"] == "https://creativecommons.org/publicdomain/zero/1.0/"
     )
     assert "curie_map" not in e
+
+
+def test_load_pyarrow():
+    """
+    Read a SSSOM formatted file, using the pyarrow CSV engine.
+    """
+    pytest.importorskip("pyarrow")
+    source = SssomSource()
+    g = source.parse(
+        filename=os.path.join(RESOURCE_DIR, "sssom_example1.tsv"),
+        format="sssom",
+        engine="pyarrow",
+        chunksize=4,
+    )
+    nodes, edges = process_stream(g)
+    assert len(nodes.keys()) == 18
+    assert len(edges.keys()) == 9
+    assert edges["MP:0012051", "HP:0001257"][0]["confidence"] == "1.0"
+
+
+@pytest.mark.parametrize("chunksize", [2, 10000])
+def test_load_dedupe_nodes(tmp_path, chunksize):
+    """
+    Read a SSSOM formatted file where nodes are in several mappings,
+    in chunks of different sizes, and check that each node is read once.
+    """
+    filename = os.path.join(tmp_path, "mappings.tsv")
+    with open(filename, "w") as f:
+        f.write("#mapping_provider: https://example.org\n")
+        f.write("subject_id\tpredicate_id\tobject_id\tconfidence\n")
+        f.write("MP:1\towl:equivalentClass\tHP:1\t1.0\n")
+        f.write("MP:1\tskos:exactMatch\tHP:2\t0.5\n")
+        f.write("MP:2\tskos:exactMatch\tHP:1\t0.5\n")
+        f.write("MP:2\tskos:exactMatch\tHP:2\t0.5\n")
+    source = SssomSource()
+    g = source.parse(filename=filename, format="sssom", chunksize=chunksize)
+    node_ids = []
+    edges = []
+    for rec in g:
+        if rec is None:
+            continue
+        if len(rec) == 4:
+            edges.append(rec[3])
+        else:
+            node_ids.append(rec[0])
+    assert sorted(node_ids) == ["HP:1", "HP:2", "MP:1", "MP:2"]
+    assert len(edges) == 4
+    assert edges[0]["predicate"] == "biolink:same_as"
+    assert edges[1]["predicate"] == "biolink:exact_match"
+    assert edges[1]["confidence"] == "0.5"
+    assert edges[1]["knowledge_source"] == ["https://example.org"]
+
+
+def test_load_metadata_lists(tmp_path):
+    """
+    Read a SSSOM formatted file with list-valued metadata in headers,
+    and check that each edge has its own lists.
+    """
+    filename = os.path.join(tmp_path, "mappings.tsv")
+    with open(filename, "w") as f:
+        f.write("#mapping_provider: https://example.org\n")
+        f.write("#creator_id:\n")
+        f.write("#  - https://orcid.org/0000-0000-0000-0001\n")
+        f.write("#  - https://orcid.org/0000-0000-0000-0002\n")
+        f.write("subject_id\tpredicate_id\tobject_id\n")
+        f.write("MP:1\tskos:exactMatch\tHP:1\n")
+        f.write("MP:2\tskos:exactMatch\tHP:2\n")
+    source = SssomSource()
+    g = source.parse(filename=filename, format="sssom")
+    edges = [rec[3] for rec in g if rec is not None and len(rec) == 4]
+    assert len(edges) == 2
+    assert edges[0]["creator_id"] == [
+        "https://orcid.org/0000-0000-0000-0001",
+        "https://orcid.org/0000-0000-0000-0002",
+    ]
+    assert edges[0]["creator_id"] == edges[1]["creator_id"]
+    assert edges[0]["creator_id"] is not edges[1]["creator_id"]
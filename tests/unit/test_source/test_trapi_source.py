@@ -1,4 +1,8 @@
+import gzip
 import os
+import shutil
+
+import pytest
 
 from kgx.source import TrapiSource
 from tests import RESOURCE_DIR
@@ -67,3 +71,50 @@ def test_read_trapi_json2():
     assert e["object"] == "MONDO:0005002"
     assert e["predicate"] == "biolink:related_to"
     assert "Test TRAPI JSON" in e["knowledge_source"]
+
+
+@pytest.mark.parametrize("compressed", [False, True])
+def test_read_trapi_response(tmp_path, compressed):
+    """
+    Read from a TRAPI 1.x response, where nodes and edges are keyed
+    by their identifiers, using TrapiSource.
+    """
+    filename = os.path.join(RESOURCE_DIR, "trapi_response.json")
+    if compressed:
+        with open(filename, "rb") as f, gzip.open(
+            os.path.join(tmp_path, "trapi_response.json.gz"), "wb"
+        ) as out:
+            shutil.copyfileobj(f, out)
+        filename = os.path.join(tmp_path, "trapi_response.json.gz")
+    s = TrapiSource()
+    g = s.parse(filename, format="trapi-json", compression="gz" if compressed else None)
+    nodes = {}
+    edges = {}
+    for rec in g:
+        if rec:
+            if len(rec) == 4:
+                edges[(rec[0], rec[1])] = rec[3]
+            else:
+                nodes[rec[0]] = rec[1]
+
+    assert len(nodes.keys()) == 3
+    assert len(edges.keys()) == 2
+
+    n = nodes["HGNC:11603"]
+    assert n["id"] == "HGNC:11603"
+    assert n["name"] == "TBX4"
+    assert n["category"] == ["biolink:Gene"]
+    assert n["xref"] == ["NCBIGene:9496"]
+    assert n["symbol"] == "TBX4"
+    assert "attributes" not in n
+
+    e = edges["HGNC:11603", "MONDO:0005002"]
+    assert e["id"] == "e1"
+    assert e["predicate"] == "biolink:related_to"
+    assert e["primary_knowledge_source"] == "infores:hpo-annotations"
+    assert e["aggregator_knowledge_source"] == ["infores:monarchinitiative"]
+    assert e["publications"] == ["PMID:123"]
+
+    e = edges["HGNC:11603", "MONDO:0013238"]
+    assert e["id"] == "e2"
+    assert e["object_aspect_qualifier"] == "activity"
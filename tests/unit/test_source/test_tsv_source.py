@@ -5,6 +5,7 @@ import pytest
 
 from kgx.source import TsvSource
 from tests import RESOURCE_DIR
+from tests.unit.test_archive_utils import compress
 
 
 def test_read_tsv():
@@ -134,3 +135,75 @@ def test_read_tsv_tar_gz_compressed_inverted_file_order():
                 nodes.append(nodes)
     assert len(nodes) == 3
     assert len(edges) == 1
+
+
+def test_read_tsv_batch():
+    """
+    Read a TSV using TsvSource, where records are yielded in batches.
+    """
+    s = TsvSource()
+    g = s.parse(
+        filename=os.path.join(RESOURCE_DIR, "test_nodes.tsv"), format="tsv", batch=True
+    )
+    batches = list(g)
+    assert len(batches) == 1
+    assert isinstance(batches[0], list)
+    nodes = sorted(batches[0])
+    assert len(nodes) == 3
+    assert nodes[-1][0] == "CURIE:456"
+
+
+@pytest.mark.parametrize(
+    "node_filters,expected",
+    [
+        ({"category": {"biolink:Gene"}}, ["CURIE:123"]),
+        ({"category": {"biolink:Gene", "biolink:Disease"}}, ["CURIE:123", "CURIE:456"]),
+        ({"name": "Disease 456"}, ["CURIE:456"]),
+        ({"category": {"biolink:Protein"}}, []),
+    ],
+)
+def test_read_tsv_with_node_filters(node_filters, expected):
+    """
+    Read a TSV using TsvSource, where nodes are filtered on import.
+    """
+    s = TsvSource()
+    s.set_node_filters(node_filters)
+    g = s.parse(filename=os.path.join(RESOURCE_DIR, "test_nodes.tsv"), format="tsv")
+    nodes = sorted(n[0] for n in g)
+    assert nodes == expected
+
+
+@pytest.mark.parametrize("engine", ["c", "pyarrow"])
+def test_read_tsv_chunksize_engine(engine):
+    """
+    Read a TSV using TsvSource, with a small chunk size and
+    a specific parser engine.
+    """
+    if engine == "pyarrow":
+        pytest.importorskip("pyarrow")
+    s = TsvSource()
+    g = s.parse(
+        filename=os.path.join(RESOURCE_DIR, "graph_nodes.tsv"),
+        format="tsv",
+        chunksize=100,
+        engine=engine,
+        batch=True,
+    )
+    batches = list(g)
+    assert len(batches) == 6
+    nodes = {n[0]: n[1] for b in batches for n in b}
+    assert len(nodes) == 512
+    assert nodes["HGNC:10848"]["category"] == ["biolink:Gene"]
+    assert nodes["HGNC:10848"]["taxon"] == "NCBITaxon:9606"
+
+
+@pytest.mark.parametrize("compression", ["gz", "xz"])
+def test_read_tsv_compressed(compression):
+    """
+    Read a compressed TSV using TsvSource, where the compression is detected.
+    """
+    filename = compress(os.path.join(RESOURCE_DIR, "test_nodes.tsv"), compression)
+    s = TsvSource()
+    g = s.parse(filename=filename, format="tsv")
+    nodes = sorted(n[0] for n in g)
+    assert nodes == ["CURIE:000", "CURIE:123", "CURIE:456"]